@@ -0,0 +1,69 @@
+from app.domain.models.assignment_template_model import (
+    AssignmentTemplateExceptionModel,
+    AssignmentTemplateModel,
+)
+from app.domain.models.page_model import PageModel
+from datetime import date
+
+
+class AssignmentTemplateRepository:
+    def create_assignment_template(
+        self, assignment_template: AssignmentTemplateModel
+    ) -> AssignmentTemplateModel:
+        raise NotImplementedError(
+            "Method create_assignment_template hasn't been implemented yet."
+        )
+
+    def get_assignment_template(
+        self, template_id: int
+    ) -> AssignmentTemplateModel | None:
+        raise NotImplementedError(
+            "Method get_assignment_template hasn't been implemented yet."
+        )
+
+    def get_assignment_templates(
+        self, only_actives: bool, limit: int, cursor: str | None
+    ) -> PageModel:
+        raise NotImplementedError(
+            "Method get_assignment_templates hasn't been implemented yet."
+        )
+
+    def set_assignment_template_as_inactive(self, template_id: int) -> None:
+        raise NotImplementedError(
+            "Method set_assignment_template_as_inactive hasn't been implemented yet."
+        )
+
+    def get_assignment_templates_to_materialize(
+        self, materialize_until: date, after_id: int, limit: int
+    ) -> list[AssignmentTemplateModel]:
+        raise NotImplementedError(
+            "Method get_assignment_templates_to_materialize hasn't been implemented yet."
+        )
+
+    def get_assignment_template_exception_dates(
+        self, template_ids: list[int], from_date: date
+    ) -> dict[int, set[date]]:
+        raise NotImplementedError(
+            "Method get_assignment_template_exception_dates hasn't been implemented yet."
+        )
+
+    def create_assignment_template_exceptions(
+        self, exceptions: list[AssignmentTemplateExceptionModel]
+    ) -> None:
+        raise NotImplementedError(
+            "Method create_assignment_template_exceptions hasn't been implemented yet."
+        )
+
+    def delete_assignment_template_exception(
+        self, template_id: int, travel_date: date
+    ) -> bool:
+        raise NotImplementedError(
+            "Method delete_assignment_template_exception hasn't been implemented yet."
+        )
+
+    def set_materialized_until(
+        self, template_ids: list[int], materialized_until: date
+    ) -> None:
+        raise NotImplementedError(
+            "Method set_materialized_until hasn't been implemented yet."
+        )
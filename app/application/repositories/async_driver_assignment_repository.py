@@ -0,0 +1,147 @@
+from app.domain.models.day_occupancy_model import DayOccupancyModel
+from app.domain.models.driver_assignment import (
+    DriverAssignmentModel,
+    LocationModel,
+    DriverAssignmentIdModel,
+)
+from app.domain.models.page_model import PageModel
+from datetime import date
+
+
+class AsyncDriverAssignmentRepository:
+    async def assign_driver_to_vehicle(
+        self, driver_assignment: DriverAssignmentModel
+    ) -> DriverAssignmentModel | None:
+        raise NotImplementedError(
+            "Method assign_driver_to_vehicle hasn't been implemented yet."
+        )
+
+    async def get_driver_assignments(
+        self,
+        only_actives: bool,
+        travel_date: date | None,
+        limit: int,
+        cursor: str | None,
+        travel_date_from: date | None = None,
+        travel_date_to: date | None = None,
+        driver_id: int | None = None,
+        vehicle_id: int | None = None,
+    ) -> PageModel:
+        raise NotImplementedError(
+            "Method get_driver_assignments hasn't been implemented yet."
+        )
+
+    async def get_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> list[DriverAssignmentModel]:
+        raise NotImplementedError(
+            "Method get_driver_assignments_with_driver_id_or_vehicle_id_at_date hasn't been implemented yet."
+        )
+
+    async def get_driver_assignment(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> DriverAssignmentModel:
+        raise NotImplementedError(
+            "Method get_driver_assignment hasn't been implemented yet."
+        )
+
+    async def get_active_driver_assignment_by_destination_location_at_date(
+        self,
+        location: LocationModel,
+        travel_date: date,
+        exclude_assignment: DriverAssignmentIdModel | None,
+    ) -> DriverAssignmentModel:
+        raise NotImplementedError(
+            "Method get_driver_assignment_by_destination_location_at_date hasn't been implemented yet."
+        )
+
+    async def update_driver_assignment(
+        self, driver_assignment: DriverAssignmentModel
+    ) -> DriverAssignmentModel:
+        raise NotImplementedError(
+            "Method update_driver_assignment hasn't been implemented yet."
+        )
+
+    async def set_driver_assignment_as_inactive(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> None:
+        raise NotImplementedError(
+            "Method delete_driver_assignment hasn't been implemented yet."
+        )
+
+    async def get_all_assignments_for_driver(
+        self, driver_id: int, limit: int, cursor: str | None
+    ) -> PageModel:
+        raise NotImplementedError(
+            "Method get_all_assignments_for_driver hasn't been implemented yet."
+        )
+
+    async def get_all_assignments_for_vehicle(
+        self, vehicle_id: int, limit: int, cursor: str | None
+    ) -> PageModel:
+        raise NotImplementedError(
+            "Method get_all_assignments_for_vehicle hasn't been implemented yet."
+        )
+
+    async def get_number_of_today_assignments(self):
+        raise NotImplementedError(
+            "Method get_number_of_today_assigments hasn't been implemented yet."
+        )
+
+    async def get_occupancy_at_dates(
+        self, travel_dates: list[date]
+    ) -> dict[date, DayOccupancyModel]:
+        raise NotImplementedError(
+            "Method get_occupancy_at_dates hasn't been implemented yet."
+        )
+
+    async def get_existing_driver_and_vehicle_ids(
+        self, driver_ids: list[int], vehicle_ids: list[int]
+    ) -> tuple[set[int], set[int]]:
+        raise NotImplementedError(
+            "Method get_existing_driver_and_vehicle_ids hasn't been implemented yet."
+        )
+
+    async def create_driver_assignments(
+        self, driver_assignments: list[DriverAssignmentModel]
+    ) -> list[bool]:
+        raise NotImplementedError(
+            "Method create_driver_assignments hasn't been implemented yet."
+        )
+
+    async def is_driver_or_vehicle_taken_at_date(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> bool:
+        raise NotImplementedError(
+            "Method is_driver_or_vehicle_taken_at_date hasn't been implemented yet."
+        )
+
+    async def is_destination_taken_at_date(
+        self,
+        location: LocationModel,
+        travel_date: date,
+        exclude_assignment: DriverAssignmentIdModel | None = None,
+        radius_km: float = 0,
+    ) -> bool:
+        raise NotImplementedError(
+            "Method is_destination_taken_at_date hasn't been implemented yet."
+        )
+
+    async def get_driver_assignment_locations_in_geohash_cells(
+        self,
+        cells: list[str] | None,
+        by_origin: bool,
+        travel_date_from: date,
+        travel_date_to: date,
+        only_actives: bool = False,
+    ) -> list[tuple[DriverAssignmentIdModel, LocationModel]]:
+        raise NotImplementedError(
+            "Method get_driver_assignment_locations_in_geohash_cells hasn't been implemented yet."
+        )
+
+    async def get_driver_assignments_by_ids(
+        self, driver_assignment_ids: list[DriverAssignmentIdModel]
+    ) -> list[DriverAssignmentModel]:
+        raise NotImplementedError(
+            "Method get_driver_assignments_by_ids hasn't been implemented yet."
+        )
@@ -0,0 +1,46 @@
+from app.domain.models.driver_model import DriverModel
+from app.domain.models.page_model import PageModel
+
+
+class AsyncDriverRepository:
+    async def get_driver_by_driver_id(self, driver_id: int) -> DriverModel | None:
+        raise NotImplementedError(
+            "Method get_driver_by_driver_id hasn't been implemented yet."
+        )
+
+    async def get_driver_by_curp(self, curp: str) -> DriverModel | None:
+        raise NotImplementedError(
+            "Method get_driver_by_curp hasn't been implemented yet."
+        )
+
+    async def get_all_drivers(
+        self,
+        limit: int,
+        cursor: str | None,
+        name: str | None = None,
+        last_name: str | None = None,
+    ) -> PageModel:
+        raise NotImplementedError("Method get_all_drivers hasn't been implemented yet.")
+
+    async def save_driver(self, driver: DriverModel) -> DriverModel:
+        raise NotImplementedError("Method save_driver hasn't been implemented yet.")
+
+    async def delete_driver_by_driver_id(self, driver_id: int) -> None:
+        raise NotImplementedError(
+            "Method delete_driver_by_driver_id hasn't been implemented yet."
+        )
+
+    async def get_number_of_drivers(self):
+        raise NotImplementedError(
+            "Method get_number_of_drivers hasn't been implemented yet."
+        )
+
+    async def get_taken_driver_keys(
+        self, drivers: list[DriverModel]
+    ) -> dict[str, set[str]]:
+        raise NotImplementedError(
+            "Method get_taken_driver_keys hasn't been implemented yet."
+        )
+
+    async def create_drivers(self, drivers: list[DriverModel]) -> None:
+        raise NotImplementedError("Method create_drivers hasn't been implemented yet.")
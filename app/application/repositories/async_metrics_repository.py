@@ -0,0 +1,6 @@
+from app.domain.models.metrics_model import MetricsModel
+
+
+class AsyncMetricsRepository:
+    async def get_metrics(self) -> MetricsModel:
+        raise NotImplementedError("Method get_metrics hasn't been implemented yet.")
@@ -0,0 +1,56 @@
+from app.domain.models.page_model import PageModel
+from app.domain.models.vehicle_model import VehicleModel
+
+
+class AsyncVehicleRepository:
+    async def get_vehicle_by_id(self, id: int) -> VehicleModel | None:
+        raise NotImplementedError(
+            "Method get_vehicle_by_id hasn't been implemented yet."
+        )
+
+    async def get_vehicle_by_vin(self, vin: str) -> VehicleModel | None:
+        raise NotImplementedError(
+            "Method get_vehicle_by_vin hasn't been implemented yet."
+        )
+
+    async def get_vehicle_by_plate(self, plate: str) -> VehicleModel | None:
+        raise NotImplementedError(
+            "Method get_vehicle_by_plate hasn't been implemented yet."
+        )
+
+    async def get_vehicles(
+        self,
+        limit: int,
+        cursor: str | None,
+        brand: str | None = None,
+        model: str | None = None,
+    ) -> PageModel:
+        raise NotImplementedError("Method get_vehicles hasn't been implemented yet.")
+
+    async def remove_vehicle_by_id(self, id: int) -> str | None:
+        raise NotImplementedError(
+            "Method remove_vehicle_by_id hasn't been implemented yet."
+        )
+
+    async def update_vehicle(
+        self, vehicle_update: VehicleModel, id: int
+    ) -> VehicleModel | None:
+        raise NotImplementedError("Method update_vehicle hasn't been implemented yet.")
+
+    async def create_vehicle(self, vehicle: VehicleModel) -> VehicleModel | None:
+        raise NotImplementedError("Method create_vehicle hasn't been implemented yet.")
+
+    async def get_number_of_vehicles(self):
+        raise NotImplementedError(
+            "Method get_number_of_vehicles hasn't been implemented yet."
+        )
+
+    async def get_taken_vehicle_keys(
+        self, vehicles: list[VehicleModel]
+    ) -> dict[str, set[str]]:
+        raise NotImplementedError(
+            "Method get_taken_vehicle_keys hasn't been implemented yet."
+        )
+
+    async def create_vehicles(self, vehicles: list[VehicleModel]) -> None:
+        raise NotImplementedError("Method create_vehicles hasn't been implemented yet.")
@@ -1,4 +1,5 @@
 from app.domain.models.driver_model import DriverModel
+from app.domain.models.page_model import PageModel
 
 
 class DriverRepository:
@@ -12,7 +13,13 @@ class DriverRepository:
             "Method get_driver_by_curp hasn't been implemented yet."
         )
 
-    def get_all_drivers(self) -> list[DriverModel]:
+    def get_all_drivers(
+        self,
+        limit: int,
+        cursor: str | None,
+        name: str | None = None,
+        last_name: str | None = None,
+    ) -> PageModel:
         raise NotImplementedError("Method get_all_drivers hasn't been implemented yet.")
 
     def save_driver(self, driver: DriverModel) -> DriverModel:
@@ -27,3 +34,13 @@ class DriverRepository:
         raise NotImplementedError(
             "Method get_number_of_drivers hasn't been implemented yet."
         )
+
+    def get_taken_driver_keys(
+        self, drivers: list[DriverModel]
+    ) -> dict[str, set[str]]:
+        raise NotImplementedError(
+            "Method get_taken_driver_keys hasn't been implemented yet."
+        )
+
+    def create_drivers(self, drivers: list[DriverModel]) -> None:
+        raise NotImplementedError("Method create_drivers hasn't been implemented yet.")
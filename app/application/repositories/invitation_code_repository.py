@@ -12,6 +12,9 @@ class InvitationCodeRepository:
             "Method get_invitation_code_by_email hasn't been implemented yet."
         )
 
+    def is_email_in_use(self, email: str) -> bool:
+        raise NotImplementedError("Method is_email_in_use hasn't been implemented yet.")
+
     def get_invitation_code_by_code_and_email(
         self, code: str, email: str
     ) -> InvitationCodeModel | None:
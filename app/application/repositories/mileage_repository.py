@@ -0,0 +1,12 @@
+from datetime import date
+
+from app.domain.models.mileage_model import RouteColumnsModel
+
+
+class MileageRepository:
+    def get_active_route_columns(
+        self, date_ranges: list[tuple[date, date]]
+    ) -> RouteColumnsModel:
+        raise NotImplementedError(
+            "Method get_active_route_columns hasn't been implemented yet."
+        )
@@ -1,4 +1,4 @@
-from typing import List
+from app.domain.models.page_model import PageModel
 from app.domain.models.vehicle_model import VehicleModel
 
 
@@ -18,7 +18,13 @@ class VehicleRepository:
             "Method get_vehicle_by_plate hasn't been implemented yet."
         )
 
-    def get_vehicles(self) -> List[VehicleModel] | None:
+    def get_vehicles(
+        self,
+        limit: int,
+        cursor: str | None,
+        brand: str | None = None,
+        model: str | None = None,
+    ) -> PageModel:
         raise NotImplementedError("Method get_vehicles hasn't been implemented yet.")
 
     def remove_vehicle_by_id(self, id: int) -> str | None:
@@ -38,3 +44,13 @@ class VehicleRepository:
         raise NotImplementedError(
             "Method get_number_of_vehicles hasn't been implemented yet."
         )
+
+    def get_taken_vehicle_keys(
+        self, vehicles: list[VehicleModel]
+    ) -> dict[str, set[str]]:
+        raise NotImplementedError(
+            "Method get_taken_vehicle_keys hasn't been implemented yet."
+        )
+
+    def create_vehicles(self, vehicles: list[VehicleModel]) -> None:
+        raise NotImplementedError("Method create_vehicles hasn't been implemented yet.")
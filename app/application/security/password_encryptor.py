@@ -1,12 +1,15 @@
 class PasswordEncryptor:
-    @staticmethod
-    def get_password_hash(password: str) -> str:
+    async def get_password_hash(self, password: str) -> str:
         raise NotImplementedError(
             "Method get_password_hash hasn't been implemented yet."
         )
 
-    @staticmethod
-    def verify_password_hash(password: str, hashed_password: str) -> bool:
+    async def verify_password_hash(self, password: str, hashed_password: str) -> bool:
         raise NotImplementedError(
             "Method verify_password_hash hasn't been implemented yet."
         )
+
+    def password_hash_needs_update(self, hashed_password: str) -> bool:
+        raise NotImplementedError(
+            "Method password_hash_needs_update hasn't been implemented yet."
+        )
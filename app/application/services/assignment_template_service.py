@@ -0,0 +1,260 @@
+from datetime import date, datetime, time, timedelta
+from dateutil.rrule import rrule, rrulestr
+from loguru import logger
+
+from app.application.repositories.async_assignment_template_repository import (
+    AsyncAssignmentTemplateRepository,
+)
+from app.application.repositories.async_driver_assignment_repository import (
+    AsyncDriverAssignmentRepository,
+)
+from app.application.services.driver_assignment_service import (
+    DRIVER_ASSIGNMENT_EXISTS,
+    DriverAssignmentService,
+)
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
+from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from app.domain.models.assignment_template_model import (
+    AssignmentTemplateExceptionModel,
+    AssignmentTemplateModel,
+    MaterializationSummaryModel,
+)
+from app.domain.models.driver_assignment import DriverAssignmentModel
+from app.domain.models.import_result_model import IMPORT_CREATED
+from app.domain.models.page_model import PageModel
+
+RECURRENCE_FREQUENCIES = {"DAILY", "WEEKLY", "MONTHLY", "YEARLY"}
+
+
+def parse_recurrence_rule(recurrence_rule: str, start_date: date) -> rrule:
+    # Assignments are made per day, so a rule can't recur by the hour and always starts at
+    # the template's start date
+    rule = recurrence_rule.strip().upper().removeprefix("RRULE:")
+    parts = dict(part.split("=", 1) for part in rule.split(";") if "=" in part)
+    if parts.get("FREQ") not in RECURRENCE_FREQUENCIES or "DTSTART" in rule or "\n" in rule:
+        raise InvalidArgumentException(
+            "The recurrence rule must be a single RRULE with a DAILY, WEEKLY, MONTHLY or YEARLY frequency"
+        )
+    try:
+        return rrulestr(rule, dtstart=datetime.combine(start_date, time.min))
+    except (ValueError, TypeError) as e:
+        raise InvalidArgumentException(f"Invalid recurrence rule: {e}")
+
+
+def get_recurrence_dates(
+    assignment_template: AssignmentTemplateModel, date_from: date, date_to: date
+) -> list[date]:
+    if date_from > date_to:
+        return []
+    occurrences = parse_recurrence_rule(
+        assignment_template.recurrence_rule, assignment_template.start_date
+    ).between(
+        datetime.combine(date_from, time.min),
+        datetime.combine(date_to, time.max),
+        inc=True,
+    )
+    return sorted({occurrence.date() for occurrence in occurrences})
+
+
+class AssignmentTemplateService:
+    def __init__(
+        self,
+        assignment_template_repository: AsyncAssignmentTemplateRepository,
+        driver_assignment_repository: AsyncDriverAssignmentRepository,
+        destination_conflict_radius_km: float = 0,
+    ) -> None:
+        self.assignment_template_repository = assignment_template_repository
+        self.driver_assignment_repository = driver_assignment_repository
+        self.driver_assignment_service = DriverAssignmentService(
+            driver_assignment_repository, destination_conflict_radius_km
+        )
+
+    async def create_assignment_template(
+        self, assignment_template: AssignmentTemplateModel
+    ) -> AssignmentTemplateModel:
+        logger.debug("Method called: assignment_template_service.create_assignment_template()")
+        logger.debug("Params passed: {}", assignment_template.__dict__)
+        parse_recurrence_rule(
+            assignment_template.recurrence_rule, assignment_template.start_date
+        )
+        driver_ids, vehicle_ids = await self.driver_assignment_repository.get_existing_driver_and_vehicle_ids(
+            [assignment_template.driver_id], [assignment_template.vehicle_id]
+        )
+        if not driver_ids:
+            raise ResourceNotFoundException("Driver not found")
+        if not vehicle_ids:
+            raise ResourceNotFoundException("Vehicle not found")
+        return await self.assignment_template_repository.create_assignment_template(
+            assignment_template
+        )
+
+    async def get_assignment_template(self, template_id: int) -> AssignmentTemplateModel:
+        logger.debug("Method called: assignment_template_service.get_assignment_template()")
+        logger.debug("Params passed: {}", template_id)
+        if assignment_template := await self.assignment_template_repository.get_assignment_template(
+            template_id
+        ):
+            return assignment_template
+        raise ResourceNotFoundException("Assignment template not found")
+
+    async def get_assignment_templates(
+        self, only_actives: bool, limit: int, cursor: str | None = None
+    ) -> PageModel:
+        logger.debug("Method called: assignment_template_service.get_assignment_templates()")
+        logger.debug("Params passed: {}, {} and {}", only_actives, limit, cursor)
+        return await self.assignment_template_repository.get_assignment_templates(
+            only_actives, limit, cursor
+        )
+
+    async def set_assignment_template_as_inactive(self, template_id: int) -> None:
+        """Stops materializing the template. The assignments it already created are kept and
+        can be managed one by one."""
+        logger.debug("Method called: assignment_template_service.set_assignment_template_as_inactive()")
+        logger.debug("Params passed: {}", template_id)
+        if await self.get_assignment_template(template_id):
+            await self.assignment_template_repository.set_assignment_template_as_inactive(
+                template_id
+            )
+
+    async def add_assignment_template_exception(
+        self, template_id: int, travel_date: date, reason: str
+    ) -> AssignmentTemplateModel:
+        """Skips one occurrence of the template. When the occurrence was already materialized,
+        its assignment is set inactive."""
+        logger.debug("Method called: assignment_template_service.add_assignment_template_exception()")
+        logger.debug("Params passed: {}, {} and {}", template_id, travel_date, reason)
+        assignment_template = await self.get_assignment_template(template_id)
+        if travel_date < date.today():
+            raise InvalidArgumentException("Past occurrences can't be skipped")
+        if not get_recurrence_dates(assignment_template, travel_date, travel_date):
+            raise InvalidArgumentException("Assignment template doesn't recur at that date")
+        await self.assignment_template_repository.create_assignment_template_exceptions(
+            [AssignmentTemplateExceptionModel(template_id, travel_date, reason)]
+        )
+        if (
+            assignment_template.materialized_until
+            and travel_date <= assignment_template.materialized_until
+        ):
+            await self.driver_assignment_repository.set_driver_assignment_as_inactive(
+                assignment_template.driver_id, assignment_template.vehicle_id, travel_date
+            )
+        return await self.get_assignment_template(template_id)
+
+    async def remove_assignment_template_exception(
+        self, template_id: int, travel_date: date
+    ) -> AssignmentTemplateModel:
+        """Lets the next materialization create the occurrence again, e.g. to retry a date
+        that was recorded as a conflict. An assignment set inactive by a skip stays inactive."""
+        logger.debug("Method called: assignment_template_service.remove_assignment_template_exception()")
+        logger.debug("Params passed: {} and {}", template_id, travel_date)
+        assignment_template = await self.get_assignment_template(template_id)
+        if not await self.assignment_template_repository.delete_assignment_template_exception(
+            template_id, travel_date
+        ):
+            raise ResourceNotFoundException("Assignment template exception not found")
+        if (
+            assignment_template.materialized_until
+            and date.today() <= travel_date <= assignment_template.materialized_until
+        ):
+            await self.assignment_template_repository.set_materialized_until(
+                [template_id], travel_date - timedelta(days=1)
+            )
+        return await self.get_assignment_template(template_id)
+
+    def build_driver_assignment(
+        self, assignment_template: AssignmentTemplateModel, travel_date: date
+    ) -> DriverAssignmentModel:
+        return DriverAssignmentModel(
+            driver_id=assignment_template.driver_id,
+            vehicle_id=assignment_template.vehicle_id,
+            travel_date=travel_date,
+            route_name=assignment_template.route_name,
+            origin_location=assignment_template.origin_location,
+            destination_location=assignment_template.destination_location,
+            comments=assignment_template.comments,
+        )
+
+    async def materialize_assignment_templates(
+        self, today: date, horizon_days: int, batch_size: int, after_id: int = 0
+    ) -> MaterializationSummaryModel:
+        """Creates the assignments of the next `batch_size` active templates, after the one
+        with id `after_id`, from `today` up to `horizon_days` ahead. Every occurrence of the
+        batch goes through a single `assign_schedule`, and the ones refused are recorded as
+        exceptions of their template so later runs don't retry them. An assignment that
+        already exists for the occurrence is left as it is."""
+        logger.debug("Method called: assignment_template_service.materialize_assignment_templates()")
+        logger.debug("Params passed: {}, {}, {} and {}", today, horizon_days, batch_size, after_id)
+        materialize_until = today + timedelta(days=horizon_days)
+        assignment_templates = await self.assignment_template_repository.get_assignment_templates_to_materialize(
+            materialize_until, after_id, batch_size
+        )
+        summary = MaterializationSummaryModel(templates=len(assignment_templates))
+        if not assignment_templates:
+            return summary
+        summary.last_template_id = assignment_templates[-1].id
+        template_ids = [assignment_template.id for assignment_template in assignment_templates]
+        exception_dates = await self.assignment_template_repository.get_assignment_template_exception_dates(
+            template_ids, today
+        )
+        occurrences = []
+        for assignment_template in assignment_templates:
+            date_from = max(assignment_template.start_date, today)
+            if assignment_template.materialized_until:
+                date_from = max(
+                    date_from, assignment_template.materialized_until + timedelta(days=1)
+                )
+            occurrences.extend(
+                (assignment_template, travel_date)
+                for travel_date in get_recurrence_dates(
+                    assignment_template, date_from, materialize_until
+                )
+                if travel_date not in exception_dates[assignment_template.id]
+            )
+        results = await self.driver_assignment_service.assign_schedule(
+            [
+                self.build_driver_assignment(assignment_template, travel_date)
+                for assignment_template, travel_date in occurrences
+            ]
+        )
+        exceptions = []
+        for result in results:
+            assignment_template, travel_date = occurrences[result.number - 1]
+            if result.status == IMPORT_CREATED:
+                summary.created += 1
+            elif result.detail != DRIVER_ASSIGNMENT_EXISTS:
+                exceptions.append(
+                    AssignmentTemplateExceptionModel(
+                        assignment_template.id, travel_date, result.detail
+                    )
+                )
+        summary.exceptions = await self.create_assignment_template_exceptions(exceptions)
+        await self.assignment_template_repository.set_materialized_until(
+            template_ids, materialize_until
+        )
+        return summary
+
+    async def create_assignment_template_exceptions(
+        self, exceptions: list[AssignmentTemplateExceptionModel]
+    ) -> int:
+        if not exceptions:
+            return 0
+        try:
+            await self.assignment_template_repository.create_assignment_template_exceptions(
+                exceptions
+            )
+            return len(exceptions)
+        except ConflictWithExistingResourceException:
+            # A date was skipped while the batch was materialized; the skip is kept
+            created = 0
+            for exception in exceptions:
+                try:
+                    await self.assignment_template_repository.create_assignment_template_exceptions(
+                        [exception]
+                    )
+                    created += 1
+                except ConflictWithExistingResourceException:
+                    pass
+            return created
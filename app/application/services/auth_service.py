@@ -1,9 +1,9 @@
 from loguru import logger
 
-from app.application.repositories.invitation_code_repository import (
-    InvitationCodeRepository,
+from app.application.repositories.async_invitation_code_repository import (
+    AsyncInvitationCodeRepository,
 )
-from app.application.repositories.user_repository import UserRepository
+from app.application.repositories.async_user_repository import AsyncUserRepository
 from app.application.security.password_encryptor import PasswordEncryptor
 from app.domain.exceptions.conflict_with_existing_resource_exception import (
     ConflictWithExistingResourceException,
@@ -18,30 +18,35 @@ from app.domain.models.user_model import UserModel
 class AuthService:
     def __init__(
         self,
-        invitation_code_repository: InvitationCodeRepository,
+        invitation_code_repository: AsyncInvitationCodeRepository,
         password_encryptor: PasswordEncryptor,
-        user_repository: UserRepository,
+        user_repository: AsyncUserRepository,
     ) -> None:
         self.invitation_code_repository = invitation_code_repository
         self.password_encryptor = password_encryptor
         self.user_repository = user_repository
 
-    def login(self, email: str, password: str) -> UserModel:
+    async def login(self, email: str, password: str) -> UserModel:
         logger.debug("Method called: auth_service.login()")
-        logger.debug(f"Params passed: {email}, {password}")
-        user = self.user_repository.get_user_by_email(email)
-        if not user or not self.password_encryptor.verify_password_hash(
+        logger.debug("Params passed: {}", email)
+        user = await self.user_repository.get_user_by_email(email)
+        if not user or not await self.password_encryptor.verify_password_hash(
             password, user.password
         ):
             raise InvalidCredentialsException
 
+        if self.password_encryptor.password_hash_needs_update(user.password):
+            logger.info(f"Rehashing password of user {user.id} with the current cost")
+            user.password = await self.password_encryptor.get_password_hash(password)
+            user = await self.user_repository.save_user(user)
+
         return user
 
-    def signup(self, candidate: CandidateModel) -> UserModel:
+    async def signup(self, candidate: CandidateModel) -> UserModel:
         logger.debug("Method called: auth_service.signup()")
-        logger.debug(f"Params passed: {candidate.__dict__}")
+        logger.debug("Params passed: {}", candidate.email)
         invitation_code = (
-            self.invitation_code_repository.get_invitation_code_by_code_and_email(
+            await self.invitation_code_repository.get_invitation_code_by_code_and_email(
                 code=candidate.invitation_code, email=candidate.email
             )
         )
@@ -49,20 +54,22 @@ class AuthService:
         if not invitation_code:
             raise InvalidCredentialsException
 
-        if self.user_repository.get_user_by_email(candidate.email):
+        if await self.user_repository.get_user_by_email(candidate.email):
             raise ConflictWithExistingResourceException
 
-        registered_user = self.user_repository.save_user(
+        registered_user = await self.user_repository.save_user(
             UserModel(
                 id=None,
                 email=candidate.email,
                 last_name=candidate.last_name,
                 name=candidate.name,
-                password=self.password_encryptor.get_password_hash(candidate.password),
+                password=await self.password_encryptor.get_password_hash(
+                    candidate.password
+                ),
             )
         )
 
-        self.invitation_code_repository.delete_invitation_code_by_code(
+        await self.invitation_code_repository.delete_invitation_code_by_code(
             candidate.invitation_code
         )
 
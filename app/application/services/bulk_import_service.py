@@ -0,0 +1,120 @@
+from typing import AsyncIterator, Awaitable, Callable
+from loguru import logger
+
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
+from app.domain.models.import_result_model import (
+    IMPORT_CONFLICT,
+    IMPORT_CREATED,
+    IMPORT_INVALID,
+    ImportResultModel,
+)
+from app.domain.models.import_row_model import ImportRowModel
+
+
+class BulkImportService:
+    """Imports rows in batches of `batch_size`. The unique `key_names` of every row are checked
+    against the rows before it in memory and against the database with a single lookup per
+    batch, and the rows left are inserted together."""
+
+    def __init__(
+        self,
+        key_names: tuple[str, ...],
+        get_taken_keys: Callable[[list], Awaitable[dict[str, set]]],
+        create_all: Callable[[list], Awaitable[None]],
+        batch_size: int,
+        prepare_item: Callable[[object], Awaitable[object]] | None = None,
+    ) -> None:
+        self.key_names = key_names
+        self.get_taken_keys = get_taken_keys
+        self.create_all = create_all
+        self.batch_size = batch_size
+        self.prepare_item = prepare_item
+
+    async def import_rows(
+        self, rows: AsyncIterator[ImportRowModel]
+    ) -> list[ImportResultModel]:
+        logger.debug("Method called: bulk_import_service.import_rows()")
+        results = []
+        seen_keys = {key_name: {} for key_name in self.key_names}
+        batch = []
+        async for row in rows:
+            if row.error:
+                results.append(ImportResultModel(row.number, IMPORT_INVALID, row.error))
+                continue
+            if detail := self.find_repeated_key(row, seen_keys):
+                results.append(ImportResultModel(row.number, IMPORT_CONFLICT, detail))
+                continue
+            if self.prepare_item:
+                try:
+                    row.item = await self.prepare_item(row.item)
+                except InvalidArgumentException as e:
+                    results.append(ImportResultModel(row.number, IMPORT_INVALID, str(e)))
+                    continue
+            for key_name in self.key_names:
+                seen_keys[key_name][getattr(row.item, key_name)] = row.number
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                results.extend(await self.import_batch(batch))
+                batch = []
+        if batch:
+            results.extend(await self.import_batch(batch))
+        results.sort(key=lambda result: result.number)
+        return results
+
+    def find_repeated_key(self, row: ImportRowModel, seen_keys: dict) -> str | None:
+        for key_name in self.key_names:
+            if repeated_in := seen_keys[key_name].get(getattr(row.item, key_name)):
+                return f"The {key_name} is repeated in row {repeated_in}"
+        return None
+
+    async def import_batch(self, batch: list[ImportRowModel]) -> list[ImportResultModel]:
+        logger.debug("Method called: bulk_import_service.import_batch()")
+        logger.debug("Params passed: {} rows", len(batch))
+        results = []
+        taken_keys = await self.get_taken_keys([row.item for row in batch])
+        new_rows = []
+        for row in batch:
+            taken_key_name = next(
+                (
+                    key_name
+                    for key_name in self.key_names
+                    if getattr(row.item, key_name) in taken_keys[key_name]
+                ),
+                None,
+            )
+            if taken_key_name:
+                results.append(
+                    ImportResultModel(
+                        row.number,
+                        IMPORT_CONFLICT,
+                        f"The {taken_key_name} is already registered",
+                    )
+                )
+            else:
+                new_rows.append(row)
+        if not new_rows:
+            return results
+        try:
+            await self.create_all([row.item for row in new_rows])
+        except ConflictWithExistingResourceException:
+            # Another request registered some of the keys after the lookup, so the batch is
+            # retried one row at a time to find out which ones
+            for row in new_rows:
+                try:
+                    await self.create_all([row.item])
+                except ConflictWithExistingResourceException:
+                    results.append(
+                        ImportResultModel(
+                            row.number,
+                            IMPORT_CONFLICT,
+                            f"The {' or '.join(self.key_names)} is already registered",
+                        )
+                    )
+                else:
+                    results.append(ImportResultModel(row.number, IMPORT_CREATED))
+            return results
+        results.extend(ImportResultModel(row.number, IMPORT_CREATED) for row in new_rows)
+        return results
@@ -1,36 +1,57 @@
 from datetime import date
-from app.application.repositories.driver_assingment_repository import (
-    DriverAssignmentRepository,
+from app.application.repositories.async_driver_assignment_repository import (
+    AsyncDriverAssignmentRepository,
 )
 from app.domain.exceptions.conflict_with_existing_resource_exception import (
     ConflictWithExistingResourceException,
 )
 from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from app.domain.models.day_occupancy_model import DayOccupancyModel
 from app.domain.models.driver_assignment import (
     DriverAssignmentModel,
     DriverAssignmentIdModel,
     LocationModel,
+    NearbyDriverAssignmentModel,
 )
+from app.domain.models.geo_location import get_distance_km, get_geohash_cells_around
+from app.domain.models.import_result_model import (
+    IMPORT_CONFLICT,
+    IMPORT_CREATED,
+    IMPORT_INVALID,
+    ImportResultModel,
+)
+from app.domain.models.page_model import PageModel
 from loguru import logger
 
+DRIVER_ASSIGNMENT_EXISTS = (
+    "Driver assignment for the driver and vehicle already exists at the same day"
+)
+DRIVER_ASSIGNMENT_TAKEN = "Driver assignment driver, vehicle or route is already taken by another driver assignment at the same day"
+
 
 class DriverAssignmentService:
     def __init__(
-        self, driver_assignment_repository: DriverAssignmentRepository
+        self,
+        driver_assignment_repository: AsyncDriverAssignmentRepository,
+        destination_conflict_radius_km: float = 0,
+        nearby_max_range_days: int = 1,
     ) -> None:
         self.driver_assignment_repository = driver_assignment_repository
+        # Destinations closer than this to the one of another active assignment of the day
+        # are taken too; 0 only treats the exact same coordinates as taken
+        self.destination_conflict_radius_km = destination_conflict_radius_km
+        self.nearby_max_range_days = nearby_max_range_days
 
-    def is_driver_assignment_location_taken_at_date(
+    async def is_driver_assignment_location_taken_at_date(
         self,
         location: LocationModel,
         travel_date: date,
         exclude_assignment: DriverAssignmentIdModel | None = None,
     ) -> bool:
-        assignment = self.driver_assignment_repository.get_active_driver_assignment_by_destination_location_at_date(
-            location, travel_date, exclude_assignment
+        return await self.driver_assignment_repository.is_destination_taken_at_date(
+            location, travel_date, exclude_assignment, self.destination_conflict_radius_km
         )
-        return assignment is not None
 
     def is_driver_assignment_editable(
         self, driver_assignment: DriverAssignmentModel
@@ -41,12 +62,25 @@ class DriverAssignmentService:
         else:
             return driver_assignment.completed_successfully
 
-    def assign_driver_to_vehicle(
+    async def assign_driver_to_vehicle(
         self, driver_assignment: DriverAssignmentModel
     ) -> DriverAssignmentModel:
         logger.debug("Method called: driver_assignment_service.assign_driver_to_vehicle()")
-        logger.debug(f"Params passed: {driver_assignment.__dict__}")
-        if self.driver_assignment_repository.get_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+        logger.debug("Params passed: {}", driver_assignment.__dict__)
+        # The insert only refuses the exact same destination, so nearby ones are checked first
+        if self.destination_conflict_radius_km and await self.is_driver_assignment_location_taken_at_date(
+            driver_assignment.destination_location, driver_assignment.travel_date
+        ):
+            raise ConflictWithExistingResourceException(
+                "Driver assignment route is already taken by another driver assignment at the same day"
+            )
+        if created_driver_assignment := await self.driver_assignment_repository.assign_driver_to_vehicle(
+            driver_assignment
+        ):
+            return created_driver_assignment
+        # The insert checks all of this itself; these lookups only run once it was refused,
+        # to tell the caller why
+        if await self.driver_assignment_repository.is_driver_or_vehicle_taken_at_date(
             driver_assignment.driver_id,
             driver_assignment.vehicle_id,
             driver_assignment.travel_date,
@@ -54,50 +88,245 @@ class DriverAssignmentService:
             raise ConflictWithExistingResourceException(
                 "Driver assignment vehicle is already taken by another driver assignment at the same day"
             )
-        if self.is_driver_assignment_location_taken_at_date(
+        if await self.is_driver_assignment_location_taken_at_date(
             driver_assignment.destination_location, driver_assignment.travel_date
         ):
             raise ConflictWithExistingResourceException(
                 "Driver assignment route is already taken by another driver assignment at the same day"
             )
-        return self.driver_assignment_repository.assign_driver_to_vehicle(
-            driver_assignment
+        driver_ids, vehicle_ids = await self.driver_assignment_repository.get_existing_driver_and_vehicle_ids(
+            [driver_assignment.driver_id], [driver_assignment.vehicle_id]
         )
+        if driver_ids and vehicle_ids:
+            # Taken by an assignment the occupancy index hasn't seen yet
+            raise ConflictWithExistingResourceException(DRIVER_ASSIGNMENT_TAKEN)
+        raise ResourceNotFoundException("Driver or vehicle to assign not found")
+
+    def find_occupancy_conflict(
+        self, occupancy: DayOccupancyModel, driver_assignment: DriverAssignmentModel
+    ) -> str | None:
+        if (
+            driver_assignment.driver_id,
+            driver_assignment.vehicle_id,
+        ) in occupancy.assignment_ids:
+            return DRIVER_ASSIGNMENT_EXISTS
+        if driver_assignment.driver_id in occupancy.driver_ids:
+            return "Driver assignment driver is already taken by another driver assignment at the same day"
+        if driver_assignment.vehicle_id in occupancy.vehicle_ids:
+            return "Driver assignment vehicle is already taken by another driver assignment at the same day"
+        if occupancy.is_destination_taken(
+            driver_assignment.destination_location,
+            radius_km=self.destination_conflict_radius_km,
+        ):
+            return "Driver assignment route is already taken by another driver assignment at the same day"
+        return None
 
-    def get_driver_assignments(
-        self, only_actives: bool = False, travel_date: date | None = None
-    ) -> list[DriverAssignmentModel]:
+    async def assign_schedule(
+        self, driver_assignments: list[DriverAssignmentModel]
+    ) -> list[ImportResultModel]:
+        """Creates every assignment of the schedule that doesn't conflict with the existing
+        assignments of its day or with the rows before it. Conflicts are found in memory
+        against the occupancy of all the schedule's days, loaded with a single query, and the
+        accepted rows are inserted together, each one refused if it was taken since."""
+        logger.debug("Method called: driver_assignment_service.assign_schedule()")
+        logger.debug("Params passed: {} driver assignments", len(driver_assignments))
+        results = []
+        if not driver_assignments:
+            return results
+        occupancy = await self.driver_assignment_repository.get_occupancy_at_dates(
+            sorted({driver_assignment.travel_date for driver_assignment in driver_assignments})
+        )
+        driver_ids, vehicle_ids = await self.driver_assignment_repository.get_existing_driver_and_vehicle_ids(
+            sorted({driver_assignment.driver_id for driver_assignment in driver_assignments}),
+            sorted({driver_assignment.vehicle_id for driver_assignment in driver_assignments}),
+        )
+        accepted = []
+        for number, driver_assignment in enumerate(driver_assignments, start=1):
+            if driver_assignment.driver_id not in driver_ids:
+                results.append(ImportResultModel(number, IMPORT_INVALID, "Driver not found"))
+                continue
+            if driver_assignment.vehicle_id not in vehicle_ids:
+                results.append(ImportResultModel(number, IMPORT_INVALID, "Vehicle not found"))
+                continue
+            day_occupancy = occupancy[driver_assignment.travel_date]
+            if conflict := self.find_occupancy_conflict(day_occupancy, driver_assignment):
+                results.append(ImportResultModel(number, IMPORT_CONFLICT, conflict))
+                continue
+            day_occupancy.add(
+                driver_assignment.driver_id,
+                driver_assignment.vehicle_id,
+                driver_assignment.destination_location,
+            )
+            accepted.append((number, driver_assignment))
+        if accepted:
+            try:
+                written = await self.driver_assignment_repository.create_driver_assignments(
+                    [driver_assignment for _, driver_assignment in accepted]
+                )
+                conflicts = [
+                    None if was_written else DRIVER_ASSIGNMENT_TAKEN for was_written in written
+                ]
+            except ConflictWithExistingResourceException:
+                # Another request created some of the same assignments after the lookup, so the
+                # rows are inserted one at a time to find out which ones
+                conflicts = []
+                for _, driver_assignment in accepted:
+                    try:
+                        [was_written] = await self.driver_assignment_repository.create_driver_assignments(
+                            [driver_assignment]
+                        )
+                    except ConflictWithExistingResourceException as e:
+                        conflicts.append(str(e))
+                    else:
+                        conflicts.append(None if was_written else DRIVER_ASSIGNMENT_TAKEN)
+            for (number, _), conflict in zip(accepted, conflicts):
+                if conflict:
+                    results.append(ImportResultModel(number, IMPORT_CONFLICT, conflict))
+                else:
+                    results.append(ImportResultModel(number, IMPORT_CREATED))
+        results.sort(key=lambda result: result.number)
+        return results
+
+    async def get_driver_assignments(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        only_actives: bool = False,
+        travel_date: date | None = None,
+        travel_date_from: date | None = None,
+        travel_date_to: date | None = None,
+        driver_id: int | None = None,
+        vehicle_id: int | None = None,
+    ) -> PageModel:
         logger.debug("Method called: driver_assignment_service.get_driver_assignments()")
-        logger.debug(f"Params passed: {only_actives}, {travel_date}")
-        return self.driver_assignment_repository.get_driver_assignments(
-            only_actives, travel_date
+        logger.debug(
+            "Params passed: {}, {}, {}, {}, {}, {}, {} and {}",
+            limit,
+            cursor,
+            only_actives,
+            travel_date,
+            travel_date_from,
+            travel_date_to,
+            driver_id,
+            vehicle_id,
+        )
+        if travel_date_from and travel_date_to and travel_date_from > travel_date_to:
+            raise InvalidArgumentException("travel_date_from must be before travel_date_to")
+        return await self.driver_assignment_repository.get_driver_assignments(
+            only_actives,
+            travel_date,
+            limit,
+            cursor,
+            travel_date_from,
+            travel_date_to,
+            driver_id,
+            vehicle_id,
+        )
+
+    async def get_driver_assignments_nearby(
+        self,
+        location: LocationModel,
+        radius_km: float,
+        limit: int,
+        travel_date: date | None = None,
+        travel_date_from: date | None = None,
+        travel_date_to: date | None = None,
+        by_origin: bool = False,
+        only_actives: bool = False,
+    ) -> list[NearbyDriverAssignmentModel]:
+        """The `limit` assignments whose destination, or origin when `by_origin`, is closest to
+        `location` within `radius_km`, on `travel_date` or between `travel_date_from` and
+        `travel_date_to`. Only the coordinates of the assignments in the geohash cells around
+        the location on those days are loaded to measure them, and the nearest are loaded whole
+        afterwards."""
+        logger.debug("Method called: driver_assignment_service.get_driver_assignments_nearby()")
+        logger.debug(
+            "Params passed: {}, {}, {}, {}, {}, {}, {} and {}",
+            location.__dict__,
+            radius_km,
+            limit,
+            travel_date,
+            travel_date_from,
+            travel_date_to,
+            by_origin,
+            only_actives,
+        )
+        if travel_date:
+            travel_date_from = travel_date_to = travel_date
+        elif not (travel_date_from and travel_date_to):
+            # Every candidate is measured, so the days they're loaded from are bounded
+            raise InvalidArgumentException(
+                "travel_date or both travel_date_from and travel_date_to are required"
+            )
+        if travel_date_from > travel_date_to:
+            raise InvalidArgumentException("travel_date_from must be before travel_date_to")
+        if (travel_date_to - travel_date_from).days >= self.nearby_max_range_days:
+            raise InvalidArgumentException(
+                f"The date range can't be longer than {self.nearby_max_range_days} days"
+            )
+        candidates = await self.driver_assignment_repository.get_driver_assignment_locations_in_geohash_cells(
+            get_geohash_cells_around(location, radius_km),
+            by_origin,
+            travel_date_from,
+            travel_date_to,
+            only_actives,
         )
+        distances = {}
+        for driver_assignment_id, candidate_location in candidates:
+            distance_km = get_distance_km(location, candidate_location)
+            if distance_km <= radius_km:
+                distances[
+                    (
+                        driver_assignment_id.driver_id,
+                        driver_assignment_id.vehicle_id,
+                        driver_assignment_id.travel_date,
+                    )
+                ] = distance_km
+        nearest_ids = sorted(distances, key=distances.get)[:limit]
+        driver_assignments = await self.driver_assignment_repository.get_driver_assignments_by_ids(
+            [DriverAssignmentIdModel(*driver_assignment_id) for driver_assignment_id in nearest_ids]
+        )
+        nearby = [
+            NearbyDriverAssignmentModel(
+                driver_assignment,
+                distances[
+                    (
+                        driver_assignment.driver_id,
+                        driver_assignment.vehicle_id,
+                        driver_assignment.travel_date,
+                    )
+                ],
+            )
+            for driver_assignment in driver_assignments
+        ]
+        nearby.sort(key=lambda nearby_driver_assignment: nearby_driver_assignment.distance_km)
+        return nearby
 
-    def get_driver_assignment(
+    async def get_driver_assignment(
         self, driver_id: int, vehicle_id: int, travel_date: date
     ) -> DriverAssignmentModel:
         logger.debug("Method called: driver_assignment_service.get_driver_assignment()")
-        logger.debug(f"Params passed: {driver_id}, {vehicle_id}, {travel_date}")
-        driver_assignment = self.driver_assignment_repository.get_driver_assignment(
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        driver_assignment = await self.driver_assignment_repository.get_driver_assignment(
             driver_id, vehicle_id, travel_date
         )
         if not driver_assignment:
             raise ResourceNotFoundException("Driver assignment not found")
         return driver_assignment
 
-    def update_driver_assignment(
+    async def update_driver_assignment(
         self, driver_assignment: DriverAssignmentModel
     ) -> DriverAssignmentModel:
         logger.debug("Method called: driver_assignment_service.update_driver_assignment()")
-        logger.debug(f"Params passed: {driver_assignment.__dict__}")
-        if assignment := self.get_driver_assignment(
+        logger.debug("Params passed: {}", driver_assignment.__dict__)
+        if assignment := await self.get_driver_assignment(
             driver_assignment.driver_id,
             driver_assignment.vehicle_id,
             driver_assignment.travel_date,
         ):
             if not self.is_driver_assignment_editable(assignment):
                 raise InvalidArgumentException("Driver assignment is not editable")
-            if self.is_driver_assignment_location_taken_at_date(
+            if await self.is_driver_assignment_location_taken_at_date(
                 driver_assignment.destination_location,
                 driver_assignment.travel_date,
                 DriverAssignmentIdModel(
@@ -109,34 +338,34 @@ class DriverAssignmentService:
                 raise ConflictWithExistingResourceException(
                     "Driver assignment route is already taken by another driver assignment at the same day"
                 )
-            return self.driver_assignment_repository.update_driver_assignment(
+            return await self.driver_assignment_repository.update_driver_assignment(
                 driver_assignment
             )
 
-    def set_driver_assignment_as_inactive(
+    async def set_driver_assignment_as_inactive(
         self, driver_id: int, vehicle_id: int, travel_date: date
     ) -> None:
         logger.debug("Method called: driver_assignment_service.set_driver_assignment_as_inactive()")
-        logger.debug(f"Params passed: {driver_id}, {vehicle_id}, {travel_date}")
-        if self.get_driver_assignment(driver_id, vehicle_id, travel_date):
-            self.driver_assignment_repository.set_driver_assignment_as_inactive(
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        if await self.get_driver_assignment(driver_id, vehicle_id, travel_date):
+            await self.driver_assignment_repository.set_driver_assignment_as_inactive(
                 driver_id, vehicle_id, travel_date
             )
 
-    def get_assignments_history_for_driver(
-        self, driver_id: int
-    ) -> list[DriverAssignmentModel]:
+    async def get_assignments_history_for_driver(
+        self, driver_id: int, limit: int, cursor: str | None = None
+    ) -> PageModel:
         logger.debug("Method called: driver_assignment_service.get_assignments_history_for_driver()")
-        logger.debug(f"Params passed: {driver_id}")
-        return self.driver_assignment_repository.get_all_assignments_for_driver(
-            driver_id
+        logger.debug("Params passed: {}, {} and {}", driver_id, limit, cursor)
+        return await self.driver_assignment_repository.get_all_assignments_for_driver(
+            driver_id, limit, cursor
         )
 
-    def get_assignments_history_for_vehicle(
-        self, vehicle_id: int
-    ) -> list[DriverAssignmentModel]:
+    async def get_assignments_history_for_vehicle(
+        self, vehicle_id: int, limit: int, cursor: str | None = None
+    ) -> PageModel:
         logger.debug("Method called: driver_assignment_service.get_assignments_history_for_vehicle()")
-        logger.debug(f"Params passed: {vehicle_id}")
-        return self.driver_assignment_repository.get_all_assignments_for_vehicle(
-            vehicle_id
+        logger.debug("Params passed: {}, {} and {}", vehicle_id, limit, cursor)
+        return await self.driver_assignment_repository.get_all_assignments_for_vehicle(
+            vehicle_id, limit, cursor
         )
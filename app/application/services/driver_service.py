@@ -1,55 +1,76 @@
+from typing import AsyncIterator
 from loguru import logger
 
-from app.application.repositories.driver_repository import (
-    DriverRepository,
-)
-from app.domain.exceptions.conflict_with_existing_resource_exception import (
-    ConflictWithExistingResourceException,
+from app.application.repositories.async_driver_repository import (
+    AsyncDriverRepository,
 )
+from app.application.services.bulk_import_service import BulkImportService
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
 from app.domain.models.driver_model import DriverModel
+from app.domain.models.import_result_model import ImportResultModel
+from app.domain.models.import_row_model import ImportRowModel
+from app.domain.models.page_model import PageModel
 
 
 class DriverService:
     def __init__(
         self,
-        driver_repository: DriverRepository,
+        driver_repository: AsyncDriverRepository,
     ) -> None:
         self.driver_repository = driver_repository
 
-    def get_driver_by_driver_id(self, driver_id: int) -> DriverModel:
+    async def get_driver_by_driver_id(self, driver_id: int) -> DriverModel:
         logger.debug("Method called: driver_service.get_driver_by_driver_id()")
-        logger.debug(f"Params passed: {driver_id}")
-        if driver := self.driver_repository.get_driver_by_driver_id(driver_id):
+        logger.debug("Params passed: {}", driver_id)
+        if driver := await self.driver_repository.get_driver_by_driver_id(driver_id):
             return driver
         raise ResourceNotFoundException
 
-    def get_all_drivers(self) -> list[DriverModel]:
+    async def get_all_drivers(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        name: str | None = None,
+        last_name: str | None = None,
+    ) -> PageModel:
         logger.debug("Method called: driver_service.get_all_drivers()")
-        return self.driver_repository.get_all_drivers()
+        logger.debug("Params passed: {}, {}, {} and {}", limit, cursor, name, last_name)
+        return await self.driver_repository.get_all_drivers(
+            limit, cursor, name, last_name
+        )
 
-    def create_driver(self, driver: DriverModel) -> DriverModel:
+    async def create_driver(self, driver: DriverModel) -> DriverModel:
         logger.debug("Method called: driver_service.create_driver()")
-        logger.debug(f"Params passed: {driver.__dict__}")
-        if self.driver_repository.get_driver_by_curp(driver.curp):
-            raise ConflictWithExistingResourceException
+        logger.debug("Params passed: {}", driver.__dict__)
+        return await self.driver_repository.save_driver(driver)
 
-        return self.driver_repository.save_driver(driver)
+    async def import_drivers(
+        self, rows: AsyncIterator[ImportRowModel], batch_size: int
+    ) -> list[ImportResultModel]:
+        logger.debug("Method called: driver_service.import_drivers()")
+        logger.debug("Params passed: batch size {}", batch_size)
+        bulk_import_service = BulkImportService(
+            key_names=("curp", "driving_license"),
+            get_taken_keys=self.driver_repository.get_taken_driver_keys,
+            create_all=self.driver_repository.create_drivers,
+            batch_size=batch_size,
+        )
+        return await bulk_import_service.import_rows(rows)
 
-    def update_driver(self, driver: DriverModel) -> DriverModel:
+    async def update_driver(self, driver: DriverModel) -> DriverModel:
         logger.debug("Method called: driver_service.update_driver()")
-        logger.debug(f"Params passed: {driver.__dict__}")
-        if not driver.id or not self.driver_repository.get_driver_by_driver_id(
+        logger.debug("Params passed: {}", driver.__dict__)
+        if not driver.id or not await self.driver_repository.get_driver_by_driver_id(
             driver.id
         ):
             raise ResourceNotFoundException
 
-        return self.driver_repository.save_driver(driver)
+        return await self.driver_repository.save_driver(driver)
 
-    def delete_driver_by_driver_id(self, driver_id: int):
+    async def delete_driver_by_driver_id(self, driver_id: int):
         logger.debug("Method called: driver_service.delete_driver_by_driver_id()")
-        logger.debug(f"Params passed: {driver_id}")
-        if not self.get_driver_by_driver_id(driver_id):
+        logger.debug("Params passed: {}", driver_id)
+        if not await self.get_driver_by_driver_id(driver_id):
             raise ResourceNotFoundException
 
-        return self.driver_repository.delete_driver_by_driver_id(driver_id)
+        return await self.driver_repository.delete_driver_by_driver_id(driver_id)
@@ -1,30 +1,31 @@
-from app.application.repositories.driver_assingment_repository import (
-    DriverAssignmentRepository,
+from datetime import date
+from app.application.repositories.async_metrics_repository import (
+    AsyncMetricsRepository,
 )
-from app.application.repositories.driver_repository import DriverRepository
-from app.application.repositories.user_repository import UserRepository
-from app.application.repositories.vehicle_repository import VehicleRepository
+from app.infrastructure.cache.ttl_lru_cache import TtlLruCache
 from loguru import logger
 
 
 class MetricsService:
     def __init__(
         self,
-        vehicle_repository: VehicleRepository,
-        user_repository: UserRepository,
-        driver_repository: DriverRepository,
-        driver_assignment_repository: DriverAssignmentRepository,
+        metrics_repository: AsyncMetricsRepository,
+        metrics_cache: TtlLruCache,
     ) -> None:
-        self.vehicle_repository = vehicle_repository
-        self.user_repository = user_repository
-        self.driver_repository = driver_repository
-        self.driver_assignment_repository = driver_assignment_repository
+        self.metrics_repository = metrics_repository
+        self.metrics_cache = metrics_cache
 
-    def get_metrics(self):
+    async def get_metrics(self):
         logger.debug("Method called: metrics_service.get_metrics()")
+        # Keyed by day so the number of today's assignments never outlives the date it belongs to
+        today = date.today()
+        metrics = self.metrics_cache.get(today)
+        if not metrics:
+            metrics = await self.metrics_repository.get_metrics()
+            self.metrics_cache.set(today, metrics)
         return {
-            "number_of_vehicles": self.vehicle_repository.get_number_of_vehicles(),
-            "number_of_users": self.user_repository.get_number_of_users(),
-            "number_of_drivers": self.driver_repository.get_number_of_drivers(),
-            "number_of_today_assigment": self.driver_assignment_repository.get_number_of_today_assignments(),
+            "number_of_vehicles": metrics.number_of_vehicles,
+            "number_of_users": metrics.number_of_users,
+            "number_of_drivers": metrics.number_of_drivers,
+            "number_of_today_assigment": metrics.number_of_today_assignments,
         }
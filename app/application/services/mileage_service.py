@@ -0,0 +1,153 @@
+from datetime import date, timedelta
+import numpy as np
+from loguru import logger
+
+from app.application.repositories.async_mileage_repository import (
+    AsyncMileageRepository,
+)
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
+from app.domain.models.geo_location import get_distances_km
+from app.domain.models.mileage_model import (
+    DayMileageModel,
+    MileageReportModel,
+    MileageTotalsModel,
+    RouteColumnsModel,
+)
+from app.infrastructure.cache.versioned_response_cache import VersionedResponseCache
+
+DAY_MILEAGE = "day_mileage"
+
+
+def sum_by_id(
+    ids: np.ndarray, assignments: np.ndarray, km: np.ndarray
+) -> MileageTotalsModel:
+    unique_ids, positions = np.unique(ids, return_inverse=True)
+    return MileageTotalsModel(
+        ids=unique_ids,
+        assignments=np.bincount(
+            positions, weights=assignments, minlength=len(unique_ids)
+        ).astype(np.int64),
+        km=np.bincount(positions, weights=km, minlength=len(unique_ids)),
+    )
+
+
+def merge_mileage_totals(mileage_totals: list[MileageTotalsModel]) -> MileageTotalsModel:
+    return sum_by_id(
+        np.concatenate([totals.ids for totals in mileage_totals]),
+        np.concatenate([totals.assignments for totals in mileage_totals]),
+        np.concatenate([totals.km for totals in mileage_totals]),
+    )
+
+
+def get_date_ranges(travel_dates: list[date]) -> list[tuple[date, date]]:
+    """Runs of consecutive dates in the sorted `travel_dates`, as (first, last) pairs."""
+    date_ranges = []
+    for travel_date in travel_dates:
+        if date_ranges and date_ranges[-1][1] + timedelta(days=1) == travel_date:
+            date_ranges[-1] = (date_ranges[-1][0], travel_date)
+        else:
+            date_ranges.append((travel_date, travel_date))
+    return date_ranges
+
+
+class MileageService:
+    def __init__(
+        self,
+        mileage_repository: AsyncMileageRepository,
+        mileage_cache: VersionedResponseCache,
+        max_range_days: int,
+    ) -> None:
+        self.mileage_repository = mileage_repository
+        self.mileage_cache = mileage_cache
+        self.max_range_days = max_range_days
+
+    def get_day_mileages(
+        self, route_columns: RouteColumnsModel, travel_dates: list[date]
+    ) -> list[DayMileageModel]:
+        """Mileage of each of `travel_dates`, estimated as the great-circle distance from the
+        origin to the destination of every active assignment. The distances of all the routes
+        are computed in a single pass over the columns and then summed per day."""
+        distances = get_distances_km(
+            route_columns.origin_latitudes,
+            route_columns.origin_longitudes,
+            route_columns.destination_latitudes,
+            route_columns.destination_longitudes,
+        )
+        order = np.argsort(route_columns.travel_dates, kind="stable")
+        days, starts = np.unique(route_columns.travel_dates[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        day_rows = {
+            day.item(): order[start:end] for day, start, end in zip(days, starts, ends)
+        }
+        day_mileages = []
+        for travel_date in travel_dates:
+            rows = day_rows.get(travel_date, order[:0])
+            ones = np.ones(len(rows))
+            day_mileages.append(
+                DayMileageModel(
+                    travel_date=travel_date,
+                    assignments=len(rows),
+                    km=float(distances[rows].sum()),
+                    vehicles=sum_by_id(
+                        route_columns.vehicle_ids[rows], ones, distances[rows]
+                    ),
+                    drivers=sum_by_id(
+                        route_columns.driver_ids[rows], ones, distances[rows]
+                    ),
+                )
+            )
+        return day_mileages
+
+    async def get_mileage_report(
+        self, date_from: date, date_to: date
+    ) -> MileageReportModel:
+        """Kilometres per day, vehicle and driver between both dates. Past days are cached
+        until one of their assignments changes, so only today, future days and the past days
+        not requested before are read from the database, with a single query."""
+        logger.debug("Method called: mileage_service.get_mileage_report()")
+        logger.debug("Params passed: {} and {}", date_from, date_to)
+        if date_from > date_to:
+            raise InvalidArgumentException("date_from must be before date_to")
+        if (date_to - date_from).days >= self.max_range_days:
+            raise InvalidArgumentException(
+                f"The date range can't be longer than {self.max_range_days} days"
+            )
+        today = date.today()
+        travel_dates = [
+            date_from + timedelta(days=offset)
+            for offset in range((date_to - date_from).days + 1)
+        ]
+        day_mileages = {}
+        versions = {}
+        for travel_date in travel_dates:
+            day_mileage = (
+                self.mileage_cache.get(travel_date, DAY_MILEAGE)
+                if travel_date < today
+                else None
+            )
+            if day_mileage is None:
+                versions[travel_date] = self.mileage_cache.get_version(travel_date)
+            else:
+                day_mileages[travel_date] = day_mileage
+        if versions:
+            missing_dates = sorted(versions)
+            route_columns = await self.mileage_repository.get_active_route_columns(
+                get_date_ranges(missing_dates)
+            )
+            for day_mileage in self.get_day_mileages(route_columns, missing_dates):
+                day_mileages[day_mileage.travel_date] = day_mileage
+                if day_mileage.travel_date < today:
+                    self.mileage_cache.set(
+                        day_mileage.travel_date,
+                        versions[day_mileage.travel_date],
+                        DAY_MILEAGE,
+                        day_mileage,
+                    )
+        days = [day_mileages[travel_date] for travel_date in travel_dates]
+        return MileageReportModel(
+            date_from=date_from,
+            date_to=date_to,
+            days=days,
+            vehicles=merge_mileage_totals([day.vehicles for day in days]),
+            drivers=merge_mileage_totals([day.drivers for day in days]),
+        )
@@ -1,81 +1,134 @@
-from app.application.repositories.vehicle_repository import VehicleRepository
-from app.application.repositories.user_repository import UserRepository
-from app.domain.exceptions.conflict_with_existing_resource_exception import (
-    ConflictWithExistingResourceException,
-)
+from app.application.repositories.async_vehicle_repository import AsyncVehicleRepository
+from app.application.repositories.async_user_repository import AsyncUserRepository
+from app.application.services.bulk_import_service import BulkImportService
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from app.domain.models.import_result_model import ImportResultModel
+from app.domain.models.import_row_model import ImportRowModel
+from app.domain.models.page_model import PageModel
+from app.domain.models.stored_file_model import StoredFileModel
+from app.domain.exceptions.file_not_found_exception import FileNotFoundException
+from app.domain.exceptions.invalid_file_exception import InvalidFileException
 from app.domain.models.vehicle_model import VehicleModel
+from app.infrastructure.services.picture_variant_service import PictureVariantService
 from app.infrastructure.services.storage_service import StorageService
-from typing import List
 from datetime import datetime, timezone
+from typing import AsyncIterator
 from loguru import logger
 
 
 class VehicleService:
     def __init__(
         self,
-        vehicle_repository: VehicleRepository,
-        user_repository: UserRepository,
+        vehicle_repository: AsyncVehicleRepository,
+        user_repository: AsyncUserRepository,
         storage_service: StorageService,
+        picture_variant_service: PictureVariantService,
     ) -> None:
         self.vehicle_repository = vehicle_repository
         self.user_repository = user_repository
         self.storage_service = storage_service
+        self.picture_variant_service = picture_variant_service
 
-    def get_vehicle_by_id(self, id: int) -> VehicleModel | None:
+    async def get_vehicle_by_id(self, id: int) -> VehicleModel | None:
         logger.debug("Method called: vehicle_service.get_vehicle_by_id()")
-        logger.debug(f"Params passed: {id}")
-        if vehicle := self.vehicle_repository.get_vehicle_by_id(id=id):
+        logger.debug("Params passed: {}", id)
+        if vehicle := await self.vehicle_repository.get_vehicle_by_id(id=id):
             return vehicle
         raise ResourceNotFoundException
 
-    def get_all_vehicles(self) -> List[VehicleModel]:
+    async def get_all_vehicles(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        brand: str | None = None,
+        model: str | None = None,
+    ) -> PageModel:
         logger.debug("Method called: vehicle_service.get_all_vehicles()")
-        return self.vehicle_repository.get_vehicles()
+        logger.debug("Params passed: {}, {}, {} and {}", limit, cursor, brand, model)
+        return await self.vehicle_repository.get_vehicles(limit, cursor, brand, model)
 
-    def remove_vehicle_by_id(self, id: int):
+    async def remove_vehicle_by_id(self, id: int):
         logger.debug("Method called: vehicle_service.remove_vehicle_by_id()")
-        logger.debug(f"Params passed: {id}")
-        if not self.vehicle_repository.get_vehicle_by_id(id=id):
+        logger.debug("Params passed: {}", id)
+        if not await self.vehicle_repository.get_vehicle_by_id(id=id):
             raise ResourceNotFoundException
-        return self.vehicle_repository.remove_vehicle_by_id(id=id)
+        return await self.vehicle_repository.remove_vehicle_by_id(id=id)
 
-    def is_vehicle_duplicate(self, vehicle: VehicleModel, id: int | None = None):
-        logger.debug("Method called: vehicle_service.is_vehicle_duplicate()")
-        logger.debug(f"Params passed: {vehicle.__dict__} and ID: {id}")
-        found = self.vehicle_repository.get_vehicle_by_vin(
-            vin=vehicle.vin
-        ) or self.vehicle_repository.get_vehicle_by_plate(plate=vehicle.plate)
-        if found:
-            return found.id != id
-        return False
+    async def resolve_picture_reference(self, picture: str) -> str:
+        try:
+            return await self.storage_service.resolve_reference(picture)
+        except FileNotFoundException:
+            raise InvalidFileException
 
-    def update_vehicle(self, id: int, vehicle_update: VehicleModel):
+    async def update_vehicle(self, id: int, vehicle_update: VehicleModel):
         logger.debug("Method called: vehicle_service.update_vehicle()")
-        logger.debug(f"Params passed: ID: {id} and {vehicle_update.__dict__}")
-        if not self.get_vehicle_by_id(id=id):
-            raise ResourceNotFoundException
-        if self.is_vehicle_duplicate(vehicle=vehicle_update, id=id):
-            raise ConflictWithExistingResourceException
+        logger.debug("Params passed: ID: {} and {}", id, vehicle_update.__dict__)
+        vehicle = await self.get_vehicle_by_id(id=id)
         if vehicle_update.picture:
-            vehicle_update.picture = self.storage_service.save_base64_image(
-                vehicle_update.picture, f"{vehicle_update.vin}.jpg"
-            )
-        self.vehicle_repository.update_vehicle(vehicle_update=vehicle_update, id=id)
-        return self.vehicle_repository.get_vehicle_by_id(id)
+            vehicle_update.picture = await self.resolve_picture_reference(vehicle_update.picture)
+        else:
+            vehicle_update.picture = vehicle.picture
+        return await self.vehicle_repository.update_vehicle(
+            vehicle_update=vehicle_update, id=id
+        )
 
-    def create_vehicle(self, vehicle: VehicleModel):
+    async def create_vehicle(self, vehicle: VehicleModel):
         logger.debug("Method called: vehicle_service.create_vehicle()")
-        logger.debug(f"Params passed: {vehicle.__dict__}")
+        logger.debug("Params passed: {}", vehicle.__dict__)
+        vehicle.entry_date = datetime.now(timezone.utc)
+        if vehicle.picture:
+            vehicle.picture = await self.resolve_picture_reference(vehicle.picture)
+        else:
+            vehicle.picture = ""
+        return await self.vehicle_repository.create_vehicle(vehicle=vehicle)
+
+    async def prepare_imported_vehicle(self, vehicle: VehicleModel) -> VehicleModel:
         vehicle.entry_date = datetime.now(timezone.utc)
-        if self.is_vehicle_duplicate(vehicle=vehicle):
-            raise ConflictWithExistingResourceException
-        vehicle.picture = self.storage_service.save_base64_image(
-            vehicle.picture, f"{vehicle.vin}.jpg"
+        if vehicle.picture:
+            try:
+                vehicle.picture = await self.resolve_picture_reference(vehicle.picture)
+            except InvalidFileException:
+                raise InvalidArgumentException("Picture not found")
+        else:
+            vehicle.picture = ""
+        return vehicle
+
+    async def import_vehicles(
+        self, rows: AsyncIterator[ImportRowModel], batch_size: int
+    ) -> list[ImportResultModel]:
+        logger.debug("Method called: vehicle_service.import_vehicles()")
+        logger.debug("Params passed: batch size {}", batch_size)
+        bulk_import_service = BulkImportService(
+            key_names=("vin", "plate"),
+            get_taken_keys=self.vehicle_repository.get_taken_vehicle_keys,
+            create_all=self.vehicle_repository.create_vehicles,
+            batch_size=batch_size,
+            prepare_item=self.prepare_imported_vehicle,
+        )
+        return await bulk_import_service.import_rows(rows)
+
+    async def upload_vehicle_picture(
+        self, id: int, picture_chunks: AsyncIterator[bytes]
+    ) -> VehicleModel:
+        logger.debug("Method called: vehicle_service.upload_vehicle_picture()")
+        logger.debug("Params passed: {}", id)
+        vehicle = await self.get_vehicle_by_id(id=id)
+        picture = await self.storage_service.save_image_stream(
+            picture_chunks, vehicle.vin
         )
-        return self.vehicle_repository.create_vehicle(vehicle=vehicle)
+        vehicle.picture = picture
+        return await self.vehicle_repository.update_vehicle(vehicle_update=vehicle, id=id)
 
-    def download_vehicle_picture(self, vin: str):
+    async def download_vehicle_picture(
+        self, vin: str, size: str | None = None
+    ) -> StoredFileModel:
         logger.debug("Method called: vehicle_service.download_vehicle_picture()")
-        logger.debug(f"Params passed: {vin}")
-        return self.storage_service.read_file_as_bytes(f"{vin}.jpg")
+        logger.debug("Params passed: {} and {}", vin, size)
+        vehicle = await self.vehicle_repository.get_vehicle_by_vin(vin=vin)
+        if not vehicle or not vehicle.picture:
+            raise FileNotFoundException
+        picture = vehicle.picture
+        if size:
+            picture = await self.picture_variant_service.get_variant(picture, size)
+        return await self.storage_service.get_stored_file(picture)
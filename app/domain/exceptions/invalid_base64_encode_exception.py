@@ -1,2 +0,0 @@
-class Invalid64EncodeException(Exception):
-    pass
@@ -0,0 +1,2 @@
+class ServiceOverloadedException(Exception):
+    pass
@@ -0,0 +1,63 @@
+from datetime import date, datetime
+
+from app.domain.models.driver_assignment import LocationModel
+
+TEMPLATE_SKIPPED = "Skipped"
+
+
+class AssignmentTemplateExceptionModel:
+    def __init__(self, template_id: int, travel_date: date, reason: str) -> None:
+        self.template_id = template_id
+        self.travel_date = travel_date
+        self.reason = reason
+
+
+class AssignmentTemplateModel:
+    def __init__(
+        self,
+        driver_id: int,
+        vehicle_id: int,
+        route_name: str,
+        origin_location: LocationModel,
+        destination_location: LocationModel,
+        recurrence_rule: str,
+        start_date: date,
+        comments: str | None = None,
+        id: int | None = None,
+        active: bool = True,
+        materialized_until: date | None = None,
+        creation_date: datetime | None = None,
+        exceptions: list[AssignmentTemplateExceptionModel] | None = None,
+    ) -> None:
+        self.id = id
+        self.driver_id = driver_id
+        self.vehicle_id = vehicle_id
+        self.route_name = route_name
+        self.origin_location = origin_location
+        self.destination_location = destination_location
+        self.recurrence_rule = recurrence_rule
+        self.start_date = start_date
+        self.comments = comments
+        self.active = active
+        self.materialized_until = materialized_until
+        self.creation_date = creation_date
+        self.exceptions = exceptions or []
+
+
+class MaterializationSummaryModel:
+    def __init__(
+        self,
+        templates: int = 0,
+        created: int = 0,
+        exceptions: int = 0,
+        last_template_id: int | None = None,
+    ) -> None:
+        self.templates = templates
+        self.created = created
+        self.exceptions = exceptions
+        self.last_template_id = last_template_id
+
+    def add(self, summary: "MaterializationSummaryModel") -> None:
+        self.templates += summary.templates
+        self.created += summary.created
+        self.exceptions += summary.exceptions
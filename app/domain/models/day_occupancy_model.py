@@ -0,0 +1,100 @@
+from collections import Counter
+from datetime import date
+from decimal import Decimal
+
+from app.domain.models.driver_assignment import LocationModel
+from app.domain.models.geo_location import get_distance_km
+
+COORDINATE_PRECISION = Decimal("0.000001")
+
+
+def get_location_key(location: LocationModel) -> tuple[Decimal, Decimal]:
+    # Coordinates are stored with 6 decimal places, so keys are rounded the same way
+    return (
+        Decimal(location.latitude).quantize(COORDINATE_PRECISION),
+        Decimal(location.longitude).quantize(COORDINATE_PRECISION),
+    )
+
+
+def release(counter: Counter, key) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        del counter[key]
+
+
+class DayOccupancyModel:
+    """Drivers, vehicles and destinations taken by the active assignments of a travel date,
+    plus the driver and vehicle pairs of every assignment of that date, active or not. Each
+    taken value is counted, so replacing or removing an assignment only frees what no other
+    active assignment of the day still holds."""
+
+    def __init__(self, travel_date: date) -> None:
+        self.travel_date = travel_date
+        self.assignments: dict[tuple[int, int], tuple[tuple[Decimal, Decimal], bool]] = {}
+        self.driver_ids: Counter = Counter()
+        self.vehicle_ids: Counter = Counter()
+        self.destinations: Counter = Counter()
+
+    @property
+    def assignment_ids(self):
+        return self.assignments.keys()
+
+    def add(
+        self,
+        driver_id: int,
+        vehicle_id: int,
+        destination_location: LocationModel,
+        active: bool = True,
+    ) -> None:
+        self.remove(driver_id, vehicle_id)
+        destination = get_location_key(destination_location)
+        self.assignments[(driver_id, vehicle_id)] = (destination, active)
+        if active:
+            self.driver_ids[driver_id] += 1
+            self.vehicle_ids[vehicle_id] += 1
+            self.destinations[destination] += 1
+
+    def remove(self, driver_id: int, vehicle_id: int) -> None:
+        previous = self.assignments.pop((driver_id, vehicle_id), None)
+        if previous and previous[1]:
+            release(self.driver_ids, driver_id)
+            release(self.vehicle_ids, vehicle_id)
+            release(self.destinations, previous[0])
+
+    def is_driver_or_vehicle_taken(self, driver_id: int, vehicle_id: int) -> bool:
+        return driver_id in self.driver_ids or vehicle_id in self.vehicle_ids
+
+    def is_destination_taken(
+        self,
+        destination_location: LocationModel,
+        exclude_assignment: tuple[int, int] | None = None,
+        radius_km: float = 0,
+    ) -> bool:
+        """Whether an active assignment other than `exclude_assignment` goes to the location or,
+        with a `radius_km`, to anywhere within that distance of it."""
+        destination = get_location_key(destination_location)
+        excluded = self.assignments.get(exclude_assignment) if exclude_assignment else None
+        if not radius_km:
+            taken = self.destinations[destination]
+            if excluded == (destination, True):
+                taken -= 1
+            return taken > 0
+        # A day holds at most one active destination per vehicle, so they're all compared
+        for taken_destination, taken in self.destinations.items():
+            if excluded == (taken_destination, True):
+                taken -= 1
+            if taken > 0 and (
+                taken_destination == destination
+                or get_distance_km(destination_location, LocationModel(*taken_destination))
+                <= radius_km
+            ):
+                return True
+        return False
+
+    def copy(self) -> "DayOccupancyModel":
+        occupancy = DayOccupancyModel(self.travel_date)
+        occupancy.assignments = dict(self.assignments)
+        occupancy.driver_ids = Counter(self.driver_ids)
+        occupancy.vehicle_ids = Counter(self.vehicle_ids)
+        occupancy.destinations = Counter(self.destinations)
+        return occupancy
@@ -63,3 +63,11 @@ class DriverAssignmentIdModel:
         self.driver_id = driver_id
         self.vehicle_id = vehicle_id
         self.travel_date = travel_date
+
+
+class NearbyDriverAssignmentModel:
+    def __init__(
+        self, driver_assignment: DriverAssignmentModel, distance_km: float
+    ) -> None:
+        self.driver_assignment = driver_assignment
+        self.distance_km = distance_km
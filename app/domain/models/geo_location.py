@@ -0,0 +1,103 @@
+import numpy as np
+from math import asin, cos, radians, sin, sqrt
+
+from app.domain.models.driver_assignment import LocationModel
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_LATITUDE_DEGREE = 111.195
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+# Geohashes are stored with cells of about 4.8 x 4.8 metres at the equator
+GEOHASH_PRECISION = 9
+
+
+def get_distance_km(origin: LocationModel, destination: LocationModel) -> float:
+    """Great-circle distance between two locations, with the haversine formula."""
+    origin_latitude = radians(float(origin.latitude))
+    destination_latitude = radians(float(destination.latitude))
+    latitude_delta = destination_latitude - origin_latitude
+    longitude_delta = radians(float(destination.longitude) - float(origin.longitude))
+    haversine = (
+        sin(latitude_delta / 2) ** 2
+        + cos(origin_latitude) * cos(destination_latitude) * sin(longitude_delta / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(haversine)))
+
+
+def get_distances_km(
+    origin_latitudes: np.ndarray,
+    origin_longitudes: np.ndarray,
+    destination_latitudes: np.ndarray,
+    destination_longitudes: np.ndarray,
+) -> np.ndarray:
+    """get_distance_km over whole arrays of coordinates at once."""
+    origin_latitudes = np.radians(origin_latitudes)
+    destination_latitudes = np.radians(destination_latitudes)
+    haversine = (
+        np.sin((destination_latitudes - origin_latitudes) / 2) ** 2
+        + np.cos(origin_latitudes)
+        * np.cos(destination_latitudes)
+        * np.sin(np.radians(destination_longitudes - origin_longitudes) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(haversine)))
+
+
+def encode_geohash(latitude, longitude, precision: int = GEOHASH_PRECISION) -> str:
+    latitude_range = [-90.0, 90.0]
+    longitude_range = [-180.0, 180.0]
+    values = (float(longitude), float(latitude))
+    ranges = (longitude_range, latitude_range)
+    geohash = []
+    character = 0
+    for bit in range(precision * 5):
+        # Bits alternate between longitude and latitude, starting with longitude
+        value, value_range = values[bit % 2], ranges[bit % 2]
+        middle = (value_range[0] + value_range[1]) / 2
+        character <<= 1
+        if value >= middle:
+            character |= 1
+            value_range[0] = middle
+        else:
+            value_range[1] = middle
+        if bit % 5 == 4:
+            geohash.append(GEOHASH_ALPHABET[character])
+            character = 0
+    return "".join(geohash)
+
+
+def get_geohash_cell_size(precision: int) -> tuple[float, float]:
+    """Height and width in degrees of the geohash cells of a precision."""
+    bits = precision * 5
+    return 180 / 2 ** (bits // 2), 360 / 2 ** (bits - bits // 2)
+
+
+def get_geohash_cells_around(location: LocationModel, radius_km: float) -> list[str] | None:
+    """Geohash cells holding every point within `radius_km` of `location`: the cell of the
+    location and its eight neighbours, at the finest precision whose cells are at least
+    `radius_km` high and wide. None when no precision is coarse enough, close to the poles."""
+    latitude, longitude = float(location.latitude), float(location.longitude)
+    radius_degrees = radius_km / KM_PER_LATITUDE_DEGREE
+    # Cells are narrowest at the latitude within the radius that is closest to a pole
+    longitude_scale = cos(radians(min(90.0, abs(latitude) + radius_degrees)))
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        height, width = get_geohash_cell_size(precision)
+        if height >= radius_degrees and width * longitude_scale >= radius_degrees:
+            break
+    else:
+        return None
+    return sorted(
+        {
+            encode_geohash(
+                min(90.0, max(-90.0, latitude + latitude_step * height)),
+                (longitude + longitude_step * width + 180) % 360 - 180,
+                precision,
+            )
+            for latitude_step in (-1, 0, 1)
+            for longitude_step in (-1, 0, 1)
+        }
+    )
+
+
+def is_any_within_radius(
+    location: LocationModel, locations: list[LocationModel], radius_km: float
+) -> bool:
+    return any(get_distance_km(location, other) <= radius_km for other in locations)
@@ -0,0 +1,10 @@
+IMPORT_CREATED = "created"
+IMPORT_CONFLICT = "conflict"
+IMPORT_INVALID = "invalid"
+
+
+class ImportResultModel:
+    def __init__(self, number: int, status: str, detail: str | None = None) -> None:
+        self.number = number
+        self.status = status
+        self.detail = detail
@@ -0,0 +1,5 @@
+class ImportRowModel:
+    def __init__(self, number: int, item=None, error: str | None = None) -> None:
+        self.number = number
+        self.item = item
+        self.error = error
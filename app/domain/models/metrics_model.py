@@ -0,0 +1,12 @@
+class MetricsModel:
+    def __init__(
+        self,
+        number_of_vehicles: int,
+        number_of_users: int,
+        number_of_drivers: int,
+        number_of_today_assignments: int,
+    ) -> None:
+        self.number_of_vehicles = number_of_vehicles
+        self.number_of_users = number_of_users
+        self.number_of_drivers = number_of_drivers
+        self.number_of_today_assignments = number_of_today_assignments
@@ -0,0 +1,67 @@
+from datetime import date
+import numpy as np
+
+
+class RouteColumnsModel:
+    """Routes of a set of assignments, one array per column with a row per assignment."""
+
+    def __init__(
+        self,
+        travel_dates: np.ndarray,
+        driver_ids: np.ndarray,
+        vehicle_ids: np.ndarray,
+        origin_latitudes: np.ndarray,
+        origin_longitudes: np.ndarray,
+        destination_latitudes: np.ndarray,
+        destination_longitudes: np.ndarray,
+    ) -> None:
+        self.travel_dates = travel_dates
+        self.driver_ids = driver_ids
+        self.vehicle_ids = vehicle_ids
+        self.origin_latitudes = origin_latitudes
+        self.origin_longitudes = origin_longitudes
+        self.destination_latitudes = destination_latitudes
+        self.destination_longitudes = destination_longitudes
+
+
+class MileageTotalsModel:
+    """Assignments and kilometres per driver or vehicle id, in arrays sorted by id."""
+
+    def __init__(self, ids: np.ndarray, assignments: np.ndarray, km: np.ndarray) -> None:
+        self.ids = ids
+        self.assignments = assignments
+        self.km = km
+
+
+class DayMileageModel:
+    def __init__(
+        self,
+        travel_date: date,
+        assignments: int,
+        km: float,
+        vehicles: MileageTotalsModel,
+        drivers: MileageTotalsModel,
+    ) -> None:
+        self.travel_date = travel_date
+        self.assignments = assignments
+        self.km = km
+        self.vehicles = vehicles
+        self.drivers = drivers
+
+
+class MileageReportModel:
+    def __init__(
+        self,
+        date_from: date,
+        date_to: date,
+        days: list[DayMileageModel],
+        vehicles: MileageTotalsModel,
+        drivers: MileageTotalsModel,
+    ) -> None:
+        self.date_from = date_from
+        self.date_to = date_to
+        self.days = days
+        self.vehicles = vehicles
+        self.drivers = drivers
+        self.assignments = sum(day.assignments for day in days)
+        self.km = sum(day.km for day in days)
@@ -0,0 +1,4 @@
+class PageModel:
+    def __init__(self, items: list, next_cursor: str | None = None) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
@@ -0,0 +1,14 @@
+class StoredFileModel:
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        modified_at: float,
+        etag: str,
+        media_type: str,
+    ) -> None:
+        self.path = path
+        self.size = size
+        self.modified_at = modified_at
+        self.etag = etag
+        self.media_type = media_type
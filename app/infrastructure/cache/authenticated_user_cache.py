@@ -0,0 +1,22 @@
+from app.infrastructure.dto.authenticated_user_dto import AuthenticatedUserDTO
+
+
+class AuthenticatedUserCache:
+    async def get_user(self, email: str) -> AuthenticatedUserDTO | None:
+        raise NotImplementedError("Method get_user hasn't been implemented yet.")
+
+    async def save_user(self, user: AuthenticatedUserDTO) -> None:
+        raise NotImplementedError("Method save_user hasn't been implemented yet.")
+
+    async def delete_user(self, user_id: int) -> None:
+        raise NotImplementedError("Method delete_user hasn't been implemented yet.")
+
+    def delete(self, user_id: int) -> None:
+        """delete_user for the commit hooks, which aren't async."""
+        raise NotImplementedError("Method delete hasn't been implemented yet.")
+
+    def get_stats(self) -> dict:
+        raise NotImplementedError("Method get_stats hasn't been implemented yet.")
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,71 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.infrastructure.cache.ttl_lru_cache import TtlLruCache
+
+cache_dependencies: list[tuple[TtlLruCache, tuple]] = []
+key_dependencies: list[tuple[TtlLruCache, type, str]] = []
+row_dependencies: list[tuple[object, type]] = []
+
+
+def clear_cache_on_commit(cache: TtlLruCache, *entity_types) -> None:
+    cache_dependencies.append((cache, entity_types))
+
+
+def delete_keys_on_commit(cache: TtlLruCache, entity_type: type, key_attribute: str) -> None:
+    """Deletes only the key `key_attribute` holds in each written `entity_type` instance."""
+    key_dependencies.append((cache, entity_type, key_attribute))
+
+
+def apply_rows_on_commit(index, entity_type: type) -> None:
+    """Hands `index.apply` a snapshot, from `index.snapshot`, of each written `entity_type`
+    instance, so the index is updated in place instead of being dropped."""
+    row_dependencies.append((index, entity_type))
+
+
+def track_written_instances(session: Session, written) -> None:
+    """Marks the caches that depend on `written` as stale. Flushes call it on their own; rows
+    written with a Core statement, which the unit of work never sees, have to be passed in."""
+    for cache, entity_types in cache_dependencies:
+        if any(isinstance(instance, entity_types) for instance in written):
+            session.info.setdefault("stale_caches", set()).add(cache)
+    for cache, entity_type, key_attribute in key_dependencies:
+        for instance in written:
+            if isinstance(instance, entity_type):
+                session.info.setdefault("stale_keys", set()).add(
+                    (cache, getattr(instance, key_attribute))
+                )
+    for index, entity_type in row_dependencies:
+        for instance in written:
+            if isinstance(instance, entity_type):
+                session.info.setdefault("written_rows", []).append(
+                    (index, index.snapshot(instance, instance in session.deleted))
+                )
+
+
+# Caches are only cleared once the transaction commits; clearing them on flush would let a
+# concurrent request cache the old values again before the new ones are visible
+@event.listens_for(Session, "after_flush")
+def track_stale_caches(session: Session, flush_context) -> None:
+    track_written_instances(session, (*session.new, *session.dirty, *session.deleted))
+
+
+@event.listens_for(Session, "after_commit")
+def clear_stale_caches(session: Session) -> None:
+    for cache in session.info.pop("stale_caches", ()):
+        cache.clear()
+    for cache, key in session.info.pop("stale_keys", ()):
+        cache.delete(key)
+    # In write order, so the last snapshot of a row is the one that stays
+    for index, snapshot in session.info.pop("written_rows", ()):
+        index.apply(snapshot)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def forget_stale_caches(session: Session, previous_transaction) -> None:
+    # A savepoint rolling back leaves the writes of the enclosing transaction in place
+    if previous_transaction.nested:
+        return
+    session.info.pop("stale_caches", None)
+    session.info.pop("stale_keys", None)
+    session.info.pop("written_rows", None)
@@ -0,0 +1,85 @@
+from copy import copy
+from threading import Lock
+
+from app.infrastructure.cache.ttl_lru_cache import TtlLruCache
+
+
+class EntityCache:
+    """Caches domain models by id and lets them be looked up by any of the `indexes` attributes
+    too. Indexes only point to an id, so evicting the id is enough to invalidate every key of the
+    model, and a stale index entry left behind by a changed attribute never matches again."""
+
+    def __init__(self, max_size: int, ttl: float, indexes: tuple[str, ...]) -> None:
+        self.indexes = indexes
+        self.entities = TtlLruCache(max_size=max_size, ttl=ttl)
+        self.keys = TtlLruCache(max_size=max_size * max(len(indexes), 1), ttl=ttl)
+        self.versions = {}
+        self.evictions = 0
+        self.generation = 0
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count_lookup(self, hit: bool) -> None:
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, index: str, value):
+        id = value if index == "id" else self.keys.get((index, value))
+        entity = self.entities.get(id) if id is not None else None
+        if entity is None or getattr(entity, index) != value:
+            self.count_lookup(False)
+            return None
+        self.count_lookup(True)
+        # Callers are free to modify the model they get, so the cached one is never handed out
+        return copy(entity)
+
+    def get_version(self, index: str, value) -> tuple:
+        # Lookups by another index don't know the id before loading, so any eviction counts
+        with self.lock:
+            if index == "id":
+                return self.generation, value, self.versions.get(value, 0)
+            return self.generation, None, self.evictions
+
+    def set(self, entity, version: tuple) -> None:
+        """`version` must be read with get_version before loading `entity`, so an entity loaded
+        while a write commits isn't stored after that write already evicted it."""
+        generation, id, number = version
+        with self.lock:
+            current = self.versions.get(id, 0) if id is not None else self.evictions
+            if generation != self.generation or current != number:
+                return
+            if id is not None and id != entity.id:
+                return
+            self.entities.set(entity.id, copy(entity))
+            for index in self.indexes:
+                self.keys.set((index, getattr(entity, index)), entity.id)
+
+    def delete(self, id) -> None:
+        with self.lock:
+            self.versions[id] = self.versions.get(id, 0) + 1
+            self.evictions += 1
+            self.entities.delete(id)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.generation += 1
+            self.versions.clear()
+            self.entities.clear()
+            self.keys.clear()
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entities.entries),
+                "max_size": self.entities.max_size,
+                "ttl": self.entities.ttl,
+                "indexes": ["id", *self.indexes],
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,27 @@
+from app.infrastructure.cache.authenticated_user_cache import AuthenticatedUserCache
+from app.infrastructure.cache.ttl_lru_cache import TtlLruCache
+from app.infrastructure.dto.authenticated_user_dto import AuthenticatedUserDTO
+
+
+class InMemoryAuthenticatedUserCache(AuthenticatedUserCache):
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.users = TtlLruCache(max_size=max_size, ttl=ttl)
+        self.emails_by_user_id = TtlLruCache(max_size=max_size, ttl=ttl)
+
+    async def get_user(self, email: str) -> AuthenticatedUserDTO | None:
+        return self.users.get(email)
+
+    async def save_user(self, user: AuthenticatedUserDTO) -> None:
+        self.users.set(user.email, user)
+        self.emails_by_user_id.set(user.id, user.email)
+
+    async def delete_user(self, user_id: int) -> None:
+        self.delete(user_id)
+
+    def delete(self, user_id: int) -> None:
+        if email := self.emails_by_user_id.get(user_id):
+            self.users.delete(email)
+        self.emails_by_user_id.delete(user_id)
+
+    def get_stats(self) -> dict:
+        return {"backend": "memory", **self.users.get_stats()}
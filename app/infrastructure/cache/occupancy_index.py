@@ -0,0 +1,123 @@
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+from time import monotonic
+from typing import Callable
+from loguru import logger
+
+from app.domain.models.day_occupancy_model import DayOccupancyModel
+from app.domain.models.driver_assignment import LocationModel
+
+
+class OccupancyIndex:
+    """Occupancy of the travel dates looked up recently, each loaded with a single query and
+    then kept current by the assignment writes this process commits. Writes committed by other
+    processes are picked up when an entry is `ttl` seconds old: it's loaded again and compared
+    with the one kept in memory, and any drift is logged and counted."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: OrderedDict[date, tuple[float, DayOccupancyModel]] = OrderedDict()
+        self.versions: dict[date, int] = {}
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.reconciliations = 0
+        self.drifts = 0
+
+    def get_missing_dates(self, travel_dates: list[date]) -> list[date]:
+        """Dates that aren't loaded or are due for reconciliation."""
+        now = monotonic()
+        with self.lock:
+            missing_dates = [
+                travel_date
+                for travel_date in travel_dates
+                if travel_date not in self.entries
+                or self.entries[travel_date][0] + self.ttl <= now
+            ]
+            self.misses += len(missing_dates)
+            self.hits += len(travel_dates) - len(missing_dates)
+            return missing_dates
+
+    def get_version(self, travel_date: date) -> int:
+        with self.lock:
+            return self.versions.get(travel_date, 0)
+
+    def set(self, occupancy: DayOccupancyModel, version: int) -> None:
+        """`version` must be read with get_version before loading `occupancy`, so a load that
+        raced with a committed write is dropped instead of hiding that write."""
+        if self.ttl <= 0:
+            return
+        travel_date = occupancy.travel_date
+        with self.lock:
+            if self.versions.get(travel_date, 0) != version:
+                return
+            if travel_date in self.entries:
+                self.reconciliations += 1
+                if self.entries[travel_date][1].assignments != occupancy.assignments:
+                    self.drifts += 1
+                    logger.warning(
+                        "Occupancy index of {} drifted from the database and was reloaded",
+                        travel_date,
+                    )
+            self.entries[travel_date] = (monotonic(), occupancy)
+            self.entries.move_to_end(travel_date)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def read(self, travel_date: date, read_occupancy: Callable):
+        """Runs `read_occupancy` on the loaded occupancy of the date, or returns None when it
+        isn't loaded."""
+        with self.lock:
+            entry = self.entries.get(travel_date)
+            if entry is None:
+                return None
+            self.entries.move_to_end(travel_date)
+            return read_occupancy(entry[1])
+
+    def snapshot(self, driver_assignment, deleted: bool) -> tuple:
+        # Taken at flush time, since the instance is expired once the transaction commits
+        return (
+            driver_assignment.travel_date,
+            driver_assignment.driver_id,
+            driver_assignment.vehicle_id,
+            driver_assignment.destination_location_latitude,
+            driver_assignment.destination_location_longitude,
+            driver_assignment.active and not deleted,
+            deleted,
+        )
+
+    def apply(self, snapshot: tuple) -> None:
+        travel_date, driver_id, vehicle_id, latitude, longitude, active, deleted = snapshot
+        with self.lock:
+            self.versions[travel_date] = self.versions.get(travel_date, 0) + 1
+            entry = self.entries.get(travel_date)
+            if entry is None:
+                return
+            if deleted:
+                entry[1].remove(driver_id, vehicle_id)
+            else:
+                entry[1].add(
+                    driver_id, vehicle_id, LocationModel(latitude, longitude), active
+                )
+
+    def clear(self) -> None:
+        with self.lock:
+            for travel_date in self.entries:
+                self.versions[travel_date] = self.versions.get(travel_date, 0) + 1
+            self.entries.clear()
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self.entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "reconciliations": self.reconciliations,
+                "drifts": self.drifts,
+            }
@@ -0,0 +1,65 @@
+import asyncio
+from anyio import from_thread
+from redis.asyncio import Redis
+
+from app.infrastructure.cache.authenticated_user_cache import AuthenticatedUserCache
+from app.infrastructure.dto.authenticated_user_dto import AuthenticatedUserDTO
+
+
+class RedisAuthenticatedUserCache(AuthenticatedUserCache):
+    def __init__(self, redis_url: str, ttl: int, key_prefix: str = "auth-user") -> None:
+        self.redis = Redis.from_url(redis_url)
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self.pending_deletions = set()
+
+    def get_email_key(self, email: str) -> str:
+        return f"{self.key_prefix}:email:{email}"
+
+    def get_user_id_key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:id:{user_id}"
+
+    async def get_user(self, email: str) -> AuthenticatedUserDTO | None:
+        cached_user = await self.redis.get(self.get_email_key(email))
+        if cached_user is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return AuthenticatedUserDTO.model_validate_json(cached_user)
+
+    async def save_user(self, user: AuthenticatedUserDTO) -> None:
+        async with self.redis.pipeline(transaction=False) as pipeline:
+            pipeline.set(self.get_email_key(user.email), user.model_dump_json(), ex=self.ttl)
+            pipeline.set(self.get_user_id_key(user.id), user.email, ex=self.ttl)
+            await pipeline.execute()
+
+    async def delete_user(self, user_id: int) -> None:
+        user_id_key = self.get_user_id_key(user_id)
+        if email := await self.redis.get(user_id_key):
+            await self.redis.delete(self.get_email_key(email.decode()), user_id_key)
+
+    def delete(self, user_id: int) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Sync sessions commit on a worker thread, which waits for the loop to delete it
+            from_thread.run(self.delete_user, user_id)
+            return
+        deletion = loop.create_task(self.delete_user(user_id))
+        self.pending_deletions.add(deletion)
+        deletion.add_done_callback(self.pending_deletions.discard)
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis",
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    async def close(self) -> None:
+        await self.redis.aclose()
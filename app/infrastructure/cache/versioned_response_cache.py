@@ -0,0 +1,42 @@
+from threading import Lock
+
+from app.infrastructure.cache.ttl_lru_cache import TtlLruCache
+
+
+class VersionedResponseCache:
+    """Caches rendered responses per partition (e.g. a travel date) under the partition's current
+    version. Deleting a partition only bumps its version and clearing bumps every version, so
+    entries built from older data are never served again and simply age out of the LRU."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.entries = TtlLruCache(max_size=max_size, ttl=ttl)
+        self.versions = {}
+        self.generation = 0
+        self.lock = Lock()
+
+    def get_version(self, partition) -> tuple[int, int]:
+        with self.lock:
+            return self.generation, self.versions.get(partition, 0)
+
+    def get(self, partition, key):
+        return self.entries.get((partition, self.get_version(partition), key))
+
+    def set(self, partition, version: tuple[int, int], key, value) -> None:
+        """`version` must be read with get_version before loading the data, so a response built
+        while a write commits is stored under the version that write already replaced."""
+        self.entries.set((partition, version, key), value)
+
+    def delete(self, partition) -> None:
+        with self.lock:
+            self.versions[partition] = self.versions.get(partition, 0) + 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.generation += 1
+            self.versions.clear()
+        self.entries.clear()
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            partitions = len(self.versions)
+        return {**self.entries.get_stats(), "partitions": partitions}
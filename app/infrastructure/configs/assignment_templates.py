@@ -0,0 +1,13 @@
+from os import getenv
+from dotenv import load_dotenv
+
+load_dotenv()
+TEMPLATE_HORIZON_DAYS = int(getenv("TEMPLATE_HORIZON_DAYS", "28"))
+TEMPLATE_MATERIALIZATION_BATCH_SIZE = int(
+    getenv("TEMPLATE_MATERIALIZATION_BATCH_SIZE", "100")
+)
+# Seconds between background materializations; 0 turns them off, e.g. on every worker but
+# one or when they're run with materialize_assignment_templates.py from a scheduler
+TEMPLATE_MATERIALIZATION_INTERVAL = float(
+    getenv("TEMPLATE_MATERIALIZATION_INTERVAL", "3600")
+)
@@ -0,0 +1,22 @@
+from os import getenv
+from dotenv import load_dotenv
+
+from app.infrastructure.services.import_row_stream import (
+    CSV_MEDIA_TYPES,
+    NDJSON_MEDIA_TYPES,
+)
+
+load_dotenv()
+BULK_IMPORT_BATCH_SIZE = int(getenv("BULK_IMPORT_BATCH_SIZE", "500"))
+MAX_SCHEDULE_SIZE = int(getenv("MAX_SCHEDULE_SIZE", "5000"))
+
+# The bulk endpoints stream the body instead of declaring it, so it's documented here
+BULK_IMPORT_OPENAPI_EXTRA = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            media_type: {"schema": {"type": "string"}}
+            for media_type in sorted(NDJSON_MEDIA_TYPES | CSV_MEDIA_TYPES)
+        },
+    }
+}
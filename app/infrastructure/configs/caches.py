@@ -0,0 +1,95 @@
+from os import getenv
+from dotenv import load_dotenv
+
+from app.infrastructure.cache.authenticated_user_cache import AuthenticatedUserCache
+from app.infrastructure.cache.cache_invalidation import (
+    apply_rows_on_commit,
+    clear_cache_on_commit,
+    delete_keys_on_commit,
+)
+from app.infrastructure.cache.entity_cache import EntityCache
+from app.infrastructure.cache.in_memory_authenticated_user_cache import (
+    InMemoryAuthenticatedUserCache,
+)
+from app.infrastructure.cache.occupancy_index import OccupancyIndex
+from app.infrastructure.cache.ttl_lru_cache import TtlLruCache
+from app.infrastructure.cache.versioned_response_cache import VersionedResponseCache
+from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
+from app.infrastructure.entities.driver_entity import Driver
+from app.infrastructure.entities.user_entity import User
+from app.infrastructure.entities.vehicle_entity import Vehicle
+
+load_dotenv()
+metrics_cache = TtlLruCache(
+    max_size=1, ttl=float(getenv("METRICS_CACHE_TTL", "5"))
+)
+clear_cache_on_commit(metrics_cache, Vehicle, User, Driver, DriverAssignment)
+vehicle_cache = EntityCache(
+    max_size=int(getenv("VEHICLE_CACHE_MAX_SIZE", "10000")),
+    ttl=float(getenv("VEHICLE_CACHE_TTL", "300")),
+    indexes=("vin", "plate"),
+)
+delete_keys_on_commit(vehicle_cache, Vehicle, "id")
+driver_cache = EntityCache(
+    max_size=int(getenv("DRIVER_CACHE_MAX_SIZE", "10000")),
+    ttl=float(getenv("DRIVER_CACHE_TTL", "300")),
+    indexes=("curp",),
+)
+delete_keys_on_commit(driver_cache, Driver, "id")
+# Responses embed driver and vehicle details, so changing those invalidates every date
+driver_assignments_response_cache = VersionedResponseCache(
+    max_size=int(getenv("DRIVER_ASSIGNMENTS_CACHE_MAX_SIZE", "1024")),
+    ttl=float(getenv("DRIVER_ASSIGNMENTS_CACHE_TTL", "60")),
+)
+delete_keys_on_commit(driver_assignments_response_cache, DriverAssignment, "travel_date")
+clear_cache_on_commit(driver_assignments_response_cache, Vehicle, Driver)
+# With several API processes, each one only sees the writes of the others after the ttl
+occupancy_index = OccupancyIndex(
+    max_size=int(getenv("OCCUPANCY_INDEX_MAX_SIZE", "400")),
+    ttl=float(getenv("OCCUPANCY_INDEX_TTL", "60")),
+)
+apply_rows_on_commit(occupancy_index, DriverAssignment)
+# Only past days are cached, and a day is dropped when one of its assignments is written
+mileage_cache = VersionedResponseCache(
+    max_size=int(getenv("MILEAGE_CACHE_MAX_SIZE", "1830")),
+    ttl=float(getenv("MILEAGE_CACHE_TTL", "86400")),
+)
+delete_keys_on_commit(mileage_cache, DriverAssignment, "travel_date")
+# Keyed by path, size and mtime, so a rewritten file never reuses a stale hash
+content_hash_cache = TtlLruCache(
+    max_size=int(getenv("CONTENT_HASH_CACHE_MAX_SIZE", "4096")),
+    ttl=float(getenv("CONTENT_HASH_CACHE_TTL", "86400")),
+)
+
+
+def create_authenticated_user_cache() -> AuthenticatedUserCache:
+    ttl = int(getenv("AUTH_CACHE_TTL", "60"))
+    if getenv("AUTH_CACHE_BACKEND", "memory") == "redis":
+        # Imported here so the redis client is only required when it's actually used
+        from app.infrastructure.cache.redis_authenticated_user_cache import (
+            RedisAuthenticatedUserCache,
+        )
+
+        return RedisAuthenticatedUserCache(
+            getenv("REDIS_URL", "redis://localhost:6379/0"), ttl
+        )
+    return InMemoryAuthenticatedUserCache(
+        max_size=int(getenv("AUTH_CACHE_MAX_SIZE", "10000")), ttl=ttl
+    )
+
+
+authenticated_user_cache = create_authenticated_user_cache()
+delete_keys_on_commit(authenticated_user_cache, User, "id")
+
+
+def get_cache_stats() -> dict:
+    return {
+        "metrics": metrics_cache.get_stats(),
+        "vehicles": vehicle_cache.get_stats(),
+        "drivers": driver_cache.get_stats(),
+        "driver_assignments": driver_assignments_response_cache.get_stats(),
+        "occupancy": occupancy_index.get_stats(),
+        "mileage": mileage_cache.get_stats(),
+        "authenticated_users": authenticated_user_cache.get_stats(),
+        "content_hashes": content_hash_cache.get_stats(),
+    }
@@ -0,0 +1,53 @@
+# Run this file to delete the stored pictures and variants no vehicle references anymore
+
+import asyncio
+from argparse import ArgumentParser
+from sqlmodel import Session
+
+from app.infrastructure.configs.sql_database import db_engine
+from app.infrastructure.configs.storage import (
+    picture_storage_backend,
+    picture_storage_service,
+    picture_variant_service,
+)
+from app.infrastructure.queries.vehicle_queries import select_vehicle_pictures
+
+
+def get_referenced_paths() -> set[str]:
+    with Session(db_engine) as session:
+        pictures = session.exec(select_vehicle_pictures()).all()
+    referenced_paths = set(pictures)
+    for picture in pictures:
+        for variant in picture_variant_service.variants:
+            referenced_paths.add(picture_variant_service.get_variant_path(picture, variant))
+    return referenced_paths
+
+
+async def remove_unreferenced_pictures(grace_period: float, dry_run: bool) -> list[str]:
+    await picture_storage_backend.initialize()
+    try:
+        return await picture_storage_service.remove_unreferenced_files(
+            get_referenced_paths(), grace_period, dry_run
+        )
+    finally:
+        await picture_storage_backend.close()
+
+
+if __name__ == "__main__":
+    argument_parser = ArgumentParser()
+    argument_parser.add_argument(
+        "--grace-period",
+        type=float,
+        default=3600,
+        help="Seconds a file must be untouched before it can be deleted",
+    )
+    argument_parser.add_argument("--dry-run", action="store_true")
+    arguments = argument_parser.parse_args()
+    removed_paths = asyncio.run(
+        remove_unreferenced_pictures(arguments.grace_period, arguments.dry_run)
+    )
+    for removed_path in removed_paths:
+        print(removed_path)
+    print(
+        f"{'Would remove' if arguments.dry_run else 'Removed'} {len(removed_paths)} files"
+    )
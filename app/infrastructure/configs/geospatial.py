@@ -0,0 +1,9 @@
+from os import getenv
+from dotenv import load_dotenv
+
+load_dotenv()
+DESTINATION_CONFLICT_RADIUS_KM = (
+    float(getenv("DESTINATION_CONFLICT_RADIUS_METERS", "0")) / 1000
+)
+NEARBY_MAX_RADIUS_KM = float(getenv("NEARBY_MAX_RADIUS_KM", "50"))
+NEARBY_MAX_RANGE_DAYS = int(getenv("NEARBY_MAX_RANGE_DAYS", "31"))
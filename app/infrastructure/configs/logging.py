@@ -0,0 +1,73 @@
+import json
+import random
+from datetime import datetime, timedelta
+from os import getenv
+from traceback import format_exception
+from dotenv import load_dotenv
+from loguru import logger
+
+load_dotenv()
+log_level = getenv("LOG_LEVEL", "INFO").upper()
+log_file = getenv("LOG_FILE", "logs/app.log")
+log_rotation_size = int(getenv("LOG_ROTATION_SIZE_MB", "100")) * 1024 * 1024
+log_rotation_hours = int(getenv("LOG_ROTATION_HOURS", "24"))
+log_retention = getenv("LOG_RETENTION", "14 days")
+log_compression = getenv("LOG_COMPRESSION", "gz")
+debug_sample_rate = float(getenv("LOG_DEBUG_SAMPLE_RATE", "1"))
+debug_level_no = logger.level("DEBUG").no
+
+
+class SizeOrTimeRotation:
+    def __init__(self, max_size: int, interval: timedelta) -> None:
+        self.max_size = max_size
+        self.interval = interval
+        self.rotate_at = datetime.now() + interval
+
+    def __call__(self, message, file) -> bool:
+        if file.tell() + len(message) > self.max_size or datetime.now() >= self.rotate_at:
+            self.rotate_at = datetime.now() + self.interval
+            return True
+        return False
+
+
+def sample_debug_records(record) -> bool:
+    return record["level"].no > debug_level_no or random.random() < debug_sample_rate
+
+
+def format_json_record(record) -> str:
+    record["extra"]["json"] = json.dumps(
+        {
+            "timestamp": record["time"].isoformat(),
+            "level": record["level"].name,
+            "message": record["message"],
+            "module": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+            "process": record["process"].id,
+            "thread": record["thread"].name,
+            **{key: value for key, value in record["extra"].items() if key != "json"},
+            **(
+                {"exception": "".join(format_exception(*record["exception"]))}
+                if record["exception"]
+                else {}
+            ),
+        },
+        default=str,
+    )
+    return "{extra[json]}\n"
+
+
+def configure_logging() -> None:
+    logger.remove()
+    logger.add(
+        log_file,
+        format=format_json_record,
+        level=log_level,
+        filter=sample_debug_records,
+        enqueue=True,
+        rotation=SizeOrTimeRotation(
+            log_rotation_size, timedelta(hours=log_rotation_hours)
+        ),
+        retention=log_retention,
+        compression=log_compression,
+    )
@@ -0,0 +1,33 @@
+# Run this file to create the assignments of the recurring templates, e.g. from a daily cron job
+
+import asyncio
+from argparse import ArgumentParser
+from datetime import date
+
+from app.infrastructure.configs.sql_database import async_db_engine
+from app.infrastructure.services.assignment_template_materializer import (
+    materialize_assignment_templates,
+)
+
+
+async def run_materialization(today: date):
+    try:
+        return await materialize_assignment_templates(today)
+    finally:
+        if async_db_engine:
+            await async_db_engine.dispose()
+
+
+if __name__ == "__main__":
+    argument_parser = ArgumentParser()
+    argument_parser.add_argument(
+        "--today",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="Date the materialization horizon starts at, as YYYY-MM-DD",
+    )
+    arguments = argument_parser.parse_args()
+    summary = asyncio.run(run_materialization(arguments.today))
+    print(
+        f"Materialized {summary.templates} templates: {summary.created} assignments created, {summary.exceptions} exceptions recorded"
+    )
@@ -0,0 +1,5 @@
+from os import getenv
+from dotenv import load_dotenv
+
+load_dotenv()
+MILEAGE_MAX_RANGE_DAYS = int(getenv("MILEAGE_MAX_RANGE_DAYS", "731"))
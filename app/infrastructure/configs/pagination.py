@@ -0,0 +1,18 @@
+from os import getenv
+from typing import Annotated
+from dotenv import load_dotenv
+from fastapi import Query, Response
+
+from app.domain.models.page_model import PageModel
+
+load_dotenv()
+DEFAULT_PAGE_SIZE = int(getenv("DEFAULT_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(getenv("MAX_PAGE_SIZE", "1000"))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+
+
+def set_next_cursor_header(response: Response, page: PageModel):
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
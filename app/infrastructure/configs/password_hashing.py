@@ -0,0 +1,21 @@
+from os import cpu_count, getenv
+from dotenv import load_dotenv
+
+from app.infrastructure.security.bcrypt_password_encryptor_impl import (
+    BcryptPasswordEncryptorImpl,
+)
+from app.infrastructure.security.password_hashing_pool import PasswordHashingPool
+
+load_dotenv()
+password_hashing_workers = int(
+    getenv("PASSWORD_HASHING_WORKERS", str(min(cpu_count() or 1, 4)))
+)
+password_hashing_pool = PasswordHashingPool(
+    max_workers=password_hashing_workers,
+    max_pending=int(
+        getenv("PASSWORD_HASHING_MAX_PENDING", str(password_hashing_workers * 8))
+    ),
+)
+password_encryptor = BcryptPasswordEncryptorImpl(
+    password_hashing_pool, rounds=int(getenv("PASSWORD_HASH_ROUNDS", "12"))
+)
@@ -0,0 +1,113 @@
+from anyio import to_thread
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from app.infrastructure.configs.caches import get_cache_stats
+from app.infrastructure.configs.password_hashing import password_hashing_pool
+from app.infrastructure.configs.sql_database import get_pool_status
+
+
+class RuntimeStatsCollector(Collector):
+    """Exposes the stats already kept by the pools and caches at scrape time."""
+
+    def describe(self):
+        # Skips the collect() call register() would make outside of the event loop
+        return []
+
+    def collect(self):
+        yield from self.collect_database_pools()
+        yield from self.collect_caches()
+        yield from self.collect_password_hashing()
+        yield from self.collect_threadpool()
+
+    def collect_database_pools(self):
+        connections = GaugeMetricFamily(
+            "db_pool_connections",
+            "Connections held by the database pool",
+            labels=["engine", "state"],
+        )
+        events = CounterMetricFamily(
+            "db_pool_events",
+            "Database pool connection events",
+            labels=["engine", "event"],
+        )
+        for engine, pool_status in get_pool_status().items():
+            connections.add_metric([engine, "checked_in"], pool_status["checked_in"])
+            connections.add_metric([engine, "checked_out"], pool_status["checked_out"])
+            for event in ("connects", "checkouts", "checkins", "invalidations"):
+                events.add_metric([engine, event], pool_status[event])
+        yield connections
+        yield events
+
+    def collect_caches(self):
+        hits = CounterMetricFamily("cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "Cache misses", labels=["cache"])
+        entries = GaugeMetricFamily(
+            "cache_entries", "Entries held by in-memory caches", labels=["cache"]
+        )
+        for cache, cache_stats in get_cache_stats().items():
+            hits.add_metric([cache], cache_stats["hits"])
+            misses.add_metric([cache], cache_stats["misses"])
+            if "size" in cache_stats:
+                entries.add_metric([cache], cache_stats["size"])
+        yield hits
+        yield misses
+        yield entries
+
+    def collect_password_hashing(self):
+        password_hashing_stats = password_hashing_pool.get_stats()
+        yield GaugeMetricFamily(
+            "password_hashing_pending",
+            "Password hashing jobs submitted and not finished",
+            value=password_hashing_stats["pending"],
+        )
+        yield CounterMetricFamily(
+            "password_hashing_rejected",
+            "Password hashing jobs rejected because the queue was full",
+            value=password_hashing_stats["rejected"],
+        )
+        operations = CounterMetricFamily(
+            "password_hashing_operations",
+            "Password hashing jobs completed",
+            labels=["operation"],
+        )
+        queue_wait = CounterMetricFamily(
+            "password_hashing_queue_wait_seconds",
+            "Time password hashing jobs waited for a worker process",
+            labels=["operation"],
+        )
+        duration = CounterMetricFamily(
+            "password_hashing_duration_seconds",
+            "Time spent hashing or verifying passwords",
+            labels=["operation"],
+        )
+        for operation, operation_stats in password_hashing_stats["operations"].items():
+            operations.add_metric([operation], operation_stats["count"])
+            queue_wait.add_metric(
+                [operation], operation_stats["queue_wait_seconds_total"]
+            )
+            duration.add_metric([operation], operation_stats["duration_seconds_total"])
+        yield operations
+        yield queue_wait
+        yield duration
+
+    def collect_threadpool(self):
+        # The default limiter belongs to the running event loop, so scrapes must be served by
+        # an async endpoint
+        thread_limiter = to_thread.current_default_thread_limiter()
+        yield GaugeMetricFamily(
+            "threadpool_threads",
+            "Worker threads available to run blocking calls",
+            value=thread_limiter.total_tokens,
+        )
+        yield GaugeMetricFamily(
+            "threadpool_threads_busy",
+            "Worker threads currently running blocking calls",
+            value=thread_limiter.borrowed_tokens,
+        )
+        yield GaugeMetricFamily(
+            "threadpool_tasks_waiting",
+            "Blocking calls waiting for a free worker thread",
+            value=thread_limiter.statistics().tasks_waiting,
+        )
+
@@ -0,0 +1,36 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+DATABASE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests",
+    ["method", "route"],
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+    ["method"],
+)
+http_responses_total = Counter(
+    "http_responses_total",
+    "HTTP responses sent",
+    ["method", "route", "status"],
+)
+db_statement_duration_seconds = Histogram(
+    "db_statement_duration_seconds",
+    "Time spent executing SQL statements",
+    ["engine", "operation"],
+    buckets=DATABASE_BUCKETS,
+)
+db_pool_checkout_wait_seconds = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["engine"],
+    buckets=DATABASE_BUCKETS,
+)
+threadpool_wait_seconds = Histogram(
+    "threadpool_wait_seconds",
+    "Time repository calls wait for a free worker thread",
+    buckets=DATABASE_BUCKETS,
+)
@@ -0,0 +1,185 @@
+from typing import Annotated
+from fastapi import Depends
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.application.repositories.async_assignment_template_repository import (
+    AsyncAssignmentTemplateRepository,
+)
+from app.application.repositories.async_driver_assignment_repository import (
+    AsyncDriverAssignmentRepository,
+)
+from app.application.repositories.async_driver_repository import AsyncDriverRepository
+from app.application.repositories.async_invitation_code_repository import (
+    AsyncInvitationCodeRepository,
+)
+from app.application.repositories.async_mileage_repository import (
+    AsyncMileageRepository,
+)
+from app.application.repositories.async_metrics_repository import (
+    AsyncMetricsRepository,
+)
+from app.application.repositories.async_user_repository import AsyncUserRepository
+from app.application.repositories.async_vehicle_repository import (
+    AsyncVehicleRepository,
+)
+from app.infrastructure.configs.caches import (
+    authenticated_user_cache,
+    driver_cache,
+    occupancy_index,
+    vehicle_cache,
+)
+from app.infrastructure.configs.sql_database import get_db_session
+from app.infrastructure.repositories.async_relational_database_assignment_template_repository_impl import (
+    AsyncRelationalDatabaseAssignmentTemplateRepositoryImpl,
+)
+from app.infrastructure.repositories.async_relational_database_driver_assignment_repository_impl import (
+    AsyncRelationalDatabaseDriverAssignmentRepositoryImpl,
+)
+from app.infrastructure.repositories.async_relational_database_driver_repository_impl import (
+    AsyncRelationalDatabaseDriverRepositoryImpl,
+)
+from app.infrastructure.repositories.async_relational_database_invitation_code_repository_impl import (
+    AsyncRelationalDatabaseInvitationCodeRepositoryImpl,
+)
+from app.infrastructure.repositories.async_relational_database_mileage_repository_impl import (
+    AsyncRelationalDatabaseMileageRepositoryImpl,
+)
+from app.infrastructure.repositories.async_relational_database_metrics_repository_impl import (
+    AsyncRelationalDatabaseMetricsRepositoryImpl,
+)
+from app.infrastructure.repositories.async_relational_database_user_repository_impl import (
+    AsyncRelationalDatabaseUserRepositoryImpl,
+)
+from app.infrastructure.repositories.async_relational_database_vehicle_repository_impl import (
+    AsyncRelationalDatabaseVehicleRepositoryImpl,
+)
+from app.infrastructure.repositories.cache_invalidating_user_repository import (
+    CacheInvalidatingUserRepository,
+)
+from app.infrastructure.repositories.caching_driver_repository import (
+    CachingDriverRepository,
+)
+from app.infrastructure.repositories.caching_vehicle_repository import (
+    CachingVehicleRepository,
+)
+from app.infrastructure.repositories.occupancy_indexed_driver_assignment_repository import (
+    OccupancyIndexedDriverAssignmentRepository,
+)
+from app.infrastructure.repositories.relational_database_assignment_template_repository_impl import (
+    RelationalDatabaseAssignmentTemplateRepositoryImpl,
+)
+from app.infrastructure.repositories.relational_database_driver_assignment_repository_impl import (
+    RelationalDatabaseDriverAssignmentRepositoryImpl,
+)
+from app.infrastructure.repositories.relational_database_driver_repository_impl import (
+    RelationalDatabaseDriverRepositoryImpl,
+)
+from app.infrastructure.repositories.relational_database_invitation_code_repository_impl import (
+    RelationalDatabaseInvitationCodeRepositoryImpl,
+)
+from app.infrastructure.repositories.relational_database_mileage_repository_impl import (
+    RelationalDatabaseMileageRepositoryImpl,
+)
+from app.infrastructure.repositories.relational_database_metrics_repository_impl import (
+    RelationalDatabaseMetricsRepositoryImpl,
+)
+from app.infrastructure.repositories.relational_database_user_repository_impl import (
+    RelationalDatabaseUserRepositoryImpl,
+)
+from app.infrastructure.repositories.relational_database_vehicle_repository_impl import (
+    RelationalDatabaseVehicleRepositoryImpl,
+)
+from app.infrastructure.repositories.threaded_repository_adapter import (
+    ThreadedRepositoryAdapter,
+)
+
+
+async def get_assignment_template_repository(
+    session: Annotated[Session | AsyncSession, Depends(get_db_session)],
+) -> AsyncAssignmentTemplateRepository:
+    if isinstance(session, AsyncSession):
+        return AsyncRelationalDatabaseAssignmentTemplateRepositoryImpl(session)
+    return ThreadedRepositoryAdapter(
+        RelationalDatabaseAssignmentTemplateRepositoryImpl(session)
+    )
+
+
+async def get_driver_assignment_repository(
+    session: Annotated[Session | AsyncSession, Depends(get_db_session)],
+) -> AsyncDriverAssignmentRepository:
+    if isinstance(session, AsyncSession):
+        driver_assignment_repository = (
+            AsyncRelationalDatabaseDriverAssignmentRepositoryImpl(session)
+        )
+    else:
+        driver_assignment_repository = ThreadedRepositoryAdapter(
+            RelationalDatabaseDriverAssignmentRepositoryImpl(session)
+        )
+    if occupancy_index.ttl <= 0:
+        return driver_assignment_repository
+    return OccupancyIndexedDriverAssignmentRepository(
+        driver_assignment_repository, occupancy_index
+    )
+
+
+async def get_driver_repository(
+    session: Annotated[Session | AsyncSession, Depends(get_db_session)],
+) -> AsyncDriverRepository:
+    if isinstance(session, AsyncSession):
+        driver_repository = AsyncRelationalDatabaseDriverRepositoryImpl(session)
+    else:
+        driver_repository = ThreadedRepositoryAdapter(
+            RelationalDatabaseDriverRepositoryImpl(session)
+        )
+    return CachingDriverRepository(driver_repository, driver_cache)
+
+
+async def get_invitation_code_repository(
+    session: Annotated[Session | AsyncSession, Depends(get_db_session)],
+) -> AsyncInvitationCodeRepository:
+    if isinstance(session, AsyncSession):
+        return AsyncRelationalDatabaseInvitationCodeRepositoryImpl(session)
+    return ThreadedRepositoryAdapter(
+        RelationalDatabaseInvitationCodeRepositoryImpl(session)
+    )
+
+
+async def get_metrics_repository(
+    session: Annotated[Session | AsyncSession, Depends(get_db_session)],
+) -> AsyncMetricsRepository:
+    if isinstance(session, AsyncSession):
+        return AsyncRelationalDatabaseMetricsRepositoryImpl(session)
+    return ThreadedRepositoryAdapter(RelationalDatabaseMetricsRepositoryImpl(session))
+
+
+async def get_mileage_repository(
+    session: Annotated[Session | AsyncSession, Depends(get_db_session)],
+) -> AsyncMileageRepository:
+    if isinstance(session, AsyncSession):
+        return AsyncRelationalDatabaseMileageRepositoryImpl(session)
+    return ThreadedRepositoryAdapter(RelationalDatabaseMileageRepositoryImpl(session))
+
+
+async def get_user_repository(
+    session: Annotated[Session | AsyncSession, Depends(get_db_session)],
+) -> AsyncUserRepository:
+    if isinstance(session, AsyncSession):
+        user_repository = AsyncRelationalDatabaseUserRepositoryImpl(session)
+    else:
+        user_repository = ThreadedRepositoryAdapter(
+            RelationalDatabaseUserRepositoryImpl(session)
+        )
+    return CacheInvalidatingUserRepository(user_repository, authenticated_user_cache)
+
+
+async def get_vehicle_repository(
+    session: Annotated[Session | AsyncSession, Depends(get_db_session)],
+) -> AsyncVehicleRepository:
+    if isinstance(session, AsyncSession):
+        vehicle_repository = AsyncRelationalDatabaseVehicleRepositoryImpl(session)
+    else:
+        vehicle_repository = ThreadedRepositoryAdapter(
+            RelationalDatabaseVehicleRepositoryImpl(session)
+        )
+    return CachingVehicleRepository(vehicle_repository, vehicle_cache)
@@ -1,10 +1,176 @@
+from contextlib import asynccontextmanager
 from os import getenv
+from time import perf_counter
+from anyio import to_thread
 from dotenv import load_dotenv
-from sqlmodel import SQLModel, create_engine
+from sqlalchemy import AsyncAdaptedQueuePool, Engine, QueuePool, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.infrastructure.configs.prometheus_metrics import (
+    db_pool_checkout_wait_seconds,
+    db_statement_duration_seconds,
+)
+from app.infrastructure.migrations.migration_runner import run_migrations
+
+
+class CheckoutTimingMixin:
+    engine_name = ""
+
+    # QueuePool._do_get blocks until a connection is free or pool_timeout expires
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait_seconds.labels(self.engine_name).observe(
+                perf_counter() - start
+            )
+
+
+class TimedQueuePool(CheckoutTimingMixin, QueuePool):
+    engine_name = "sync"
+
+
+class TimedAsyncAdaptedQueuePool(CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    engine_name = "async"
+
 
 load_dotenv()
 database_url = getenv("DATABASE_URL", "")
-db_engine = create_engine(database_url)
+database_mode = getenv("DATABASE_MODE", "sync")
+pool_options = {
+    "pool_size": int(getenv("DB_POOL_SIZE", "10")),
+    "max_overflow": int(getenv("DB_POOL_MAX_OVERFLOW", "20")),
+    "pool_timeout": float(getenv("DB_POOL_TIMEOUT", "30")),
+    # Must stay below MariaDB's wait_timeout so idle connections are never reused after the server drops them
+    "pool_recycle": int(getenv("DB_POOL_RECYCLE", "3600")),
+    "pool_pre_ping": getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+}
+db_engine = create_engine(database_url, poolclass=TimedQueuePool, **pool_options)
+async_db_engine = None
+if database_mode == "async":
+    async_db_engine = create_async_engine(
+        getenv("ASYNC_DATABASE_URL", database_url.replace("+pymysql", "+aiomysql")),
+        poolclass=TimedAsyncAdaptedQueuePool,
+        **pool_options,
+    )
+
+pool_counters = {}
+
+
+def instrument_pool(engine: Engine, name: str):
+    counters = {"connects": 0, "checkouts": 0, "checkins": 0, "invalidations": 0}
+    pool_counters[name] = counters
+
+    @event.listens_for(engine, "connect")
+    def count_pool_connect(dbapi_connection, connection_record):
+        counters["connects"] += 1
+
+    @event.listens_for(engine, "checkout")
+    def count_pool_checkout(dbapi_connection, connection_record, connection_proxy):
+        counters["checkouts"] += 1
+
+    @event.listens_for(engine, "checkin")
+    def count_pool_checkin(dbapi_connection, connection_record):
+        counters["checkins"] += 1
+
+    @event.listens_for(engine, "invalidate")
+    def count_pool_invalidation(dbapi_connection, connection_record, exception):
+        counters["invalidations"] += 1
+
+
+SQL_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+def instrument_statements(engine: Engine, name: str):
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_statement_timer(
+        connection, cursor, statement, parameters, context, executemany
+    ):
+        connection.info.setdefault("statement_start_times", []).append(perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def observe_statement_duration(
+        connection, cursor, statement, parameters, context, executemany
+    ):
+        duration = perf_counter() - connection.info["statement_start_times"].pop()
+        operation = statement.lstrip().split(None, 1)[0].upper()
+        if operation not in SQL_OPERATIONS:
+            operation = "OTHER"
+        db_statement_duration_seconds.labels(name, operation).observe(duration)
+
+    @event.listens_for(engine, "handle_error")
+    def discard_statement_timer(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("statement_start_times"):
+            connection.info["statement_start_times"].pop()
+
+
+instrument_pool(db_engine, "sync")
+instrument_statements(db_engine, "sync")
+if async_db_engine:
+    instrument_pool(async_db_engine.sync_engine, "async")
+    instrument_statements(async_db_engine.sync_engine, "async")
+
 
 def create_db_and_tables():
-    SQLModel.metadata.create_all(db_engine)
\ No newline at end of file
+    run_migrations(db_engine)
+
+
+def get_sync_db_session():
+    with Session(db_engine) as session:
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+
+async def get_async_db_session():
+    async with AsyncSession(async_db_engine, expire_on_commit=False) as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+get_db_session = (
+    get_async_db_session if database_mode == "async" else get_sync_db_session
+)
+
+
+@asynccontextmanager
+async def open_db_session():
+    """The transaction of get_db_session, for work that runs outside of a request."""
+    if database_mode == "async":
+        async with asynccontextmanager(get_async_db_session)() as session:
+            yield session
+        return
+    with Session(db_engine) as session:
+        try:
+            yield session
+            await to_thread.run_sync(session.commit)
+        except Exception:
+            session.rollback()
+            raise
+
+
+def get_pool_status() -> dict:
+    engines = {"sync": db_engine}
+    if async_db_engine:
+        engines["async"] = async_db_engine.sync_engine
+    return {
+        name: {
+            "size": engine.pool.size(),
+            "checked_in": engine.pool.checkedin(),
+            "checked_out": engine.pool.checkedout(),
+            "overflow": engine.pool.overflow(),
+            **pool_counters[name],
+        }
+        for name, engine in engines.items()
+    }
@@ -0,0 +1,55 @@
+import os
+from os import getenv
+from dotenv import load_dotenv
+
+from app.infrastructure.configs.caches import content_hash_cache
+from app.infrastructure.services.picture_variant_service import (
+    PictureVariantService,
+    parse_picture_variants,
+)
+from app.infrastructure.services.storage_service import StorageService
+from app.infrastructure.storage.local_storage_backend import LocalStorageBackend
+from app.infrastructure.storage.storage_backend import StorageBackend
+
+load_dotenv()
+
+local_storage_root = getenv("LOCAL_STORAGE_ROOT", ".")
+pictures_prefix = getenv("PICTURES_DIRECTORY", "pictures").strip("/")
+picture_max_size = int(getenv("PICTURE_MAX_SIZE_MB", "10")) * 1024 * 1024
+picture_cache_control = getenv("PICTURE_CACHE_CONTROL", "private, max-age=300")
+
+
+def create_storage_backend() -> StorageBackend:
+    if getenv("STORAGE_BACKEND", "local") == "s3":
+        # Imported here so boto3 is only required when it's actually used
+        from app.infrastructure.storage.s3_storage_backend import S3StorageBackend
+
+        return S3StorageBackend(
+            bucket=getenv("S3_BUCKET", "fleet-manager"),
+            endpoint_url=getenv("S3_ENDPOINT_URL") or None,
+            region=getenv("S3_REGION", "us-east-1"),
+            access_key_id=getenv("S3_ACCESS_KEY_ID") or None,
+            secret_access_key=getenv("S3_SECRET_ACCESS_KEY") or None,
+            max_connections=int(getenv("S3_MAX_CONNECTIONS", "20")),
+            multipart_threshold=int(getenv("S3_MULTIPART_THRESHOLD_MB", "8")) * 1024 * 1024,
+            multipart_chunk_size=int(getenv("S3_MULTIPART_CHUNK_SIZE_MB", "8")) * 1024 * 1024,
+        )
+    return LocalStorageBackend(local_storage_root, content_hash_cache)
+
+
+picture_storage_backend = create_storage_backend()
+picture_storage_service = StorageService(
+    picture_storage_backend,
+    pictures_prefix,
+    # Next to the pictures by default so the local backend stores an upload with a rename
+    getenv(
+        "PICTURE_UPLOAD_DIRECTORY",
+        os.path.join(local_storage_root, pictures_prefix, ".uploads"),
+    ),
+    picture_max_size,
+    getenv("PICTURE_STORAGE_MODE", "content_addressed") == "content_addressed",
+)
+picture_variant_service = PictureVariantService(
+    picture_storage_service,
+    parse_picture_variants(getenv("PICTURE_VARIANTS", "thumbnail:64,medium:640")),
+)
@@ -1,4 +1,8 @@
 openapi_tags = [
+    {
+        "name": "Analytics",
+        "description": "These routes are used to report on the fleet usage.",
+    },
     {
         "name": "Authorization",
         "description": "These routes are used to handle user registration and login.",
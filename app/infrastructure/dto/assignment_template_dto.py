@@ -0,0 +1,40 @@
+from pydantic import BaseModel, Field
+from datetime import date, datetime
+
+from app.domain.models.assignment_template_model import TEMPLATE_SKIPPED
+from app.infrastructure.dto.driver_assignment_dto import LocationDTO
+
+
+class AssignmentTemplateRequestDTO(BaseModel):
+    driver_id: int
+    vehicle_id: int
+    route_name: str
+    origin_location: LocationDTO
+    destination_location: LocationDTO
+    comments: str | None = None
+    recurrence_rule: str = Field(examples=["FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"])
+    start_date: date
+
+
+class AssignmentTemplateExceptionRequestDTO(BaseModel):
+    travel_date: date
+    reason: str = TEMPLATE_SKIPPED
+
+
+class AssignmentTemplateExceptionDTO(BaseModel):
+    travel_date: date
+    reason: str
+
+
+class AssignmentTemplateResponseDTO(AssignmentTemplateRequestDTO):
+    id: int
+    active: bool
+    materialized_until: date | None
+    creation_date: datetime
+    exceptions: list[AssignmentTemplateExceptionDTO]
+
+
+class MaterializationSummaryDTO(BaseModel):
+    templates: int
+    created: int
+    exceptions: int
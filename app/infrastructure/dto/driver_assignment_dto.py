@@ -42,3 +42,7 @@ class DriverAssignmentResponseDTO(DriverAssignmentRequestDTO):
     active: bool
     driver: DriverDTO
     vehicle: VehicleDTO
+
+
+class NearbyDriverAssignmentResponseDTO(DriverAssignmentResponseDTO):
+    distance_km: float
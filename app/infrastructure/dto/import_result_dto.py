@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class ImportResultDTO(BaseModel):
+    row: int
+    status: str
+    detail: str | None = None
+
+
+class ImportReportDTO(BaseModel):
+    created: int
+    rejected: int
+    rows: list[ImportResultDTO]
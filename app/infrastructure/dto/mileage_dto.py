@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from datetime import date
+
+
+class DayMileageDTO(BaseModel):
+    travel_date: date
+    assignments: int
+    km: float
+
+
+class VehicleMileageDTO(BaseModel):
+    vehicle_id: int
+    assignments: int
+    km: float
+
+
+class DriverMileageDTO(BaseModel):
+    driver_id: int
+    assignments: int
+    km: float
+
+
+class MileageReportDTO(BaseModel):
+    date_from: date
+    date_to: date
+    assignments: int
+    km: float
+    days: list[DayMileageDTO]
+    vehicles: list[VehicleMileageDTO]
+    drivers: list[DriverMileageDTO]
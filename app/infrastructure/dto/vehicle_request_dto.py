@@ -9,7 +9,7 @@ class VehicleRequestDTO(BaseModel):
     plate: str
     purchase_date: str | datetime
     cost: float
-    picture: str
+    picture: str | None = None
 
     @validator("purchase_date", pre=True, always=True)
     def parse_purchase_date(cls, value):
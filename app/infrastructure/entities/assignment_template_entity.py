@@ -0,0 +1,45 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from sqlalchemy import Index
+from sqlmodel import Field, Relationship, SQLModel
+
+
+class AssignmentTemplate(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_assignmenttemplate_active_materialized_until",
+            "active",
+            "materialized_until",
+        ),
+    )
+    id: int | None = Field(default=None, primary_key=True)
+    driver_id: int = Field(foreign_key="driver.id")
+    vehicle_id: int = Field(foreign_key="vehicle.id")
+    route_name: str
+    origin_location_latitude: Decimal = Field(default=0, max_digits=9, decimal_places=6)
+    origin_location_longitude: Decimal = Field(
+        default=0, max_digits=9, decimal_places=6
+    )
+    destination_location_latitude: Decimal = Field(
+        default=0, max_digits=9, decimal_places=6
+    )
+    destination_location_longitude: Decimal = Field(
+        default=0, max_digits=9, decimal_places=6
+    )
+    comments: str | None = None
+    recurrence_rule: str
+    start_date: date
+    active: bool = Field(default=True)
+    materialized_until: date | None = None
+    creation_date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    exceptions: list["AssignmentTemplateException"] = Relationship(
+        back_populates="template"
+    )
+
+
+class AssignmentTemplateException(SQLModel, table=True):
+    template_id: int = Field(foreign_key="assignmenttemplate.id", primary_key=True)
+    travel_date: date = Field(primary_key=True)
+    reason: str
+    creation_date: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    template: AssignmentTemplate = Relationship(back_populates="exceptions")
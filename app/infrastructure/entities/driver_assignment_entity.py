@@ -1,12 +1,37 @@
 from datetime import date, datetime, timezone
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 from decimal import Decimal
 
+from app.domain.models.geo_location import GEOHASH_PRECISION
 from app.infrastructure.entities.driver_entity import Driver
 from app.infrastructure.entities.vehicle_entity import Vehicle
 
 
 class DriverAssignment(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_driverassignment_travel_date_active", "travel_date", "active"),
+        Index("ix_driverassignment_driver_id_travel_date", "driver_id", "travel_date"),
+        Index(
+            "ix_driverassignment_vehicle_id_travel_date", "vehicle_id", "travel_date"
+        ),
+        Index(
+            "ix_driverassignment_travel_date_destination",
+            "travel_date",
+            "destination_location_latitude",
+            "destination_location_longitude",
+        ),
+        Index(
+            "ix_driverassignment_origin_geohash_travel_date",
+            "origin_geohash",
+            "travel_date",
+        ),
+        Index(
+            "ix_driverassignment_destination_geohash_travel_date",
+            "destination_geohash",
+            "travel_date",
+        ),
+    )
     driver_id: int | None = Field(foreign_key="driver.id", primary_key=True)
     vehicle_id: int | None = Field(foreign_key="vehicle.id", primary_key=True)
     travel_date: date = Field(primary_key=True)
@@ -21,6 +46,8 @@ class DriverAssignment(SQLModel, table=True):
     destination_location_longitude: Decimal = Field(
         default=0, max_digits=9, decimal_places=6
     )
+    origin_geohash: str | None = Field(default=None, max_length=GEOHASH_PRECISION)
+    destination_geohash: str | None = Field(default=None, max_length=GEOHASH_PRECISION)
     completed_successfully: bool = Field(default=False)
     problem_description: str | None = None
     comments: str | None = None
@@ -1,5 +1,6 @@
 import uuid
 from typing import TYPE_CHECKING
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 # Removing circular references on runtime execution
@@ -8,6 +9,7 @@ if TYPE_CHECKING:
 
 
 class InvitationCode(SQLModel, table=True):
+    __table_args__ = (Index("ux_invitationcode_email", "email", unique=True),)
     code: str | None = Field(default=uuid.uuid4, primary_key=True)
     email: str
     created_by_user: int = Field(foreign_key="user.id")
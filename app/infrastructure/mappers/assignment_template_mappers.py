@@ -0,0 +1,157 @@
+from app.domain.models.assignment_template_model import (
+    AssignmentTemplateExceptionModel,
+    AssignmentTemplateModel,
+    MaterializationSummaryModel,
+)
+from app.domain.models.driver_assignment import LocationModel
+from app.infrastructure.dto.assignment_template_dto import (
+    AssignmentTemplateExceptionDTO,
+    AssignmentTemplateRequestDTO,
+    AssignmentTemplateResponseDTO,
+    MaterializationSummaryDTO,
+)
+from app.infrastructure.dto.driver_assignment_dto import LocationDTO
+from app.infrastructure.entities.assignment_template_entity import (
+    AssignmentTemplate,
+    AssignmentTemplateException,
+)
+
+
+def map_assignment_template_dto_to_assignment_template_model(
+    assignment_template_req_dto: AssignmentTemplateRequestDTO,
+) -> AssignmentTemplateModel:
+    return AssignmentTemplateModel(
+        driver_id=assignment_template_req_dto.driver_id,
+        vehicle_id=assignment_template_req_dto.vehicle_id,
+        route_name=assignment_template_req_dto.route_name,
+        origin_location=LocationModel(
+            latitude=assignment_template_req_dto.origin_location.latitude,
+            longitude=assignment_template_req_dto.origin_location.longitude,
+        ),
+        destination_location=LocationModel(
+            latitude=assignment_template_req_dto.destination_location.latitude,
+            longitude=assignment_template_req_dto.destination_location.longitude,
+        ),
+        recurrence_rule=assignment_template_req_dto.recurrence_rule,
+        start_date=assignment_template_req_dto.start_date,
+        comments=assignment_template_req_dto.comments,
+    )
+
+
+def map_assignment_template_model_to_assignment_template_dto(
+    assignment_template: AssignmentTemplateModel,
+) -> AssignmentTemplateResponseDTO:
+    return AssignmentTemplateResponseDTO(
+        id=assignment_template.id,
+        driver_id=assignment_template.driver_id,
+        vehicle_id=assignment_template.vehicle_id,
+        route_name=assignment_template.route_name,
+        origin_location=LocationDTO(
+            latitude=assignment_template.origin_location.latitude,
+            longitude=assignment_template.origin_location.longitude,
+        ),
+        destination_location=LocationDTO(
+            latitude=assignment_template.destination_location.latitude,
+            longitude=assignment_template.destination_location.longitude,
+        ),
+        comments=assignment_template.comments,
+        recurrence_rule=assignment_template.recurrence_rule,
+        start_date=assignment_template.start_date,
+        active=assignment_template.active,
+        materialized_until=assignment_template.materialized_until,
+        creation_date=assignment_template.creation_date,
+        exceptions=[
+            AssignmentTemplateExceptionDTO(
+                travel_date=exception.travel_date, reason=exception.reason
+            )
+            for exception in assignment_template.exceptions
+        ],
+    )
+
+
+def map_assignment_template_model_to_assignment_template_entity(
+    assignment_template: AssignmentTemplateModel,
+) -> AssignmentTemplate:
+    return AssignmentTemplate(
+        id=assignment_template.id,
+        driver_id=assignment_template.driver_id,
+        vehicle_id=assignment_template.vehicle_id,
+        route_name=assignment_template.route_name,
+        origin_location_latitude=assignment_template.origin_location.latitude,
+        origin_location_longitude=assignment_template.origin_location.longitude,
+        destination_location_latitude=assignment_template.destination_location.latitude,
+        destination_location_longitude=assignment_template.destination_location.longitude,
+        comments=assignment_template.comments,
+        recurrence_rule=assignment_template.recurrence_rule,
+        start_date=assignment_template.start_date,
+        active=assignment_template.active,
+        materialized_until=assignment_template.materialized_until,
+    )
+
+
+def map_assignment_template_exception_entity_to_assignment_template_exception_model(
+    exception_entity: AssignmentTemplateException,
+) -> AssignmentTemplateExceptionModel:
+    return AssignmentTemplateExceptionModel(
+        template_id=exception_entity.template_id,
+        travel_date=exception_entity.travel_date,
+        reason=exception_entity.reason,
+    )
+
+
+def map_assignment_template_exception_model_to_assignment_template_exception_entity(
+    exception: AssignmentTemplateExceptionModel,
+) -> AssignmentTemplateException:
+    return AssignmentTemplateException(
+        template_id=exception.template_id,
+        travel_date=exception.travel_date,
+        reason=exception.reason,
+    )
+
+
+def map_assignment_template_entity_to_assignment_template_model(
+    assignment_template_entity: AssignmentTemplate, with_exceptions: bool = True
+) -> AssignmentTemplateModel:
+    # The exceptions are only mapped when the statement loaded them, so async sessions
+    # never try to lazy load them
+    return AssignmentTemplateModel(
+        id=assignment_template_entity.id,
+        driver_id=assignment_template_entity.driver_id,
+        vehicle_id=assignment_template_entity.vehicle_id,
+        route_name=assignment_template_entity.route_name,
+        origin_location=LocationModel(
+            latitude=assignment_template_entity.origin_location_latitude,
+            longitude=assignment_template_entity.origin_location_longitude,
+        ),
+        destination_location=LocationModel(
+            latitude=assignment_template_entity.destination_location_latitude,
+            longitude=assignment_template_entity.destination_location_longitude,
+        ),
+        comments=assignment_template_entity.comments,
+        recurrence_rule=assignment_template_entity.recurrence_rule,
+        start_date=assignment_template_entity.start_date,
+        active=assignment_template_entity.active,
+        materialized_until=assignment_template_entity.materialized_until,
+        creation_date=assignment_template_entity.creation_date,
+        exceptions=[
+            map_assignment_template_exception_entity_to_assignment_template_exception_model(
+                exception_entity
+            )
+            for exception_entity in sorted(
+                assignment_template_entity.exceptions,
+                key=lambda exception_entity: exception_entity.travel_date,
+            )
+        ]
+        if with_exceptions
+        else [],
+    )
+
+
+def map_materialization_summary_model_to_materialization_summary_dto(
+    summary: MaterializationSummaryModel,
+) -> MaterializationSummaryDTO:
+    return MaterializationSummaryDTO(
+        templates=summary.templates,
+        created=summary.created,
+        exceptions=summary.exceptions,
+    )
@@ -2,13 +2,16 @@ from app.domain.models.driver_assignment import (
     Driver,
     DriverAssignmentModel,
     LocationModel,
+    NearbyDriverAssignmentModel,
     Vehicle,
 )
+from app.domain.models.geo_location import encode_geohash
 from app.infrastructure.dto.driver_assignment_dto import (
     DriverAssignmentRequestDTO,
     DriverAssignmentResponseDTO,
     DriverDTO,
     LocationDTO,
+    NearbyDriverAssignmentResponseDTO,
     VehicleDTO,
 )
 from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
@@ -72,6 +75,22 @@ def map_driver_assignment_model_to_driver_assignment_dto(
     )
 
 
+def map_location_dto_to_location_model(location_dto: LocationDTO) -> LocationModel:
+    return LocationModel(latitude=location_dto.latitude, longitude=location_dto.longitude)
+
+
+def map_nearby_driver_assignment_model_to_nearby_driver_assignment_dto(
+    nearby_driver_assignment: NearbyDriverAssignmentModel,
+) -> NearbyDriverAssignmentResponseDTO:
+    driver_assignment_dto = map_driver_assignment_model_to_driver_assignment_dto(
+        nearby_driver_assignment.driver_assignment
+    )
+    return NearbyDriverAssignmentResponseDTO(
+        **dict(driver_assignment_dto),
+        distance_km=round(nearby_driver_assignment.distance_km, 3),
+    )
+
+
 def map_driver_assignment_model_to_driver_assignment_entity(
     driver_assignment: DriverAssignmentModel,
 ) -> DriverAssignment:
@@ -84,6 +103,14 @@ def map_driver_assignment_model_to_driver_assignment_entity(
         origin_location_longitude=driver_assignment.origin_location.longitude,
         destination_location_latitude=driver_assignment.destination_location.latitude,
         destination_location_longitude=driver_assignment.destination_location.longitude,
+        origin_geohash=encode_geohash(
+            driver_assignment.origin_location.latitude,
+            driver_assignment.origin_location.longitude,
+        ),
+        destination_geohash=encode_geohash(
+            driver_assignment.destination_location.latitude,
+            driver_assignment.destination_location.longitude,
+        ),
         completed_successfully=driver_assignment.completed_successfully,
         problem_description=driver_assignment.problem_description,
         comments=driver_assignment.comments,
@@ -0,0 +1,18 @@
+from app.domain.models.import_result_model import IMPORT_CREATED, ImportResultModel
+from app.infrastructure.dto.import_result_dto import ImportReportDTO, ImportResultDTO
+
+
+def map_import_results_to_import_report_dto(
+    import_results: list[ImportResultModel],
+) -> ImportReportDTO:
+    created = sum(result.status == IMPORT_CREATED for result in import_results)
+    return ImportReportDTO(
+        created=created,
+        rejected=len(import_results) - created,
+        rows=[
+            ImportResultDTO(
+                row=result.number, status=result.status, detail=result.detail
+            )
+            for result in import_results
+        ],
+    )
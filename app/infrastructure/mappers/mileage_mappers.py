@@ -0,0 +1,74 @@
+from datetime import date
+import numpy as np
+
+from app.domain.models.mileage_model import (
+    MileageReportModel,
+    MileageTotalsModel,
+    RouteColumnsModel,
+)
+from app.infrastructure.dto.mileage_dto import (
+    DayMileageDTO,
+    DriverMileageDTO,
+    MileageReportDTO,
+    VehicleMileageDTO,
+)
+
+KM_DECIMALS = 3
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def map_route_rows_to_route_columns_model(rows: list) -> RouteColumnsModel:
+    travel_dates, driver_ids, vehicle_ids, *coordinates = zip(*rows) if rows else [()] * 7
+    # Going through the ordinals is much faster than numpy parsing each date object
+    travel_date_ordinals = np.fromiter(
+        map(date.toordinal, travel_dates), dtype=np.int64, count=len(rows)
+    )
+    coordinates = np.array(coordinates, dtype=np.float64).reshape(4, -1)
+    return RouteColumnsModel(
+        travel_dates=(travel_date_ordinals - EPOCH_ORDINAL).astype("datetime64[D]"),
+        driver_ids=np.array(driver_ids, dtype=np.int64),
+        vehicle_ids=np.array(vehicle_ids, dtype=np.int64),
+        origin_latitudes=coordinates[0],
+        origin_longitudes=coordinates[1],
+        destination_latitudes=coordinates[2],
+        destination_longitudes=coordinates[3],
+    )
+
+
+def map_mileage_totals_model_to_rows(mileage_totals: MileageTotalsModel) -> zip:
+    return zip(
+        mileage_totals.ids.tolist(),
+        mileage_totals.assignments.tolist(),
+        np.round(mileage_totals.km, KM_DECIMALS).tolist(),
+    )
+
+
+def map_mileage_report_model_to_mileage_report_dto(
+    mileage_report: MileageReportModel,
+) -> MileageReportDTO:
+    return MileageReportDTO(
+        date_from=mileage_report.date_from,
+        date_to=mileage_report.date_to,
+        assignments=mileage_report.assignments,
+        km=round(mileage_report.km, KM_DECIMALS),
+        days=[
+            DayMileageDTO(
+                travel_date=day.travel_date,
+                assignments=day.assignments,
+                km=round(day.km, KM_DECIMALS),
+            )
+            for day in mileage_report.days
+        ],
+        vehicles=[
+            VehicleMileageDTO(vehicle_id=vehicle_id, assignments=assignments, km=km)
+            for vehicle_id, assignments, km in map_mileage_totals_model_to_rows(
+                mileage_report.vehicles
+            )
+        ],
+        drivers=[
+            DriverMileageDTO(driver_id=driver_id, assignments=assignments, km=km)
+            for driver_id, assignments, km in map_mileage_totals_model_to_rows(
+                mileage_report.drivers
+            )
+        ],
+    )
@@ -2,15 +2,18 @@ from jose import JWTError
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
 
+from app.application.repositories.async_user_repository import AsyncUserRepository
+from app.infrastructure.configs.caches import authenticated_user_cache
+from app.infrastructure.configs.repository_providers import get_user_repository
 from app.infrastructure.dto.authenticated_user_dto import AuthenticatedUserDTO
-from app.infrastructure.repositories.relational_database_user_repository_impl import (
-    RelationalDatabaseUserRepositoryImpl,
-)
 from app.infrastructure.security.security_scheme import SECURITY_SCHEME
 from app.infrastructure.security.json_web_token_tools import JsonWebTokenTools
 
 
-async def protect_route_middlware(token: Annotated[str, Depends(SECURITY_SCHEME)]):
+async def protect_route_middlware(
+    token: Annotated[str, Depends(SECURITY_SCHEME)],
+    user_repository: Annotated[AsyncUserRepository, Depends(get_user_repository)],
+):
     credentials_exception = HTTPException(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
@@ -25,14 +28,18 @@ async def protect_route_middlware(token: Annotated[str, Depends(SECURITY_SCHEME)
         if user_email is None:
             raise credentials_exception
 
-        user_repository = RelationalDatabaseUserRepositoryImpl()
-        user = user_repository.get_user_by_email(user_email)
+        if authenticated_user := await authenticated_user_cache.get_user(user_email):
+            return authenticated_user
+
+        user = await user_repository.get_user_by_email(user_email)
 
         if user is None or not user.id:
             raise credentials_exception
 
-        return AuthenticatedUserDTO(
+        authenticated_user = AuthenticatedUserDTO(
             email=user.email, id=user.id, last_name=user.last_name, name=user.name
         )
+        await authenticated_user_cache.save_user(authenticated_user)
+        return authenticated_user
     except JWTError:
         raise credentials_exception
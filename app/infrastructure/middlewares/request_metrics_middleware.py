@@ -0,0 +1,42 @@
+from time import perf_counter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.configs.prometheus_metrics import (
+    http_request_duration_seconds,
+    http_requests_in_progress,
+    http_responses_total,
+)
+from app.infrastructure.middlewares.server_error_middleware import get_route_path
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        response_status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal response_status
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+            await send(message)
+
+        in_progress = http_requests_in_progress.labels(method)
+        in_progress.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_progress.dec()
+            # The route is only known once the router has matched the request
+            route = get_route_path(scope)
+            http_request_duration_seconds.labels(method, route).observe(
+                perf_counter() - start
+            )
+            http_responses_total.labels(method, route, response_status).inc()
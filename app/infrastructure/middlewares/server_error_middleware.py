@@ -1,19 +1,59 @@
-from typing import Union
-from fastapi import Response
 from fastapi.responses import JSONResponse
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+route_error_counters = {}
+
+
+def get_route_path(scope: Scope) -> str:
+    route = scope.get("route")
+    return route.path if route else "<unmatched>"
+
+
+def get_route_label(scope: Scope) -> str:
+    return f"{scope['method']} {get_route_path(scope)}"
+
+
+def count_route_error(scope: Scope, status_code: int):
+    route_label = get_route_label(scope)
+    counters = route_error_counters.setdefault(route_label, {})
+    counters[status_code] = counters.get(status_code, 0) + 1
+
+
+def get_route_error_counts() -> dict:
+    return {
+        route_label: dict(counters)
+        for route_label, counters in route_error_counters.items()
+    }
+
+
+class ServerErrorMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_status = None
+
+        async def send_wrapper(message: Message):
+            nonlocal response_status
+            if message["type"] == "http.response.start":
+                response_status = message["status"]
+                if response_status >= 500:
+                    count_route_error(scope, response_status)
+                    logger.error(f"API RESPONSE {response_status} - {scope['method']} {scope['path']}")
+            await send(message)
 
-class ServerErrorMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-    
-    async def dispatch(self, request, call_next) -> Union[JSONResponse, Response]:
         try:
-            response = await call_next(request)
-            if response.status_code >= 500:
-                logger.error(f"API RESPONSE {response.status_code} - {request.method} {request.url} - {response.body.decode('utf-8')}")
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.error(f"API RESPONSE 500 - {request.method} {request.url} - {str(e)}")
-            return JSONResponse(status_code=500, content={"error": str(e)})
\ No newline at end of file
+            logger.error(f"API RESPONSE 500 - {scope['method']} {scope['path']} - {str(e)}")
+            if response_status is not None:
+                # Headers are already on the wire, the connection can only be dropped
+                raise
+            count_route_error(scope, 500)
+            response = JSONResponse(status_code=500, content={"error": str(e)})
+            await response(scope, receive, send)
@@ -0,0 +1,93 @@
+# Run this file to EXPLAIN the driver assignment queries and fail when one of them needs a full table scan
+
+import sys
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import ClauseElement, Executable
+from sqlalchemy.ext.compiler import compiles
+from loguru import logger
+
+from app.domain.models.driver_assignment import LocationModel
+from app.domain.models.geo_location import get_geohash_cells_around
+from app.infrastructure.configs.sql_database import db_engine
+from app.infrastructure.queries.driver_assignment_queries import (
+    select_active_destinations_in_geohash_cells,
+    select_active_driver_assignment_by_destination_location_at_date,
+    select_active_driver_assignments_with_driver_id_or_vehicle_id_at_date,
+    select_driver_assignment_locations_in_geohash_cells,
+    select_driver_assignments,
+)
+from app.infrastructure.queries.metrics_queries import count_today_assignments
+
+
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement) -> None:
+        self.statement = statement
+
+
+@compiles(Explain)
+def compile_explain(element: Explain, compiler, **kwargs) -> str:
+    prefix = "EXPLAIN QUERY PLAN" if compiler.dialect.name == "sqlite" else "EXPLAIN"
+    return f"{prefix} {compiler.process(element.statement, **kwargs)}"
+
+
+def get_checked_queries() -> dict:
+    travel_date = date.today()
+    location = LocationModel(latitude=Decimal("19.4"), longitude=Decimal("-99.1"))
+    return {
+        "assignments at date": select_driver_assignments(travel_date=travel_date),
+        "active assignments at date": select_driver_assignments(
+            only_actives=True, travel_date=travel_date
+        ),
+        "driver history": select_driver_assignments(driver_id=1),
+        "vehicle history": select_driver_assignments(vehicle_id=1),
+        "driver or vehicle taken at date": select_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+            1, 1, travel_date
+        ),
+        "destination taken at date": select_active_driver_assignment_by_destination_location_at_date(
+            location, travel_date
+        ),
+        "destinations near at date": select_active_destinations_in_geohash_cells(
+            get_geohash_cells_around(location, 0.05), travel_date
+        ),
+        "assignments near": select_driver_assignment_locations_in_geohash_cells(
+            get_geohash_cells_around(location, 10), by_origin=False
+        ),
+        "assignments near by origin": select_driver_assignment_locations_in_geohash_cells(
+            get_geohash_cells_around(location, 10), by_origin=True
+        ),
+        "today assignments count": count_today_assignments(),
+    }
+
+
+def is_full_scan(plan: list[dict]) -> bool:
+    for step in plan:
+        if "detail" in step:
+            detail = step["detail"]
+            if detail.startswith("SCAN driverassignment"):
+                return True
+        elif step["table"] == "driverassignment" and not step["possible_keys"]:
+            return True
+    return False
+
+
+def check_query_plans() -> bool:
+    all_indexed = True
+    with db_engine.connect() as connection:
+        for name, statement in get_checked_queries().items():
+            plan = [
+                dict(step._mapping)
+                for step in connection.execute(Explain(statement))
+            ]
+            if is_full_scan(plan):
+                all_indexed = False
+                logger.error(f"Full scan on driverassignment - {name}: {plan}")
+            else:
+                logger.info(f"Index used - {name}: {plan}")
+    return all_indexed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_query_plans() else 1)
@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    insert,
+    select,
+)
+from loguru import logger
+
+from app.infrastructure.migrations.versions import (
+    v0001_create_tables,
+    v0002_driver_assignment_indexes,
+    v0003_invitation_code_unique_email,
+    v0004_assignment_templates,
+    v0005_driver_assignment_geohashes,
+)
+
+# Append new migrations at the end; a version is never edited once it has been released.
+# Every upgrade must be idempotent because v0001 creates fresh databases from the current models
+MIGRATIONS = [
+    v0001_create_tables,
+    v0002_driver_assignment_indexes,
+    v0003_invitation_code_unique_email,
+    v0004_assignment_templates,
+    v0005_driver_assignment_geohashes,
+]
+
+migration_metadata = MetaData()
+schema_migration = Table(
+    "schema_migration",
+    migration_metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def get_applied_versions(engine: Engine) -> set[int]:
+    migration_metadata.create_all(engine)
+    with engine.connect() as connection:
+        return set(connection.scalars(select(schema_migration.c.version)))
+
+
+def run_migrations(engine: Engine) -> None:
+    applied_versions = get_applied_versions(engine)
+    for migration in MIGRATIONS:
+        if migration.version in applied_versions:
+            continue
+        logger.info(f"Applying migration {migration.version}: {migration.description}")
+        with engine.begin() as connection:
+            migration.upgrade(connection)
+            connection.execute(
+                insert(schema_migration).values(
+                    version=migration.version,
+                    description=migration.description,
+                    applied_at=datetime.now(timezone.utc),
+                )
+            )
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Connection, Index, inspect, text
+
+
+def create_index_if_missing(connection: Connection, index: Index) -> None:
+    existing_indexes = inspect(connection).get_indexes(index.table.name)
+    if index.name not in {existing_index["name"] for existing_index in existing_indexes}:
+        index.create(connection)
+
+
+def add_column_if_missing(connection: Connection, column: Column) -> None:
+    existing_columns = inspect(connection).get_columns(column.table.name)
+    if column.name not in {existing_column["name"] for existing_column in existing_columns}:
+        preparer = connection.dialect.identifier_preparer
+        connection.execute(
+            text(
+                f"ALTER TABLE {preparer.format_table(column.table)} "
+                f"ADD COLUMN {preparer.format_column(column)} "
+                f"{column.type.compile(dialect=connection.dialect)}"
+            )
+        )
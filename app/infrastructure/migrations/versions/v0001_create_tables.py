@@ -0,0 +1,15 @@
+from sqlalchemy import Connection
+from sqlmodel import SQLModel
+
+from app.infrastructure.entities.driver_entity import Driver  # noqa: F401
+from app.infrastructure.entities.driver_assignment_entity import DriverAssignment  # noqa: F401
+from app.infrastructure.entities.invitation_code_entity import InvitationCode  # noqa: F401
+from app.infrastructure.entities.user_entity import User  # noqa: F401
+from app.infrastructure.entities.vehicle_entity import Vehicle  # noqa: F401
+
+version = 1
+description = "Create the tables that don't exist yet"
+
+
+def upgrade(connection: Connection) -> None:
+    SQLModel.metadata.create_all(connection)
@@ -0,0 +1,19 @@
+from sqlalchemy import Connection
+
+from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
+from app.infrastructure.migrations.migration_tools import create_index_if_missing
+
+version = 2
+description = "Add composite indexes for the driver assignment access paths"
+index_names = (
+    "ix_driverassignment_travel_date_active",
+    "ix_driverassignment_driver_id_travel_date",
+    "ix_driverassignment_vehicle_id_travel_date",
+    "ix_driverassignment_travel_date_destination",
+)
+
+
+def upgrade(connection: Connection) -> None:
+    for index in DriverAssignment.__table__.indexes:
+        if index.name in index_names:
+            create_index_if_missing(connection, index)
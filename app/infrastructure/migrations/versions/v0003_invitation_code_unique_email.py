@@ -0,0 +1,14 @@
+from sqlalchemy import Connection
+
+from app.infrastructure.entities.invitation_code_entity import InvitationCode
+from app.infrastructure.migrations.migration_tools import create_index_if_missing
+
+version = 3
+description = "Enforce a single invitation code per email"
+index_names = ("ux_invitationcode_email",)
+
+
+def upgrade(connection: Connection) -> None:
+    for index in InvitationCode.__table__.indexes:
+        if index.name in index_names:
+            create_index_if_missing(connection, index)
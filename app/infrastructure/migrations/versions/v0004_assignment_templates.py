@@ -0,0 +1,17 @@
+from sqlalchemy import Connection
+from sqlmodel import SQLModel
+
+from app.infrastructure.entities.assignment_template_entity import (
+    AssignmentTemplate,
+    AssignmentTemplateException,
+)
+
+version = 4
+description = "Create the recurring assignment template tables"
+
+
+def upgrade(connection: Connection) -> None:
+    SQLModel.metadata.create_all(
+        connection,
+        tables=[AssignmentTemplate.__table__, AssignmentTemplateException.__table__],
+    )
@@ -0,0 +1,77 @@
+from sqlalchemy import Connection, bindparam, or_, select, update
+
+from app.domain.models.geo_location import encode_geohash
+from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
+from app.infrastructure.migrations.migration_tools import (
+    add_column_if_missing,
+    create_index_if_missing,
+)
+
+version = 5
+description = "Add geohash columns and indexes for the driver assignment locations"
+index_names = (
+    "ix_driverassignment_origin_geohash_travel_date",
+    "ix_driverassignment_destination_geohash_travel_date",
+)
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_geohashes(connection: Connection) -> None:
+    table = DriverAssignment.__table__
+    statement = (
+        select(
+            table.c.driver_id,
+            table.c.vehicle_id,
+            table.c.travel_date,
+            table.c.origin_location_latitude,
+            table.c.origin_location_longitude,
+            table.c.destination_location_latitude,
+            table.c.destination_location_longitude,
+        )
+        .where(
+            or_(table.c.origin_geohash.is_(None), table.c.destination_geohash.is_(None))
+        )
+        .limit(BACKFILL_BATCH_SIZE)
+    )
+    set_geohashes = (
+        update(table)
+        .where(
+            table.c.driver_id == bindparam("row_driver_id"),
+            table.c.vehicle_id == bindparam("row_vehicle_id"),
+            table.c.travel_date == bindparam("row_travel_date"),
+        )
+        .values(
+            origin_geohash=bindparam("row_origin_geohash"),
+            destination_geohash=bindparam("row_destination_geohash"),
+        )
+    )
+    # Every batch fills the geohashes it selected, so the next one starts after them
+    while rows := connection.execute(statement).all():
+        connection.execute(
+            set_geohashes,
+            [
+                {
+                    "row_driver_id": row.driver_id,
+                    "row_vehicle_id": row.vehicle_id,
+                    "row_travel_date": row.travel_date,
+                    "row_origin_geohash": encode_geohash(
+                        row.origin_location_latitude, row.origin_location_longitude
+                    ),
+                    "row_destination_geohash": encode_geohash(
+                        row.destination_location_latitude,
+                        row.destination_location_longitude,
+                    ),
+                }
+                for row in rows
+            ],
+        )
+
+
+def upgrade(connection: Connection) -> None:
+    table = DriverAssignment.__table__
+    add_column_if_missing(connection, table.c.origin_geohash)
+    add_column_if_missing(connection, table.c.destination_geohash)
+    backfill_geohashes(connection)
+    for index in table.indexes:
+        if index.name in index_names:
+            create_index_if_missing(connection, index)
@@ -0,0 +1,54 @@
+from datetime import date
+from sqlalchemy import update
+from sqlalchemy.orm import selectinload
+from sqlmodel import or_, select
+
+from app.infrastructure.entities.assignment_template_entity import (
+    AssignmentTemplate,
+    AssignmentTemplateException,
+)
+
+ASSIGNMENT_TEMPLATE_PAGE_ORDER = (AssignmentTemplate.id,)
+TEMPLATE_EXCEPTIONS = (selectinload(AssignmentTemplate.exceptions),)
+
+
+def select_assignment_templates(only_actives: bool = False):
+    statement = select(AssignmentTemplate).options(*TEMPLATE_EXCEPTIONS)
+    if only_actives:
+        statement = statement.where(AssignmentTemplate.active)
+    return statement
+
+
+def select_assignment_templates_to_materialize(
+    materialize_until: date, after_id: int, limit: int
+):
+    return (
+        select(AssignmentTemplate)
+        .where(
+            AssignmentTemplate.active,
+            or_(
+                AssignmentTemplate.materialized_until.is_(None),
+                AssignmentTemplate.materialized_until < materialize_until,
+            ),
+            AssignmentTemplate.id > after_id,
+        )
+        .order_by(AssignmentTemplate.id)
+        .limit(limit)
+    )
+
+
+def select_assignment_template_exception_dates(template_ids: list[int], from_date: date):
+    return select(
+        AssignmentTemplateException.template_id, AssignmentTemplateException.travel_date
+    ).where(
+        AssignmentTemplateException.template_id.in_(template_ids),
+        AssignmentTemplateException.travel_date >= from_date,
+    )
+
+
+def update_materialized_until(template_ids: list[int], materialized_until: date):
+    return (
+        update(AssignmentTemplate)
+        .where(AssignmentTemplate.id.in_(template_ids))
+        .values(materialized_until=materialized_until)
+    )
@@ -0,0 +1,276 @@
+from datetime import date
+from sqlalchemy import insert, literal, tuple_, union_all
+from sqlalchemy.orm import joinedload
+from sqlmodel import or_, select
+
+from app.domain.models.driver_assignment import DriverAssignmentIdModel, LocationModel
+from app.domain.models.geo_location import GEOHASH_ALPHABET, GEOHASH_PRECISION
+from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
+from app.infrastructure.entities.driver_entity import Driver
+from app.infrastructure.entities.vehicle_entity import Vehicle
+
+DRIVER_ASSIGNMENT_PAGE_ORDER = (
+    DriverAssignment.travel_date,
+    DriverAssignment.creation_date,
+    DriverAssignment.driver_id,
+    DriverAssignment.vehicle_id,
+)
+# Every assignment is mapped together with its driver and vehicle, so both are joined
+# into the same statement instead of being lazy loaded one row at a time
+RELATED_ENTITIES = (
+    joinedload(DriverAssignment.driver, innerjoin=True),
+    joinedload(DriverAssignment.vehicle, innerjoin=True),
+)
+LOCATION_ATTRIBUTES = [
+    "origin_location_latitude",
+    "origin_location_longitude",
+    "destination_location_latitude",
+    "destination_location_longitude",
+]
+
+
+def select_driver_assignments(
+    only_actives: bool = False,
+    travel_date: date | None = None,
+    travel_date_from: date | None = None,
+    travel_date_to: date | None = None,
+    driver_id: int | None = None,
+    vehicle_id: int | None = None,
+):
+    statement = select(DriverAssignment).options(*RELATED_ENTITIES)
+    if travel_date:
+        statement = statement.where(DriverAssignment.travel_date == travel_date)
+    if travel_date_from:
+        statement = statement.where(DriverAssignment.travel_date >= travel_date_from)
+    if travel_date_to:
+        statement = statement.where(DriverAssignment.travel_date <= travel_date_to)
+    if driver_id is not None:
+        statement = statement.where(DriverAssignment.driver_id == driver_id)
+    if vehicle_id is not None:
+        statement = statement.where(DriverAssignment.vehicle_id == vehicle_id)
+    if only_actives:
+        statement = statement.where(DriverAssignment.active)
+    return statement
+
+
+def driver_or_vehicle_taken_at_date(driver_id: int, vehicle_id: int, travel_date: date):
+    return (
+        or_(
+            DriverAssignment.driver_id == driver_id,
+            DriverAssignment.vehicle_id == vehicle_id,
+        ),
+        DriverAssignment.travel_date == travel_date,
+        DriverAssignment.active,
+    )
+
+
+def destination_taken_at_date(location: LocationModel, travel_date: date):
+    return (
+        DriverAssignment.travel_date == travel_date,
+        DriverAssignment.destination_location_latitude == location.latitude,
+        DriverAssignment.destination_location_longitude == location.longitude,
+        DriverAssignment.active,
+    )
+
+
+def select_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+    driver_id: int, vehicle_id: int, travel_date: date
+):
+    return (
+        select(DriverAssignment)
+        .options(*RELATED_ENTITIES)
+        .where(*driver_or_vehicle_taken_at_date(driver_id, vehicle_id, travel_date))
+    )
+
+
+def select_active_driver_assignment_by_destination_location_at_date(
+    location: LocationModel,
+    travel_date: date,
+    exclude_assignment: DriverAssignmentIdModel | None = None,
+):
+    statement = (
+        select(DriverAssignment)
+        .options(*RELATED_ENTITIES)
+        .where(*destination_taken_at_date(location, travel_date))
+    )
+    if exclude_assignment:
+        statement = statement.where(other_than_driver_assignment(exclude_assignment))
+    return statement
+
+
+def select_is_driver_or_vehicle_taken_at_date(
+    driver_id: int, vehicle_id: int, travel_date: date
+):
+    return select(
+        select(DriverAssignment.driver_id)
+        .where(*driver_or_vehicle_taken_at_date(driver_id, vehicle_id, travel_date))
+        .exists()
+    )
+
+
+def select_is_destination_taken_at_date(
+    location: LocationModel,
+    travel_date: date,
+    exclude_assignment: DriverAssignmentIdModel | None = None,
+):
+    statement = select(DriverAssignment.driver_id).where(
+        *destination_taken_at_date(location, travel_date)
+    )
+    if exclude_assignment:
+        statement = statement.where(other_than_driver_assignment(exclude_assignment))
+    return select(statement.exists())
+
+
+def other_than_driver_assignment(driver_assignment_id: DriverAssignmentIdModel):
+    return or_(
+        DriverAssignment.driver_id != driver_assignment_id.driver_id,
+        DriverAssignment.vehicle_id != driver_assignment_id.vehicle_id,
+    )
+
+
+def geohash_in_cells(geohash_column, cells: list[str]):
+    # Geohashes are all stored with the same precision, so the ones inside a cell sort between
+    # the cell itself and the cell padded with the last character of the alphabet
+    return or_(
+        *(
+            geohash_column.between(
+                cell, cell.ljust(GEOHASH_PRECISION, GEOHASH_ALPHABET[-1])
+            )
+            for cell in cells
+        )
+    )
+
+
+def select_active_destinations_in_geohash_cells(
+    cells: list[str] | None,
+    travel_date: date,
+    exclude_assignment: DriverAssignmentIdModel | None = None,
+):
+    statement = select(
+        DriverAssignment.destination_location_latitude,
+        DriverAssignment.destination_location_longitude,
+    ).where(DriverAssignment.travel_date == travel_date, DriverAssignment.active)
+    if cells is not None:
+        statement = statement.where(
+            geohash_in_cells(DriverAssignment.destination_geohash, cells)
+        )
+    if exclude_assignment:
+        statement = statement.where(other_than_driver_assignment(exclude_assignment))
+    return statement
+
+
+def select_driver_assignment_locations_in_geohash_cells(
+    cells: list[str] | None,
+    by_origin: bool,
+    travel_date_from: date,
+    travel_date_to: date,
+    only_actives: bool = False,
+):
+    if by_origin:
+        latitude = DriverAssignment.origin_location_latitude
+        longitude = DriverAssignment.origin_location_longitude
+        geohash = DriverAssignment.origin_geohash
+    else:
+        latitude = DriverAssignment.destination_location_latitude
+        longitude = DriverAssignment.destination_location_longitude
+        geohash = DriverAssignment.destination_geohash
+    statement = select(
+        DriverAssignment.driver_id,
+        DriverAssignment.vehicle_id,
+        DriverAssignment.travel_date,
+        latitude,
+        longitude,
+    ).where(
+        DriverAssignment.travel_date >= travel_date_from,
+        DriverAssignment.travel_date <= travel_date_to,
+    )
+    if cells is not None:
+        statement = statement.where(geohash_in_cells(geohash, cells))
+    if only_actives:
+        statement = statement.where(DriverAssignment.active)
+    return statement
+
+
+def select_driver_assignments_by_ids(
+    driver_assignment_ids: list[DriverAssignmentIdModel],
+):
+    return (
+        select(DriverAssignment)
+        .options(*RELATED_ENTITIES)
+        .where(
+            tuple_(
+                DriverAssignment.driver_id,
+                DriverAssignment.vehicle_id,
+                DriverAssignment.travel_date,
+            ).in_(
+                [
+                    (
+                        driver_assignment_id.driver_id,
+                        driver_assignment_id.vehicle_id,
+                        driver_assignment_id.travel_date,
+                    )
+                    for driver_assignment_id in driver_assignment_ids
+                ]
+            )
+        )
+    )
+
+
+def insert_driver_assignment_if_available(
+    driver_assignment_entity: DriverAssignment, destination_location: LocationModel
+):
+    """INSERT ... SELECT that only writes the assignment when its driver and vehicle exist, neither
+    is in another active assignment that day and no active assignment that day has the same
+    destination, so the checks and the write are a single statement. The row count tells
+    whether it was written."""
+    columns = DriverAssignment.__table__.columns
+    values = select(
+        *(
+            literal(getattr(driver_assignment_entity, column.name), column.type)
+            for column in columns
+        )
+    ).where(
+        select(Driver.id).where(Driver.id == driver_assignment_entity.driver_id).exists(),
+        select(Vehicle.id)
+        .where(Vehicle.id == driver_assignment_entity.vehicle_id)
+        .exists(),
+        ~select(DriverAssignment.driver_id)
+        .where(
+            *driver_or_vehicle_taken_at_date(
+                driver_assignment_entity.driver_id,
+                driver_assignment_entity.vehicle_id,
+                driver_assignment_entity.travel_date,
+            )
+        )
+        .exists(),
+        ~select(DriverAssignment.driver_id)
+        .where(
+            *destination_taken_at_date(
+                destination_location, driver_assignment_entity.travel_date
+            )
+        )
+        .exists(),
+    )
+    return insert(DriverAssignment.__table__).from_select(
+        [column.name for column in columns], values
+    )
+
+
+def select_occupancy_at_dates(travel_dates: list[date]):
+    return select(
+        DriverAssignment.driver_id,
+        DriverAssignment.vehicle_id,
+        DriverAssignment.travel_date,
+        DriverAssignment.destination_location_latitude,
+        DriverAssignment.destination_location_longitude,
+        DriverAssignment.active,
+    ).where(DriverAssignment.travel_date.in_(travel_dates))
+
+
+def select_existing_driver_and_vehicle_ids(
+    driver_ids: list[int], vehicle_ids: list[int]
+):
+    return union_all(
+        select(literal("driver"), Driver.id).where(Driver.id.in_(driver_ids)),
+        select(literal("vehicle"), Vehicle.id).where(Vehicle.id.in_(vehicle_ids)),
+    )
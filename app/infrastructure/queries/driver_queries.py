@@ -0,0 +1,20 @@
+from sqlmodel import or_, select
+
+from app.infrastructure.entities.driver_entity import Driver
+
+DRIVER_PAGE_ORDER = (Driver.id,)
+
+
+def select_drivers(name: str | None = None, last_name: str | None = None):
+    statement = select(Driver)
+    if name:
+        statement = statement.where(Driver.first_name == name)
+    if last_name:
+        statement = statement.where(Driver.last_name == last_name)
+    return statement
+
+
+def select_taken_driver_keys(curps: list[str], license_numbers: list[str]):
+    return select(Driver.curp, Driver.license_number).where(
+        or_(Driver.curp.in_(curps), Driver.license_number.in_(license_numbers))
+    )
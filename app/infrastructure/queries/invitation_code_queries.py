@@ -0,0 +1,13 @@
+from sqlmodel import or_, select
+
+from app.infrastructure.entities.invitation_code_entity import InvitationCode
+from app.infrastructure.entities.user_entity import User
+
+
+def select_email_in_use(email: str):
+    return select(
+        or_(
+            select(User.id).where(User.email == email).exists(),
+            select(InvitationCode.code).where(InvitationCode.email == email).exists(),
+        )
+    )
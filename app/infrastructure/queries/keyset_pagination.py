@@ -0,0 +1,77 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Callable
+from sqlalchemy import and_, or_
+
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
+from app.domain.models.page_model import PageModel
+
+
+def encode_cursor(values: list) -> str:
+    payload = json.dumps(
+        [
+            value.isoformat() if isinstance(value, (date, datetime)) else value
+            for value in values
+        ]
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def parse_cursor_value(value, column):
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def decode_cursor(cursor: str, columns: tuple) -> list:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [
+            parse_cursor_value(value, column) for value, column in zip(values, columns)
+        ]
+    except (ValueError, TypeError):
+        raise InvalidArgumentException("Invalid pagination cursor")
+
+
+def apply_keyset(
+    statement, columns: tuple, cursor: str | None, limit: int, descending: bool = False
+):
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        # Expanded row comparison: (a > x) OR (a = x AND b > y) OR ... keeps every branch index friendly
+        statement = statement.where(
+            or_(
+                *[
+                    and_(
+                        *[columns[i] == values[i] for i in range(position)],
+                        column < values[position]
+                        if descending
+                        else column > values[position],
+                    )
+                    for position, column in enumerate(columns)
+                ]
+            )
+        )
+    return statement.order_by(
+        *[column.desc() if descending else column.asc() for column in columns]
+    ).limit(limit + 1)
+
+
+def build_page(
+    entities: list, columns: tuple, limit: int, map_entity: Callable
+) -> PageModel:
+    next_cursor = None
+    if len(entities) > limit:
+        entities = entities[:limit]
+        next_cursor = encode_cursor(
+            [getattr(entities[-1], column.key) for column in columns]
+        )
+    return PageModel(
+        items=[map_entity(entity) for entity in entities], next_cursor=next_cursor
+    )
@@ -0,0 +1,26 @@
+from datetime import date
+from sqlmodel import func, select
+
+from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
+from app.infrastructure.entities.driver_entity import Driver
+from app.infrastructure.entities.user_entity import User
+from app.infrastructure.entities.vehicle_entity import Vehicle
+
+
+def count_rows(entity, *conditions):
+    return select(func.count()).select_from(entity).where(*conditions)
+
+
+def count_today_assignments():
+    return count_rows(DriverAssignment, DriverAssignment.travel_date == date.today())
+
+
+def select_metrics():
+    return select(
+        count_rows(Vehicle).scalar_subquery().label("number_of_vehicles"),
+        count_rows(User).scalar_subquery().label("number_of_users"),
+        count_rows(Driver).scalar_subquery().label("number_of_drivers"),
+        count_today_assignments()
+        .scalar_subquery()
+        .label("number_of_today_assignments"),
+    )
@@ -0,0 +1,26 @@
+from datetime import date
+from sqlalchemy import Float, cast
+from sqlmodel import or_, select
+
+from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
+
+
+def select_active_routes_in_date_ranges(date_ranges: list[tuple[date, date]]):
+    # Coordinates are read as floats, so the driver doesn't build a Decimal per value
+    return select(
+        DriverAssignment.travel_date,
+        DriverAssignment.driver_id,
+        DriverAssignment.vehicle_id,
+        cast(DriverAssignment.origin_location_latitude, Float),
+        cast(DriverAssignment.origin_location_longitude, Float),
+        cast(DriverAssignment.destination_location_latitude, Float),
+        cast(DriverAssignment.destination_location_longitude, Float),
+    ).where(
+        or_(
+            *(
+                DriverAssignment.travel_date.between(date_from, date_to)
+                for date_from, date_to in date_ranges
+            )
+        ),
+        DriverAssignment.active,
+    )
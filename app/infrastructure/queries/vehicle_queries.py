@@ -0,0 +1,24 @@
+from sqlmodel import or_, select
+
+from app.infrastructure.entities.vehicle_entity import Vehicle
+
+VEHICLE_PAGE_ORDER = (Vehicle.id,)
+
+
+def select_vehicles(brand: str | None = None, model: str | None = None):
+    statement = select(Vehicle)
+    if brand:
+        statement = statement.where(Vehicle.brand == brand)
+    if model:
+        statement = statement.where(Vehicle.model == model)
+    return statement
+
+
+def select_vehicle_pictures():
+    return select(Vehicle.picture).where(Vehicle.picture != "").distinct()
+
+
+def select_taken_vehicle_keys(vins: list[str], plates: list[str]):
+    return select(Vehicle.vin, Vehicle.plate).where(
+        or_(Vehicle.vin.in_(vins), Vehicle.plate.in_(plates))
+    )
@@ -0,0 +1,184 @@
+from datetime import date
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.models.assignment_template_model import (
+    AssignmentTemplateExceptionModel,
+    AssignmentTemplateModel,
+)
+from app.domain.models.page_model import PageModel
+from loguru import logger
+
+from app.application.repositories.async_assignment_template_repository import (
+    AsyncAssignmentTemplateRepository,
+)
+from app.infrastructure.entities.assignment_template_entity import (
+    AssignmentTemplate,
+    AssignmentTemplateException,
+)
+from app.infrastructure.mappers.assignment_template_mappers import (
+    map_assignment_template_entity_to_assignment_template_model,
+    map_assignment_template_exception_model_to_assignment_template_exception_entity,
+    map_assignment_template_model_to_assignment_template_entity,
+)
+from app.infrastructure.queries.assignment_template_queries import (
+    ASSIGNMENT_TEMPLATE_PAGE_ORDER,
+    TEMPLATE_EXCEPTIONS,
+    select_assignment_template_exception_dates,
+    select_assignment_templates,
+    select_assignment_templates_to_materialize,
+    update_materialized_until,
+)
+from app.infrastructure.queries.keyset_pagination import apply_keyset, build_page
+
+
+class AsyncRelationalDatabaseAssignmentTemplateRepositoryImpl(
+    AsyncAssignmentTemplateRepository
+):
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def create_assignment_template(
+        self, assignment_template: AssignmentTemplateModel
+    ) -> AssignmentTemplateModel:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.create_assignment_template()")
+        logger.debug("Params passed: {}", assignment_template.__dict__)
+        assignment_template_entity = (
+            map_assignment_template_model_to_assignment_template_entity(
+                assignment_template
+            )
+        )
+        self.session.add(assignment_template_entity)
+        await self.session.flush()
+        return map_assignment_template_entity_to_assignment_template_model(
+            assignment_template_entity, with_exceptions=False
+        )
+
+    async def get_assignment_template(
+        self, template_id: int
+    ) -> AssignmentTemplateModel | None:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.get_assignment_template()")
+        logger.debug("Params passed: {}", template_id)
+        assignment_template_entity = await self.session.get(
+            AssignmentTemplate,
+            template_id,
+            options=TEMPLATE_EXCEPTIONS,
+            populate_existing=True,
+        )
+        if assignment_template_entity:
+            return map_assignment_template_entity_to_assignment_template_model(
+                assignment_template_entity
+            )
+
+    async def get_assignment_templates(
+        self, only_actives: bool, limit: int, cursor: str | None
+    ) -> PageModel:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.get_assignment_templates()")
+        logger.debug("Params passed: {}, {} and {}", only_actives, limit, cursor)
+        assignment_template_entities = (
+            await self.session.exec(
+                apply_keyset(
+                    select_assignment_templates(only_actives),
+                    ASSIGNMENT_TEMPLATE_PAGE_ORDER,
+                    cursor,
+                    limit,
+                )
+            )
+        ).all()
+        return build_page(
+            assignment_template_entities,
+            ASSIGNMENT_TEMPLATE_PAGE_ORDER,
+            limit,
+            map_assignment_template_entity_to_assignment_template_model,
+        )
+
+    async def set_assignment_template_as_inactive(self, template_id: int) -> None:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.set_assignment_template_as_inactive()")
+        logger.debug("Params passed: {}", template_id)
+        assignment_template_entity = await self.session.get(
+            AssignmentTemplate, template_id
+        )
+        if assignment_template_entity:
+            assignment_template_entity.active = False
+            await self.session.flush()
+
+    async def get_assignment_templates_to_materialize(
+        self, materialize_until: date, after_id: int, limit: int
+    ) -> list[AssignmentTemplateModel]:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.get_assignment_templates_to_materialize()")
+        logger.debug("Params passed: {}, {} and {}", materialize_until, after_id, limit)
+        assignment_template_entities = (
+            await self.session.exec(
+                select_assignment_templates_to_materialize(
+                    materialize_until, after_id, limit
+                )
+            )
+        ).all()
+        return [
+            map_assignment_template_entity_to_assignment_template_model(
+                assignment_template_entity, with_exceptions=False
+            )
+            for assignment_template_entity in assignment_template_entities
+        ]
+
+    async def get_assignment_template_exception_dates(
+        self, template_ids: list[int], from_date: date
+    ) -> dict[int, set[date]]:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.get_assignment_template_exception_dates()")
+        logger.debug("Params passed: {} and {}", template_ids, from_date)
+        exception_dates = {template_id: set() for template_id in template_ids}
+        for template_id, travel_date in (
+            await self.session.exec(
+                select_assignment_template_exception_dates(template_ids, from_date)
+            )
+        ).all():
+            exception_dates[template_id].add(travel_date)
+        return exception_dates
+
+    async def create_assignment_template_exceptions(
+        self, exceptions: list[AssignmentTemplateExceptionModel]
+    ) -> None:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.create_assignment_template_exceptions()")
+        logger.debug("Params passed: {} exceptions", len(exceptions))
+        try:
+            async with self.session.begin_nested():
+                await self.session.exec(
+                    insert(AssignmentTemplateException),
+                    params=[
+                        map_assignment_template_exception_model_to_assignment_template_exception_entity(
+                            exception
+                        ).model_dump()
+                        for exception in exceptions
+                    ],
+                )
+        except IntegrityError:
+            raise ConflictWithExistingResourceException(
+                "Assignment template already has an exception at that date"
+            )
+
+    async def delete_assignment_template_exception(
+        self, template_id: int, travel_date: date
+    ) -> bool:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.delete_assignment_template_exception()")
+        logger.debug("Params passed: {} and {}", template_id, travel_date)
+        exception_entity = await self.session.get(
+            AssignmentTemplateException, (template_id, travel_date)
+        )
+        if not exception_entity:
+            return False
+        await self.session.delete(exception_entity)
+        await self.session.flush()
+        return True
+
+    async def set_materialized_until(
+        self, template_ids: list[int], materialized_until: date
+    ) -> None:
+        logger.debug("Method called: async_relational_database_assignment_template_repository_impl.set_materialized_until()")
+        logger.debug("Params passed: {} and {}", template_ids, materialized_until)
+        await self.session.exec(
+            update_materialized_until(template_ids, materialized_until)
+        )
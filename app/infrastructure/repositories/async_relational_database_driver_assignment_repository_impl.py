@@ -0,0 +1,451 @@
+from datetime import date
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.models.day_occupancy_model import DayOccupancyModel
+from app.domain.models.driver_assignment import (
+    DriverAssignmentModel,
+    LocationModel,
+    DriverAssignmentIdModel,
+)
+from app.domain.models.geo_location import (
+    encode_geohash,
+    get_geohash_cells_around,
+    is_any_within_radius,
+)
+from app.domain.models.page_model import PageModel
+from loguru import logger
+
+from app.application.repositories.async_driver_assignment_repository import (
+    AsyncDriverAssignmentRepository,
+)
+from app.infrastructure.cache.cache_invalidation import track_written_instances
+from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
+from app.infrastructure.mappers.driver_assignment_mappers import (
+    map_driver_assignment_entity_to_driver_assignment_model,
+    map_driver_assignment_model_to_driver_assignment_entity,
+)
+from app.infrastructure.queries.driver_assignment_queries import (
+    DRIVER_ASSIGNMENT_PAGE_ORDER,
+    LOCATION_ATTRIBUTES,
+    RELATED_ENTITIES,
+    insert_driver_assignment_if_available,
+    select_active_driver_assignment_by_destination_location_at_date,
+    select_active_destinations_in_geohash_cells,
+    select_active_driver_assignments_with_driver_id_or_vehicle_id_at_date,
+    select_driver_assignment_locations_in_geohash_cells,
+    select_driver_assignments,
+    select_driver_assignments_by_ids,
+    select_existing_driver_and_vehicle_ids,
+    select_is_destination_taken_at_date,
+    select_is_driver_or_vehicle_taken_at_date,
+    select_occupancy_at_dates,
+)
+from app.infrastructure.queries.keyset_pagination import apply_keyset, build_page
+from app.infrastructure.queries.metrics_queries import count_today_assignments
+
+class AsyncRelationalDatabaseDriverAssignmentRepositoryImpl(
+    AsyncDriverAssignmentRepository
+):
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_driver_assignment_entity(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> DriverAssignment | None:
+        return await self.session.get(
+            DriverAssignment,
+            (driver_id, vehicle_id, travel_date),
+            options=RELATED_ENTITIES,
+            populate_existing=True,
+        )
+
+    async def get_driver_assignments_page(
+        self, statement, limit: int, cursor: str | None
+    ) -> PageModel:
+        driver_assignment_entities = (
+            await self.session.exec(
+                apply_keyset(
+                    statement, DRIVER_ASSIGNMENT_PAGE_ORDER, cursor, limit, descending=True
+                )
+            )
+        ).all()
+        return build_page(
+            driver_assignment_entities,
+            DRIVER_ASSIGNMENT_PAGE_ORDER,
+            limit,
+            map_driver_assignment_entity_to_driver_assignment_model,
+        )
+
+    async def assign_driver_to_vehicle(
+        self, driver_assignment: DriverAssignmentModel
+    ) -> DriverAssignmentModel | None:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.assign_driver_to_vehicle()")
+        logger.debug("Params passed: {}", driver_assignment.__dict__)
+        driver_assignment_entity = (
+            map_driver_assignment_model_to_driver_assignment_entity(driver_assignment)
+        )
+        try:
+            # In a savepoint so a conflict doesn't undo the earlier writes of the request
+            async with self.session.begin_nested():
+                result = await self.session.exec(
+                    insert_driver_assignment_if_available(
+                        driver_assignment_entity, driver_assignment.destination_location
+                    )
+                )
+        except IntegrityError:
+            raise ConflictWithExistingResourceException(
+                "Driver assignment for the driver and vehicle already exists at the same day"
+            )
+        if not result.rowcount:
+            return None
+        driver_assignment_entity = await self.get_driver_assignment_entity(
+            driver_assignment.driver_id,
+            driver_assignment.vehicle_id,
+            driver_assignment.travel_date,
+        )
+        track_written_instances(self.session.sync_session, [driver_assignment_entity])
+        return map_driver_assignment_entity_to_driver_assignment_model(
+            driver_assignment_entity
+        )
+
+    async def get_driver_assignments(
+        self,
+        only_actives: bool,
+        travel_date: date | None,
+        limit: int,
+        cursor: str | None,
+        travel_date_from: date | None = None,
+        travel_date_to: date | None = None,
+        driver_id: int | None = None,
+        vehicle_id: int | None = None,
+    ) -> PageModel:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_driver_assignments()")
+        logger.debug(
+            "Params passed: {}, {}, {}, {}, {}, {}, {} and {}",
+            only_actives,
+            travel_date,
+            limit,
+            cursor,
+            travel_date_from,
+            travel_date_to,
+            driver_id,
+            vehicle_id,
+        )
+        statement = select_driver_assignments(
+            only_actives,
+            travel_date,
+            travel_date_from,
+            travel_date_to,
+            driver_id,
+            vehicle_id,
+        )
+        return await self.get_driver_assignments_page(statement, limit, cursor)
+
+    async def get_driver_assignment(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> DriverAssignmentModel:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_driver_assignment()")
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        driver_assignment_entity = await self.get_driver_assignment_entity(
+            driver_id, vehicle_id, travel_date
+        )
+        if driver_assignment_entity:
+            return map_driver_assignment_entity_to_driver_assignment_model(
+                driver_assignment_entity
+            )
+
+    async def get_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> list[DriverAssignmentModel]:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_active_driver_assignments_with_driver_id_or_vehicle_id_at_date()")
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        driver_assignment_entities = (
+            await self.session.exec(
+                select_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+                    driver_id, vehicle_id, travel_date
+                )
+            )
+        ).all()
+        return [
+            map_driver_assignment_entity_to_driver_assignment_model(
+                driver_assignment_entity
+            )
+            for driver_assignment_entity in driver_assignment_entities
+        ]
+
+    async def get_active_driver_assignment_by_destination_location_at_date(
+        self,
+        location: LocationModel,
+        travel_date: date,
+        exclude_assignment: DriverAssignmentIdModel | None,
+    ) -> DriverAssignmentModel:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_active_driver_assignment_by_destination_location_at_date()")
+        logger.debug("Params passed: {}, {}", location.__dict__, travel_date)
+        driver_assignment_entity = (
+            await self.session.exec(
+                select_active_driver_assignment_by_destination_location_at_date(
+                    location, travel_date, exclude_assignment
+                )
+            )
+        ).first()
+        if driver_assignment_entity:
+            return map_driver_assignment_entity_to_driver_assignment_model(
+                driver_assignment_entity
+            )
+
+    async def update_driver_assignment(
+        self, driver_assignment: DriverAssignmentModel
+    ) -> DriverAssignmentModel:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.update_driver_assignment()")
+        logger.debug("Params passed: {}", driver_assignment.__dict__)
+        driver_assignment_entity = await self.get_driver_assignment_entity(
+            driver_assignment.driver_id,
+            driver_assignment.vehicle_id,
+            driver_assignment.travel_date,
+        )
+        if driver_assignment_entity:
+            driver_assignment_entity.route_name = driver_assignment.route_name
+            driver_assignment_entity.origin_location_latitude = (
+                driver_assignment.origin_location.latitude
+            )
+            driver_assignment_entity.origin_location_longitude = (
+                driver_assignment.origin_location.longitude
+            )
+            driver_assignment_entity.destination_location_latitude = (
+                driver_assignment.destination_location.latitude
+            )
+            driver_assignment_entity.destination_location_longitude = (
+                driver_assignment.destination_location.longitude
+            )
+            driver_assignment_entity.origin_geohash = encode_geohash(
+                driver_assignment.origin_location.latitude,
+                driver_assignment.origin_location.longitude,
+            )
+            driver_assignment_entity.destination_geohash = encode_geohash(
+                driver_assignment.destination_location.latitude,
+                driver_assignment.destination_location.longitude,
+            )
+            driver_assignment_entity.completed_successfully = (
+                driver_assignment.completed_successfully
+            )
+            driver_assignment_entity.problem_description = (
+                driver_assignment.problem_description
+            )
+            driver_assignment_entity.comments = driver_assignment.comments
+            self.session.add(driver_assignment_entity)
+            await self.session.flush()
+            # Coordinates are read back as the database stored them, like after an insert
+            await self.session.refresh(
+                driver_assignment_entity, attribute_names=LOCATION_ATTRIBUTES
+            )
+            return map_driver_assignment_entity_to_driver_assignment_model(
+                driver_assignment_entity
+            )
+
+    async def set_driver_assignment_as_inactive(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> None:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.set_driver_assignment_as_inactive()")
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        driver_assignment_entity = await self.session.get(
+            DriverAssignment, (driver_id, vehicle_id, travel_date)
+        )
+        if driver_assignment_entity:
+            driver_assignment_entity.active = False
+            await self.session.flush()
+
+    async def get_all_assignments_for_driver(
+        self, driver_id: int, limit: int, cursor: str | None
+    ) -> PageModel:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_all_assignments_for_driver()")
+        logger.debug("Params passed: {}, {} and {}", driver_id, limit, cursor)
+        return await self.get_driver_assignments_page(
+            select_driver_assignments(driver_id=driver_id), limit, cursor
+        )
+
+    async def get_all_assignments_for_vehicle(
+        self, vehicle_id: int, limit: int, cursor: str | None
+    ) -> PageModel:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_all_assignments_for_vehicle()")
+        logger.debug("Params passed: {}, {} and {}", vehicle_id, limit, cursor)
+        return await self.get_driver_assignments_page(
+            select_driver_assignments(vehicle_id=vehicle_id), limit, cursor
+        )
+
+    async def get_number_of_today_assignments(self) -> int:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_number_of_today_assignments()")
+        number_of_assignments = (
+            await self.session.exec(count_today_assignments())
+        ).one()
+        return number_of_assignments
+
+    async def get_occupancy_at_dates(
+        self, travel_dates: list[date]
+    ) -> dict[date, DayOccupancyModel]:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_occupancy_at_dates()")
+        logger.debug("Params passed: {}", travel_dates)
+        occupancy = {
+            travel_date: DayOccupancyModel(travel_date) for travel_date in travel_dates
+        }
+        for (
+            driver_id,
+            vehicle_id,
+            travel_date,
+            destination_latitude,
+            destination_longitude,
+            active,
+        ) in (
+            await self.session.exec(select_occupancy_at_dates(travel_dates))
+        ).all():
+            occupancy[travel_date].add(
+                driver_id,
+                vehicle_id,
+                LocationModel(destination_latitude, destination_longitude),
+                active,
+            )
+        return occupancy
+
+    async def get_existing_driver_and_vehicle_ids(
+        self, driver_ids: list[int], vehicle_ids: list[int]
+    ) -> tuple[set[int], set[int]]:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_existing_driver_and_vehicle_ids()")
+        logger.debug("Params passed: {} and {}", driver_ids, vehicle_ids)
+        existing_ids = (
+            await self.session.exec(
+                select_existing_driver_and_vehicle_ids(driver_ids, vehicle_ids)
+            )
+        ).all()
+        return (
+            {id for kind, id in existing_ids if kind == "driver"},
+            {id for kind, id in existing_ids if kind == "vehicle"},
+        )
+
+    async def create_driver_assignments(
+        self, driver_assignments: list[DriverAssignmentModel]
+    ) -> list[bool]:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.create_driver_assignments()")
+        logger.debug("Params passed: {} driver assignments", len(driver_assignments))
+        written = []
+        written_entities = []
+        try:
+            # In a savepoint so a conflicting schedule leaves the rest of the transaction alone
+            async with self.session.begin_nested():
+                for driver_assignment in driver_assignments:
+                    driver_assignment_entity = (
+                        map_driver_assignment_model_to_driver_assignment_entity(
+                            driver_assignment
+                        )
+                    )
+                    # Each row goes through the same guarded insert as a single assignment,
+                    # so one taken since the caller's lookup is refused instead of written
+                    result = await self.session.exec(
+                        insert_driver_assignment_if_available(
+                            driver_assignment_entity, driver_assignment.destination_location
+                        )
+                    )
+                    written.append(bool(result.rowcount))
+                    if result.rowcount:
+                        written_entities.append(driver_assignment_entity)
+        except IntegrityError:
+            raise ConflictWithExistingResourceException(
+                "Driver assignment for the driver and vehicle already exists at the same day"
+            )
+        track_written_instances(self.session.sync_session, written_entities)
+        return written
+
+    async def is_driver_or_vehicle_taken_at_date(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> bool:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.is_driver_or_vehicle_taken_at_date()")
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        return bool(
+            (
+                await self.session.exec(
+                    select_is_driver_or_vehicle_taken_at_date(
+                        driver_id, vehicle_id, travel_date
+                    )
+                )
+            ).one()
+        )
+
+    async def is_destination_taken_at_date(
+        self,
+        location: LocationModel,
+        travel_date: date,
+        exclude_assignment: DriverAssignmentIdModel | None = None,
+        radius_km: float = 0,
+    ) -> bool:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.is_destination_taken_at_date()")
+        logger.debug("Params passed: {}, {}, {}", location.__dict__, travel_date, radius_km)
+        if not radius_km:
+            return bool(
+                (
+                    await self.session.exec(
+                        select_is_destination_taken_at_date(
+                            location, travel_date, exclude_assignment
+                        )
+                    )
+                ).one()
+            )
+        destinations = (
+            await self.session.exec(
+                select_active_destinations_in_geohash_cells(
+                    get_geohash_cells_around(location, radius_km),
+                    travel_date,
+                    exclude_assignment,
+                )
+            )
+        ).all()
+        return is_any_within_radius(
+            location,
+            [LocationModel(latitude, longitude) for latitude, longitude in destinations],
+            radius_km,
+        )
+
+    async def get_driver_assignment_locations_in_geohash_cells(
+        self,
+        cells: list[str] | None,
+        by_origin: bool,
+        travel_date_from: date,
+        travel_date_to: date,
+        only_actives: bool = False,
+    ) -> list[tuple[DriverAssignmentIdModel, LocationModel]]:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_driver_assignment_locations_in_geohash_cells()")
+        logger.debug("Params passed: {}, {}, {}, {} and {}", cells, by_origin, travel_date_from, travel_date_to, only_actives)
+        locations = (
+            await self.session.exec(
+                select_driver_assignment_locations_in_geohash_cells(
+                    cells, by_origin, travel_date_from, travel_date_to, only_actives
+                )
+            )
+        ).all()
+        return [
+            (
+                DriverAssignmentIdModel(driver_id, vehicle_id, assignment_travel_date),
+                LocationModel(latitude, longitude),
+            )
+            for driver_id, vehicle_id, assignment_travel_date, latitude, longitude in locations
+        ]
+
+    async def get_driver_assignments_by_ids(
+        self, driver_assignment_ids: list[DriverAssignmentIdModel]
+    ) -> list[DriverAssignmentModel]:
+        logger.debug("Method called: async_relational_database_driver_assignment_repository_impl.get_driver_assignments_by_ids()")
+        logger.debug("Params passed: {} driver assignment ids", len(driver_assignment_ids))
+        if not driver_assignment_ids:
+            return []
+        driver_assignment_entities = (
+            await self.session.exec(
+                select_driver_assignments_by_ids(driver_assignment_ids)
+            )
+        ).all()
+        return [
+            map_driver_assignment_entity_to_driver_assignment_model(
+                driver_assignment_entity
+            )
+            for driver_assignment_entity in driver_assignment_entities
+        ]
@@ -0,0 +1,155 @@
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from loguru import logger
+
+from app.application.repositories.async_driver_repository import AsyncDriverRepository
+from app.domain.models.driver_model import DriverModel
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.models.page_model import PageModel
+from app.infrastructure.cache.cache_invalidation import track_written_instances
+from app.infrastructure.entities.driver_entity import Driver
+from app.infrastructure.mappers.driver_mappers import (
+    map_driver_entity_to_driver_model,
+    map_driver_model_to_driver_entity,
+)
+from app.infrastructure.queries.driver_queries import (
+    DRIVER_PAGE_ORDER,
+    select_drivers,
+    select_taken_driver_keys,
+)
+from app.infrastructure.queries.keyset_pagination import apply_keyset, build_page
+from app.infrastructure.queries.metrics_queries import count_rows
+
+
+class AsyncRelationalDatabaseDriverRepositoryImpl(AsyncDriverRepository):
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_driver_by_driver_id(self, driver_id: int) -> DriverModel | None:
+        logger.debug("Method called: async_relational_database_driver_repository_impl.get_driver_by_driver_id()")
+        logger.debug("Params passed: {}", driver_id)
+        driver_entity = (
+            await self.session.exec(select(Driver).where(Driver.id == driver_id))
+        ).first()
+
+        if driver_entity:
+            return map_driver_entity_to_driver_model(driver_entity)
+        else:
+            return None
+
+    async def get_driver_by_curp(self, curp: str) -> DriverModel | None:
+        logger.debug("Method called: async_relational_database_driver_repository_impl.get_driver_by_curp()")
+        logger.debug("Params passed: {}", curp)
+        driver_entity = (
+            await self.session.exec(select(Driver).where(Driver.curp == curp))
+        ).first()
+
+        if driver_entity:
+            return map_driver_entity_to_driver_model(driver_entity)
+
+    async def get_all_drivers(
+        self,
+        limit: int,
+        cursor: str | None,
+        name: str | None = None,
+        last_name: str | None = None,
+    ) -> PageModel:
+        logger.debug("Method called: async_relational_database_driver_repository_impl.get_all_drivers()")
+        logger.debug("Params passed: {}, {}, {} and {}", limit, cursor, name, last_name)
+        drivers_entity = (
+            await self.session.exec(
+                apply_keyset(
+                    select_drivers(name, last_name), DRIVER_PAGE_ORDER, cursor, limit
+                )
+            )
+        ).all()
+        return build_page(
+            drivers_entity, DRIVER_PAGE_ORDER, limit, map_driver_entity_to_driver_model
+        )
+
+    async def save_driver(self, driver: DriverModel) -> DriverModel:
+        logger.debug("Method called: async_relational_database_driver_repository_impl.save_driver()")
+        logger.debug("Params passed: {}", driver.__dict__)
+        try:
+            # In a savepoint so a conflict doesn't undo the earlier writes of the request
+            async with self.session.begin_nested():
+                if driver.id:
+                    driver_entity = (
+                        await self.session.exec(
+                            select(Driver).where(Driver.id == driver.id)
+                        )
+                    ).one()
+
+                    driver_entity.first_name = driver.name
+                    driver_entity.last_name = driver.last_name
+                    driver_entity.birth_date = driver.birth_date
+                    driver_entity.curp = driver.curp
+                    driver_entity.address = driver.address
+                    driver_entity.monthly_salary = driver.monthly_salary
+                    driver_entity.license_number = driver.driving_license
+                    driver_entity.entry_date = driver.registration_date
+                else:
+                    driver_entity = map_driver_model_to_driver_entity(driver)
+                self.session.add(driver_entity)
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        await self.session.refresh(driver_entity)
+        return map_driver_entity_to_driver_model(driver_entity)
+
+    async def delete_driver_by_driver_id(self, driver_id: int) -> None:
+        logger.debug("Method called: async_relational_database_driver_repository_impl.delete_driver_by_driver_id()")
+        logger.debug("Params passed: {}", driver_id)
+        driver_entity = (
+            await self.session.exec(select(Driver).where(Driver.id == driver_id))
+        ).one()
+
+        await self.session.delete(driver_entity)
+        await self.session.flush()
+
+    async def get_number_of_drivers(self) -> int:
+        logger.debug("Method called: async_relational_database_driver_repository_impl.get_number_of_drivers()")
+        number_of_drivers = (await self.session.exec(count_rows(Driver))).one()
+        return number_of_drivers
+
+    async def get_taken_driver_keys(
+        self, drivers: list[DriverModel]
+    ) -> dict[str, set[str]]:
+        logger.debug("Method called: async_relational_database_driver_repository_impl.get_taken_driver_keys()")
+        logger.debug("Params passed: {} drivers", len(drivers))
+        taken_keys = (
+            await self.session.exec(
+                select_taken_driver_keys(
+                    [driver.curp for driver in drivers],
+                    [driver.driving_license for driver in drivers],
+                )
+            )
+        ).all()
+        return {
+            "curp": {curp for curp, _ in taken_keys},
+            "driving_license": {license_number for _, license_number in taken_keys},
+        }
+
+    async def create_drivers(self, drivers: list[DriverModel]) -> None:
+        logger.debug("Method called: async_relational_database_driver_repository_impl.create_drivers()")
+        logger.debug("Params passed: {} drivers", len(drivers))
+        driver_entities = [
+            map_driver_model_to_driver_entity(driver) for driver in drivers
+        ]
+        try:
+            # In a savepoint so a conflicting batch doesn't undo the ones inserted before it
+            async with self.session.begin_nested():
+                await self.session.exec(
+                    insert(Driver),
+                    params=[
+                        driver_entity.model_dump(exclude={"id"})
+                        for driver_entity in driver_entities
+                    ],
+                )
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        track_written_instances(self.session.sync_session, driver_entities)
@@ -0,0 +1,123 @@
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from loguru import logger
+
+from app.application.repositories.async_invitation_code_repository import (
+    AsyncInvitationCodeRepository,
+)
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.models.invitation_code_model import InvitationCodeModel
+from app.infrastructure.entities.invitation_code_entity import InvitationCode
+from app.infrastructure.mappers.invitation_code_mappers import (
+    map_invitation_code_entity_to_invitation_code_model,
+    map_invitation_code_model_to_invitation_code_entity,
+)
+from app.infrastructure.queries.invitation_code_queries import select_email_in_use
+
+
+class AsyncRelationalDatabaseInvitationCodeRepositoryImpl(
+    AsyncInvitationCodeRepository
+):
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_invitation_code_by_code(self, code: str) -> InvitationCodeModel | None:
+        logger.debug("Method called: async_relational_database_invitation_code_repository_impl.get_invitation_code_by_code()")
+        logger.debug("Params passed: {}", code)
+        invitation_code_entity = (
+            await self.session.exec(
+                select(InvitationCode).where(InvitationCode.code == code)
+            )
+        ).first()
+
+        if invitation_code_entity:
+            return map_invitation_code_entity_to_invitation_code_model(
+                invitation_code_entity
+            )
+
+    async def get_invitation_code_by_email(
+        self, email: str
+    ) -> InvitationCodeModel | None:
+        logger.debug("Method called: async_relational_database_invitation_code_repository_impl.get_invitation_code_by_email()")
+        logger.debug("Params passed: {}", email)
+        invitation_code_entity = (
+            await self.session.exec(
+                select(InvitationCode).where(InvitationCode.email == email)
+            )
+        ).first()
+
+        if invitation_code_entity:
+            return map_invitation_code_entity_to_invitation_code_model(
+                invitation_code_entity
+            )
+
+    async def is_email_in_use(self, email: str) -> bool:
+        logger.debug("Method called: async_relational_database_invitation_code_repository_impl.is_email_in_use()")
+        logger.debug("Params passed: {}", email)
+        return bool((await self.session.exec(select_email_in_use(email))).one())
+
+    async def get_invitation_code_by_code_and_email(
+        self, code: str, email: str
+    ) -> InvitationCodeModel | None:
+        logger.debug("Method called: async_relational_database_invitation_code_repository_impl.get_invitation_code_by_code_and_email()")
+        logger.debug("Params passed: {} and {}", code, email)
+        invitation_code_entity = (
+            await self.session.exec(
+                select(InvitationCode).where(
+                    InvitationCode.code == code, InvitationCode.email == email
+                )
+            )
+        ).first()
+
+        if invitation_code_entity:
+            return map_invitation_code_entity_to_invitation_code_model(
+                invitation_code_entity
+            )
+
+    async def save_invitation_code(
+        self, invitation_code: InvitationCodeModel
+    ) -> InvitationCodeModel:
+        logger.debug("Method called: async_relational_database_invitation_code_repository_impl.save_invitation_code()")
+        logger.debug("Params passed: {}", invitation_code.__dict__)
+        try:
+            # In a savepoint so a conflict doesn't undo the earlier writes of the request
+            async with self.session.begin_nested():
+                if invitation_code.code:
+                    invitation_code_entity = (
+                        await self.session.exec(
+                            select(InvitationCode).where(
+                                InvitationCode.code == invitation_code.code
+                            )
+                        )
+                    ).one()
+
+                    invitation_code_entity.email = invitation_code.email
+                else:
+                    invitation_code_entity = (
+                        map_invitation_code_model_to_invitation_code_entity(
+                            invitation_code
+                        )
+                    )
+                self.session.add(invitation_code_entity)
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        await self.session.refresh(invitation_code_entity)
+        return map_invitation_code_entity_to_invitation_code_model(
+            invitation_code_entity
+        )
+
+    async def delete_invitation_code_by_code(self, code: str) -> None:
+        logger.debug("Method called: async_relational_database_invitation_code_repository_impl.delete_invitation_code_by_code()")
+        logger.debug("Params passed: {}", code)
+        invitation_code_entity = (
+            await self.session.exec(
+                select(InvitationCode).where(InvitationCode.code == code)
+            )
+        ).one()
+
+        await self.session.delete(invitation_code_entity)
+        await self.session.flush()
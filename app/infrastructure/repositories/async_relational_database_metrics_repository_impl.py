@@ -0,0 +1,19 @@
+from sqlmodel.ext.asyncio.session import AsyncSession
+from loguru import logger
+
+from app.application.repositories.async_metrics_repository import (
+    AsyncMetricsRepository,
+)
+from app.domain.models.metrics_model import MetricsModel
+from app.infrastructure.queries.metrics_queries import select_metrics
+
+
+class AsyncRelationalDatabaseMetricsRepositoryImpl(AsyncMetricsRepository):
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_metrics(self) -> MetricsModel:
+        logger.debug("Method called: async_relational_database_metrics_repository_impl.get_metrics()")
+        metrics = (await self.session.exec(select_metrics())).one()
+        return MetricsModel(**metrics._asdict())
@@ -0,0 +1,28 @@
+from datetime import date
+from sqlmodel.ext.asyncio.session import AsyncSession
+from loguru import logger
+
+from app.application.repositories.async_mileage_repository import (
+    AsyncMileageRepository,
+)
+from app.domain.models.mileage_model import RouteColumnsModel
+from app.infrastructure.mappers.mileage_mappers import (
+    map_route_rows_to_route_columns_model,
+)
+from app.infrastructure.queries.mileage_queries import select_active_routes_in_date_ranges
+
+
+class AsyncRelationalDatabaseMileageRepositoryImpl(AsyncMileageRepository):
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_active_route_columns(
+        self, date_ranges: list[tuple[date, date]]
+    ) -> RouteColumnsModel:
+        logger.debug("Method called: async_relational_database_mileage_repository_impl.get_active_route_columns()")
+        logger.debug("Params passed: {}", date_ranges)
+        rows = (
+            await self.session.exec(select_active_routes_in_date_ranges(date_ranges))
+        ).all()
+        return map_route_rows_to_route_columns_model(rows)
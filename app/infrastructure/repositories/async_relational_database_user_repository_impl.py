@@ -0,0 +1,92 @@
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from loguru import logger
+
+from app.application.repositories.async_user_repository import AsyncUserRepository
+from app.domain.models.invitation_code_model import InvitationCodeModel
+from app.domain.models.user_model import UserModel
+from app.infrastructure.entities.invitation_code_entity import InvitationCode
+from app.infrastructure.entities.user_entity import User
+from app.infrastructure.mappers.invitation_code_mappers import (
+    map_invitation_code_entity_to_invitation_code_model,
+)
+from app.infrastructure.mappers.user_mappers import (
+    map_user_entity_to_user_model,
+    map_user_model_to_user_entity,
+)
+from app.infrastructure.queries.metrics_queries import count_rows
+
+
+class AsyncRelationalDatabaseUserRepositoryImpl(AsyncUserRepository):
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_user_by_email(self, email: str) -> UserModel | None:
+        logger.debug("Method called: async_relational_database_user_repository_impl.get_user_by_email()")
+        logger.debug("Params passed: {}", email)
+        user_entity = (
+            await self.session.exec(select(User).where(User.email == email))
+        ).first()
+
+        if user_entity:
+            return map_user_entity_to_user_model(user_entity)
+
+    async def get_all_users(self) -> list[UserModel]:
+        logger.debug("Method called: async_relational_database_user_repository_impl.get_all_users()")
+        return [
+            map_user_entity_to_user_model(user_entity)
+            for user_entity in (await self.session.exec(select(User))).all()
+        ]
+
+    async def get_invitation_codes_created_by_user_id(
+        self, user_id: int
+    ) -> list[InvitationCodeModel]:
+        logger.debug("Method called: async_relational_database_user_repository_impl.get_invitation_codes_created_by_user_id()")
+        logger.debug("Params passed: {}", user_id)
+        invitation_code_entities = (
+            await self.session.exec(
+                select(InvitationCode).where(InvitationCode.created_by_user == user_id)
+            )
+        ).all()
+        return [
+            map_invitation_code_entity_to_invitation_code_model(invitation_code_entity)
+            for invitation_code_entity in invitation_code_entities
+        ]
+
+    async def save_user(self, user: UserModel) -> UserModel:
+        logger.debug("Method called: async_relational_database_user_repository_impl.save_user()")
+        logger.debug("Params passed: {}", user.__dict__)
+        user_entity = None
+
+        if user.id:
+            user_entity = (
+                await self.session.exec(select(User).where(User.id == user.id))
+            ).one()
+
+            user_entity.email = user.email
+            user_entity.last_name = user.last_name
+            user_entity.name = user.name
+            user_entity.password = user.password
+        else:
+            user_entity = map_user_model_to_user_entity(user)
+
+        self.session.add(user_entity)
+        await self.session.flush()
+        await self.session.refresh(user_entity)
+        return map_user_entity_to_user_model(user_entity)
+
+    async def delete_user_by_user_id(self, user_id: int) -> None:
+        logger.debug("Method called: async_relational_database_user_repository_impl.delete_user_by_user_id()")
+        logger.debug("Params passed: {}", user_id)
+        user_entity = (
+            await self.session.exec(select(User).where(User.id == user_id))
+        ).one()
+
+        await self.session.delete(user_entity)
+        await self.session.flush()
+
+    async def get_number_of_users(self) -> int:
+        logger.debug("Method called: async_relational_database_user_repository_impl.get_number_of_users()")
+        number_users = (await self.session.exec(count_rows(User))).one()
+        return number_users
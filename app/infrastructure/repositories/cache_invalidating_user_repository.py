@@ -0,0 +1,48 @@
+from loguru import logger
+
+from app.application.repositories.async_user_repository import AsyncUserRepository
+from app.domain.models.invitation_code_model import InvitationCodeModel
+from app.domain.models.user_model import UserModel
+from app.infrastructure.cache.authenticated_user_cache import AuthenticatedUserCache
+
+
+class CacheInvalidatingUserRepository(AsyncUserRepository):
+    """Evicts the principal of a written user right away, so this request stops using it, and
+    the commit hooks evict it again once the write is visible, in case a concurrent request
+    cached the old row in between."""
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepository,
+        authenticated_user_cache: AuthenticatedUserCache,
+    ) -> None:
+        self.user_repository = user_repository
+        self.authenticated_user_cache = authenticated_user_cache
+
+    async def get_user_by_email(self, email: str) -> UserModel | None:
+        return await self.user_repository.get_user_by_email(email)
+
+    async def get_all_users(self) -> list[UserModel]:
+        return await self.user_repository.get_all_users()
+
+    async def get_invitation_codes_created_by_user_id(
+        self, user_id: int
+    ) -> list[InvitationCodeModel]:
+        return await self.user_repository.get_invitation_codes_created_by_user_id(
+            user_id
+        )
+
+    async def save_user(self, user: UserModel) -> UserModel:
+        logger.debug("Method called: cache_invalidating_user_repository.save_user()")
+        saved_user = await self.user_repository.save_user(user)
+        await self.authenticated_user_cache.delete_user(saved_user.id)
+        return saved_user
+
+    async def delete_user_by_user_id(self, user_id: int) -> None:
+        logger.debug("Method called: cache_invalidating_user_repository.delete_user_by_user_id()")
+        logger.debug("Params passed: {}", user_id)
+        await self.user_repository.delete_user_by_user_id(user_id)
+        await self.authenticated_user_cache.delete_user(user_id)
+
+    async def get_number_of_users(self):
+        return await self.user_repository.get_number_of_users()
@@ -0,0 +1,80 @@
+from loguru import logger
+
+from app.application.repositories.async_driver_repository import AsyncDriverRepository
+from app.domain.models.driver_model import DriverModel
+from app.domain.models.page_model import PageModel
+from app.infrastructure.cache.entity_cache import EntityCache
+
+
+class CachingDriverRepository(AsyncDriverRepository):
+    """Serves driver lookups by id or CURP from `driver_cache`, with the same rules for
+    uncommitted writes as CachingVehicleRepository."""
+
+    def __init__(
+        self, driver_repository: AsyncDriverRepository, driver_cache: EntityCache
+    ) -> None:
+        self.driver_repository = driver_repository
+        self.driver_cache = driver_cache
+        self.written_ids = set()
+
+    async def get_cached_driver(self, index: str, value, get_driver):
+        driver = self.driver_cache.get(index, value)
+        if driver and driver.id not in self.written_ids:
+            return driver
+        version = self.driver_cache.get_version(index, value)
+        driver = await get_driver(value)
+        if driver and driver.id not in self.written_ids:
+            self.driver_cache.set(driver, version)
+        return driver
+
+    def invalidate(self, id: int) -> None:
+        self.written_ids.add(id)
+        self.driver_cache.delete(id)
+
+    async def get_driver_by_driver_id(self, driver_id: int) -> DriverModel | None:
+        return await self.get_cached_driver(
+            "id", driver_id, self.driver_repository.get_driver_by_driver_id
+        )
+
+    async def get_driver_by_curp(self, curp: str) -> DriverModel | None:
+        return await self.get_cached_driver(
+            "curp", curp, self.driver_repository.get_driver_by_curp
+        )
+
+    async def get_all_drivers(
+        self,
+        limit: int,
+        cursor: str | None,
+        name: str | None = None,
+        last_name: str | None = None,
+    ) -> PageModel:
+        return await self.driver_repository.get_all_drivers(
+            limit, cursor, name, last_name
+        )
+
+    async def save_driver(self, driver: DriverModel) -> DriverModel:
+        logger.debug("Method called: caching_driver_repository.save_driver()")
+        if driver.id:
+            self.invalidate(driver.id)
+        saved_driver = await self.driver_repository.save_driver(driver)
+        self.invalidate(saved_driver.id)
+        return saved_driver
+
+    async def delete_driver_by_driver_id(self, driver_id: int) -> None:
+        logger.debug("Method called: caching_driver_repository.delete_driver_by_driver_id()")
+        logger.debug("Params passed: {}", driver_id)
+        self.invalidate(driver_id)
+        await self.driver_repository.delete_driver_by_driver_id(driver_id)
+
+    async def get_number_of_drivers(self):
+        return await self.driver_repository.get_number_of_drivers()
+
+    async def get_taken_driver_keys(
+        self, drivers: list[DriverModel]
+    ) -> dict[str, set[str]]:
+        return await self.driver_repository.get_taken_driver_keys(drivers)
+
+    async def create_drivers(self, drivers: list[DriverModel]) -> None:
+        logger.debug("Method called: caching_driver_repository.create_drivers()")
+        # Lookups that found nothing are never cached, so new drivers have nothing to drop
+        await self.driver_repository.create_drivers(drivers)
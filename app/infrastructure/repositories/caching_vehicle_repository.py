@@ -0,0 +1,91 @@
+from loguru import logger
+
+from app.application.repositories.async_vehicle_repository import (
+    AsyncVehicleRepository,
+)
+from app.domain.models.page_model import PageModel
+from app.domain.models.vehicle_model import VehicleModel
+from app.infrastructure.cache.entity_cache import EntityCache
+
+
+class CachingVehicleRepository(AsyncVehicleRepository):
+    """Serves vehicle lookups by id, VIN or plate from `vehicle_cache`. Vehicles written through
+    this repository are never read from or stored in the cache for the rest of the request,
+    since their changes aren't committed yet; the cache drops them again once they are."""
+
+    def __init__(
+        self, vehicle_repository: AsyncVehicleRepository, vehicle_cache: EntityCache
+    ) -> None:
+        self.vehicle_repository = vehicle_repository
+        self.vehicle_cache = vehicle_cache
+        self.written_ids = set()
+
+    async def get_cached_vehicle(self, index: str, value, get_vehicle):
+        vehicle = self.vehicle_cache.get(index, value)
+        if vehicle and vehicle.id not in self.written_ids:
+            return vehicle
+        version = self.vehicle_cache.get_version(index, value)
+        vehicle = await get_vehicle(value)
+        if vehicle and vehicle.id not in self.written_ids:
+            self.vehicle_cache.set(vehicle, version)
+        return vehicle
+
+    def invalidate(self, id: int) -> None:
+        self.written_ids.add(id)
+        self.vehicle_cache.delete(id)
+
+    async def get_vehicle_by_id(self, id: int) -> VehicleModel | None:
+        return await self.get_cached_vehicle(
+            "id", id, self.vehicle_repository.get_vehicle_by_id
+        )
+
+    async def get_vehicle_by_vin(self, vin: str) -> VehicleModel | None:
+        return await self.get_cached_vehicle(
+            "vin", vin, self.vehicle_repository.get_vehicle_by_vin
+        )
+
+    async def get_vehicle_by_plate(self, plate: str) -> VehicleModel | None:
+        return await self.get_cached_vehicle(
+            "plate", plate, self.vehicle_repository.get_vehicle_by_plate
+        )
+
+    async def get_vehicles(
+        self,
+        limit: int,
+        cursor: str | None,
+        brand: str | None = None,
+        model: str | None = None,
+    ) -> PageModel:
+        return await self.vehicle_repository.get_vehicles(limit, cursor, brand, model)
+
+    async def remove_vehicle_by_id(self, id: int) -> int | None:
+        logger.debug("Method called: caching_vehicle_repository.remove_vehicle_by_id()")
+        logger.debug("Params passed: {}", id)
+        self.invalidate(id)
+        return await self.vehicle_repository.remove_vehicle_by_id(id)
+
+    async def update_vehicle(self, vehicle_update: VehicleModel, id: int):
+        logger.debug("Method called: caching_vehicle_repository.update_vehicle()")
+        logger.debug("Params passed: {}", id)
+        self.invalidate(id)
+        return await self.vehicle_repository.update_vehicle(vehicle_update, id)
+
+    async def create_vehicle(self, vehicle: VehicleModel) -> VehicleModel | None:
+        logger.debug("Method called: caching_vehicle_repository.create_vehicle()")
+        created_vehicle = await self.vehicle_repository.create_vehicle(vehicle)
+        if created_vehicle:
+            self.invalidate(created_vehicle.id)
+        return created_vehicle
+
+    async def get_number_of_vehicles(self):
+        return await self.vehicle_repository.get_number_of_vehicles()
+
+    async def get_taken_vehicle_keys(
+        self, vehicles: list[VehicleModel]
+    ) -> dict[str, set[str]]:
+        return await self.vehicle_repository.get_taken_vehicle_keys(vehicles)
+
+    async def create_vehicles(self, vehicles: list[VehicleModel]) -> None:
+        logger.debug("Method called: caching_vehicle_repository.create_vehicles()")
+        # Lookups that found nothing are never cached, so new vehicles have nothing to drop
+        await self.vehicle_repository.create_vehicles(vehicles)
@@ -0,0 +1,228 @@
+from datetime import date
+from typing import Callable
+
+from app.application.repositories.async_driver_assignment_repository import (
+    AsyncDriverAssignmentRepository,
+)
+from app.domain.models.day_occupancy_model import DayOccupancyModel
+from app.domain.models.driver_assignment import (
+    DriverAssignmentIdModel,
+    DriverAssignmentModel,
+    LocationModel,
+)
+from app.domain.models.page_model import PageModel
+from app.infrastructure.cache.occupancy_index import OccupancyIndex
+
+
+class OccupancyIndexedDriverAssignmentRepository(AsyncDriverAssignmentRepository):
+    """Answers the occupancy of a travel date from `occupancy_index` instead of querying it.
+    The index only holds committed assignments, so the dates this repository has written to
+    are answered by the database until the request ends. The index of a process can lag
+    behind the writes of the others, so the lookups that decide whether an assignment is
+    written, the occupancy of a schedule and the destination checks, always go to the
+    database."""
+
+    def __init__(
+        self,
+        driver_assignment_repository: AsyncDriverAssignmentRepository,
+        occupancy_index: OccupancyIndex,
+    ) -> None:
+        self.driver_assignment_repository = driver_assignment_repository
+        self.occupancy_index = occupancy_index
+        self.written_dates = set()
+
+    async def load_missing_dates(
+        self, travel_dates: list[date]
+    ) -> dict[date, DayOccupancyModel]:
+        missing_dates = self.occupancy_index.get_missing_dates(travel_dates)
+        if not missing_dates:
+            return {}
+        versions = {
+            travel_date: self.occupancy_index.get_version(travel_date)
+            for travel_date in missing_dates
+        }
+        occupancy = await self.driver_assignment_repository.get_occupancy_at_dates(
+            missing_dates
+        )
+        for travel_date, day_occupancy in occupancy.items():
+            self.occupancy_index.set(day_occupancy, versions[travel_date])
+        return occupancy
+
+    async def read_occupancy(
+        self,
+        travel_dates: list[date],
+        read_occupancy: Callable[[DayOccupancyModel], object],
+    ) -> dict:
+        loaded = await self.load_missing_dates(travel_dates)
+        results = {}
+        for travel_date in travel_dates:
+            result = self.occupancy_index.read(travel_date, read_occupancy)
+            if result is None:
+                # Not kept by the index (evicted or raced with a write), so the loaded
+                # occupancy is only used by this request
+                if travel_date not in loaded:
+                    loaded.update(
+                        await self.driver_assignment_repository.get_occupancy_at_dates(
+                            [travel_date]
+                        )
+                    )
+                result = read_occupancy(loaded[travel_date])
+            results[travel_date] = result
+        return results
+
+    async def get_occupancy_at_dates(
+        self, travel_dates: list[date]
+    ) -> dict[date, DayOccupancyModel]:
+        return await self.driver_assignment_repository.get_occupancy_at_dates(travel_dates)
+
+    async def is_driver_or_vehicle_taken_at_date(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> bool:
+        if travel_date in self.written_dates:
+            return await self.driver_assignment_repository.is_driver_or_vehicle_taken_at_date(
+                driver_id, vehicle_id, travel_date
+            )
+        taken = await self.read_occupancy(
+            [travel_date],
+            lambda occupancy: occupancy.is_driver_or_vehicle_taken(driver_id, vehicle_id),
+        )
+        return taken[travel_date]
+
+    async def is_destination_taken_at_date(
+        self,
+        location: LocationModel,
+        travel_date: date,
+        exclude_assignment: DriverAssignmentIdModel | None = None,
+        radius_km: float = 0,
+    ) -> bool:
+        return await self.driver_assignment_repository.is_destination_taken_at_date(
+            location, travel_date, exclude_assignment, radius_km
+        )
+
+    async def assign_driver_to_vehicle(
+        self, driver_assignment: DriverAssignmentModel
+    ) -> DriverAssignmentModel | None:
+        # A refused insert writes nothing, so its date can still be answered by the index
+        created_driver_assignment = (
+            await self.driver_assignment_repository.assign_driver_to_vehicle(
+                driver_assignment
+            )
+        )
+        if created_driver_assignment:
+            self.written_dates.add(driver_assignment.travel_date)
+        return created_driver_assignment
+
+    async def update_driver_assignment(
+        self, driver_assignment: DriverAssignmentModel
+    ) -> DriverAssignmentModel:
+        self.written_dates.add(driver_assignment.travel_date)
+        return await self.driver_assignment_repository.update_driver_assignment(
+            driver_assignment
+        )
+
+    async def set_driver_assignment_as_inactive(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> None:
+        self.written_dates.add(travel_date)
+        await self.driver_assignment_repository.set_driver_assignment_as_inactive(
+            driver_id, vehicle_id, travel_date
+        )
+
+    async def create_driver_assignments(
+        self, driver_assignments: list[DriverAssignmentModel]
+    ) -> list[bool]:
+        self.written_dates.update(
+            driver_assignment.travel_date for driver_assignment in driver_assignments
+        )
+        return await self.driver_assignment_repository.create_driver_assignments(
+            driver_assignments
+        )
+
+    async def get_driver_assignments(
+        self,
+        only_actives: bool,
+        travel_date: date | None,
+        limit: int,
+        cursor: str | None,
+        travel_date_from: date | None = None,
+        travel_date_to: date | None = None,
+        driver_id: int | None = None,
+        vehicle_id: int | None = None,
+    ) -> PageModel:
+        return await self.driver_assignment_repository.get_driver_assignments(
+            only_actives,
+            travel_date,
+            limit,
+            cursor,
+            travel_date_from,
+            travel_date_to,
+            driver_id,
+            vehicle_id,
+        )
+
+    async def get_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> list[DriverAssignmentModel]:
+        return await self.driver_assignment_repository.get_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+            driver_id, vehicle_id, travel_date
+        )
+
+    async def get_driver_assignment(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> DriverAssignmentModel:
+        return await self.driver_assignment_repository.get_driver_assignment(
+            driver_id, vehicle_id, travel_date
+        )
+
+    async def get_active_driver_assignment_by_destination_location_at_date(
+        self,
+        location: LocationModel,
+        travel_date: date,
+        exclude_assignment: DriverAssignmentIdModel | None,
+    ) -> DriverAssignmentModel:
+        return await self.driver_assignment_repository.get_active_driver_assignment_by_destination_location_at_date(
+            location, travel_date, exclude_assignment
+        )
+
+    async def get_all_assignments_for_driver(
+        self, driver_id: int, limit: int, cursor: str | None
+    ) -> PageModel:
+        return await self.driver_assignment_repository.get_all_assignments_for_driver(
+            driver_id, limit, cursor
+        )
+
+    async def get_all_assignments_for_vehicle(
+        self, vehicle_id: int, limit: int, cursor: str | None
+    ) -> PageModel:
+        return await self.driver_assignment_repository.get_all_assignments_for_vehicle(
+            vehicle_id, limit, cursor
+        )
+
+    async def get_number_of_today_assignments(self):
+        return await self.driver_assignment_repository.get_number_of_today_assignments()
+
+    async def get_existing_driver_and_vehicle_ids(
+        self, driver_ids: list[int], vehicle_ids: list[int]
+    ) -> tuple[set[int], set[int]]:
+        return await self.driver_assignment_repository.get_existing_driver_and_vehicle_ids(
+            driver_ids, vehicle_ids
+        )
+
+    async def get_driver_assignment_locations_in_geohash_cells(
+        self,
+        cells: list[str] | None,
+        by_origin: bool,
+        travel_date_from: date,
+        travel_date_to: date,
+        only_actives: bool = False,
+    ) -> list[tuple[DriverAssignmentIdModel, LocationModel]]:
+        return await self.driver_assignment_repository.get_driver_assignment_locations_in_geohash_cells(
+            cells, by_origin, travel_date_from, travel_date_to, only_actives
+        )
+
+    async def get_driver_assignments_by_ids(
+        self, driver_assignment_ids: list[DriverAssignmentIdModel]
+    ) -> list[DriverAssignmentModel]:
+        return await self.driver_assignment_repository.get_driver_assignments_by_ids(
+            driver_assignment_ids
+        )
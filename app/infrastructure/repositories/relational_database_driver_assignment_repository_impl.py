@@ -1,104 +1,170 @@
 from datetime import date
-from pymysql import IntegrityError
-from sqlmodel import Session, select, or_
-from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.models.day_occupancy_model import DayOccupancyModel
 from app.domain.models.driver_assignment import (
     DriverAssignmentModel,
     LocationModel,
     DriverAssignmentIdModel,
 )
-from app.infrastructure.configs.sql_database import db_engine
+from app.domain.models.geo_location import (
+    encode_geohash,
+    get_geohash_cells_around,
+    is_any_within_radius,
+)
+from app.domain.models.page_model import PageModel
 from loguru import logger
 
 from app.application.repositories.driver_assingment_repository import (
     DriverAssignmentRepository,
 )
+from app.infrastructure.cache.cache_invalidation import track_written_instances
 from app.infrastructure.entities.driver_assignment_entity import DriverAssignment
 from app.infrastructure.mappers.driver_assignment_mappers import (
     map_driver_assignment_entity_to_driver_assignment_model,
     map_driver_assignment_model_to_driver_assignment_entity,
 )
+from app.infrastructure.queries.driver_assignment_queries import (
+    DRIVER_ASSIGNMENT_PAGE_ORDER,
+    LOCATION_ATTRIBUTES,
+    RELATED_ENTITIES,
+    insert_driver_assignment_if_available,
+    select_active_driver_assignment_by_destination_location_at_date,
+    select_active_destinations_in_geohash_cells,
+    select_active_driver_assignments_with_driver_id_or_vehicle_id_at_date,
+    select_driver_assignment_locations_in_geohash_cells,
+    select_driver_assignments,
+    select_driver_assignments_by_ids,
+    select_existing_driver_and_vehicle_ids,
+    select_is_destination_taken_at_date,
+    select_is_driver_or_vehicle_taken_at_date,
+    select_occupancy_at_dates,
+)
+from app.infrastructure.queries.keyset_pagination import apply_keyset, build_page
+from app.infrastructure.queries.metrics_queries import count_today_assignments
 
 
 class RelationalDatabaseDriverAssignmentRepositoryImpl(DriverAssignmentRepository):
 
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_driver_assignment_entity(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> DriverAssignment | None:
+        return self.session.get(
+            DriverAssignment,
+            (driver_id, vehicle_id, travel_date),
+            options=RELATED_ENTITIES,
+            populate_existing=True,
+        )
+
+    def get_driver_assignments_page(
+        self, statement, limit: int, cursor: str | None
+    ) -> PageModel:
+        driver_assignment_entities = self.session.exec(
+            apply_keyset(
+                statement, DRIVER_ASSIGNMENT_PAGE_ORDER, cursor, limit, descending=True
+            )
+        ).all()
+        return build_page(
+            driver_assignment_entities,
+            DRIVER_ASSIGNMENT_PAGE_ORDER,
+            limit,
+            map_driver_assignment_entity_to_driver_assignment_model,
+        )
+
     def assign_driver_to_vehicle(
         self, driver_assignment: DriverAssignmentModel
-    ) -> DriverAssignmentModel:
+    ) -> DriverAssignmentModel | None:
         logger.debug("Method called: relational_database_driver_assignment_repository_impl.assign_driver_to_vehicle()")
-        logger.debug(f"Params passed: {driver_assignment.__dict__}")
-        with Session(db_engine) as session:
-            driver_assignment_entity = (
-                map_driver_assignment_model_to_driver_assignment_entity(
-                    driver_assignment
+        logger.debug("Params passed: {}", driver_assignment.__dict__)
+        driver_assignment_entity = (
+            map_driver_assignment_model_to_driver_assignment_entity(driver_assignment)
+        )
+        try:
+            # In a savepoint so a conflict doesn't undo the earlier writes of the request
+            with self.session.begin_nested():
+                result = self.session.exec(
+                    insert_driver_assignment_if_available(
+                        driver_assignment_entity, driver_assignment.destination_location
+                    )
                 )
+        except IntegrityError:
+            raise ConflictWithExistingResourceException(
+                "Driver assignment for the driver and vehicle already exists at the same day"
             )
-            session.add(driver_assignment_entity)
-            try:
-                session.commit()
-            except IntegrityError:
-                session.rollback()
-                raise ResourceNotFoundException("Driver or vehicle to assign not found")
-            else:
-                session.refresh(driver_assignment_entity)
-            return map_driver_assignment_entity_to_driver_assignment_model(
-                driver_assignment_entity
-            )
+        if not result.rowcount:
+            return None
+        driver_assignment_entity = self.get_driver_assignment_entity(
+            driver_assignment.driver_id,
+            driver_assignment.vehicle_id,
+            driver_assignment.travel_date,
+        )
+        track_written_instances(self.session, [driver_assignment_entity])
+        return map_driver_assignment_entity_to_driver_assignment_model(
+            driver_assignment_entity
+        )
 
     def get_driver_assignments(
-        self, only_actives: bool, travel_date: date | None
-    ) -> list[DriverAssignmentModel]:
+        self,
+        only_actives: bool,
+        travel_date: date | None,
+        limit: int,
+        cursor: str | None,
+        travel_date_from: date | None = None,
+        travel_date_to: date | None = None,
+        driver_id: int | None = None,
+        vehicle_id: int | None = None,
+    ) -> PageModel:
         logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_driver_assignments()")
-        logger.debug(f"Params passed: {only_actives} and {travel_date}")
-        with Session(db_engine) as session:
-            statement = select(DriverAssignment)
-            if travel_date:
-                statement = statement.where(DriverAssignment.travel_date == travel_date)
-            if only_actives:
-                statement = statement.where(DriverAssignment.active)
-            driver_assignment_entities = session.exec(
-                statement.order_by(
-                    DriverAssignment.travel_date.desc(),
-                    DriverAssignment.creation_date.desc(),
-                )
-            ).all()
-            return [
-                map_driver_assignment_entity_to_driver_assignment_model(
-                    driver_assignment_entity
-                )
-                for driver_assignment_entity in driver_assignment_entities
-            ]
+        logger.debug(
+            "Params passed: {}, {}, {}, {}, {}, {}, {} and {}",
+            only_actives,
+            travel_date,
+            limit,
+            cursor,
+            travel_date_from,
+            travel_date_to,
+            driver_id,
+            vehicle_id,
+        )
+        statement = select_driver_assignments(
+            only_actives,
+            travel_date,
+            travel_date_from,
+            travel_date_to,
+            driver_id,
+            vehicle_id,
+        )
+        return self.get_driver_assignments_page(statement, limit, cursor)
 
     def get_driver_assignment(
         self, driver_id: int, vehicle_id: int, travel_date: date
     ) -> DriverAssignmentModel:
         logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_driver_assignment()")
-        logger.debug(f"Params passed: {driver_id}, {vehicle_id}, {travel_date}")
-        with Session(db_engine) as session:
-            driver_assignment_entity = session.get(
-                DriverAssignment, (driver_id, vehicle_id, travel_date)
-            )
-            if driver_assignment_entity:
-                return map_driver_assignment_entity_to_driver_assignment_model(
-                    driver_assignment_entity
-                )
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        driver_assignment_entity = self.get_driver_assignment_entity(
+            driver_id, vehicle_id, travel_date
+        )
+        if driver_assignment_entity:
+            return map_driver_assignment_entity_to_driver_assignment_model(
+                driver_assignment_entity
+            )
 
     def get_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
         self, driver_id: int, vehicle_id: int, travel_date: date
     ) -> list[DriverAssignmentModel]:
         logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_active_driver_assignments_with_driver_id_or_vehicle_id_at_date()")
-        logger.debug(f"Params passed: {driver_id}, {vehicle_id}, {travel_date}")
-        with Session(db_engine) as session:
-            driver_assignment_entities = session.exec(
-                select(DriverAssignment).where(
-                    or_(
-                        DriverAssignment.driver_id == driver_id,
-                        DriverAssignment.vehicle_id == vehicle_id,
-                    ),
-                    DriverAssignment.travel_date == travel_date,
-                    DriverAssignment.active,
-                )
-            ).all()
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        driver_assignment_entities = self.session.exec(
+            select_active_driver_assignments_with_driver_id_or_vehicle_id_at_date(
+                driver_id, vehicle_id, travel_date
+            )
+        ).all()
         return [
             map_driver_assignment_entity_to_driver_assignment_model(
                 driver_assignment_entity
@@ -113,20 +179,12 @@ class RelationalDatabaseDriverAssignmentRepositoryImpl(DriverAssignmentRepositor
         exclude_assignment: DriverAssignmentIdModel | None,
     ) -> DriverAssignmentModel:
         logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_active_driver_assignment_by_destination_location_at_date()")
-        logger.debug(f"Params passed: {location.__dict__}, {travel_date}")
-        with Session(db_engine) as session:
-            statement = select(DriverAssignment).where(
-                DriverAssignment.destination_location_latitude == location.latitude,
-                DriverAssignment.destination_location_longitude == location.longitude,
-                DriverAssignment.travel_date == travel_date,
-                DriverAssignment.active,
-            )
-            if exclude_assignment:
-                statement = statement.where(
-                    DriverAssignment.driver_id != exclude_assignment.driver_id,
-                    DriverAssignment.vehicle_id != exclude_assignment.vehicle_id,
-                )
-            driver_assignment_entity = session.exec(statement).first()
+        logger.debug("Params passed: {}, {}", location.__dict__, travel_date)
+        driver_assignment_entity = self.session.exec(
+            select_active_driver_assignment_by_destination_location_at_date(
+                location, travel_date, exclude_assignment
+            )
+        ).first()
         if driver_assignment_entity:
             return map_driver_assignment_entity_to_driver_assignment_model(
                 driver_assignment_entity
@@ -136,41 +194,47 @@ class RelationalDatabaseDriverAssignmentRepositoryImpl(DriverAssignmentRepositor
         self, driver_assignment: DriverAssignmentModel
     ) -> DriverAssignmentModel:
         logger.debug("Method called: relational_database_driver_assignment_repository_impl.update_driver_assignment()")
-        logger.debug(f"Params passed: {driver_assignment.__dict__}")
-        with Session(db_engine) as session:
-            driver_assignment_entity = session.get(
-                DriverAssignment,
-                (
-                    driver_assignment.driver_id,
-                    driver_assignment.vehicle_id,
-                    driver_assignment.travel_date,
-                ),
-            )
-            if driver_assignment_entity:
-                driver_assignment_entity.route_name = driver_assignment.route_name
-                driver_assignment_entity.origin_location_latitude = (
-                    driver_assignment.origin_location.latitude
-                )
-                driver_assignment_entity.origin_location_longitude = (
-                    driver_assignment.origin_location.longitude
-                )
-                driver_assignment_entity.destination_location_latitude = (
-                    driver_assignment.destination_location.latitude
-                )
-                driver_assignment_entity.destination_location_longitude = (
-                    driver_assignment.destination_location.longitude
-                )
-                driver_assignment_entity.completed_successfully = (
-                    driver_assignment.completed_successfully
-                )
-                driver_assignment_entity.problem_description = (
-                    driver_assignment.problem_description
-                )
-                driver_assignment_entity.comments = driver_assignment.comments
-                session.add(driver_assignment_entity)
-                session.commit()
-                session.refresh(driver_assignment_entity)
+        logger.debug("Params passed: {}", driver_assignment.__dict__)
+        driver_assignment_entity = self.get_driver_assignment_entity(
+            driver_assignment.driver_id,
+            driver_assignment.vehicle_id,
+            driver_assignment.travel_date,
+        )
         if driver_assignment_entity:
+            driver_assignment_entity.route_name = driver_assignment.route_name
+            driver_assignment_entity.origin_location_latitude = (
+                driver_assignment.origin_location.latitude
+            )
+            driver_assignment_entity.origin_location_longitude = (
+                driver_assignment.origin_location.longitude
+            )
+            driver_assignment_entity.destination_location_latitude = (
+                driver_assignment.destination_location.latitude
+            )
+            driver_assignment_entity.destination_location_longitude = (
+                driver_assignment.destination_location.longitude
+            )
+            driver_assignment_entity.origin_geohash = encode_geohash(
+                driver_assignment.origin_location.latitude,
+                driver_assignment.origin_location.longitude,
+            )
+            driver_assignment_entity.destination_geohash = encode_geohash(
+                driver_assignment.destination_location.latitude,
+                driver_assignment.destination_location.longitude,
+            )
+            driver_assignment_entity.completed_successfully = (
+                driver_assignment.completed_successfully
+            )
+            driver_assignment_entity.problem_description = (
+                driver_assignment.problem_description
+            )
+            driver_assignment_entity.comments = driver_assignment.comments
+            self.session.add(driver_assignment_entity)
+            self.session.flush()
+            # Coordinates are read back as the database stored them, like after an insert
+            self.session.refresh(
+                driver_assignment_entity, attribute_names=LOCATION_ATTRIBUTES
+            )
             return map_driver_assignment_entity_to_driver_assignment_model(
                 driver_assignment_entity
             )
@@ -179,59 +243,188 @@ class RelationalDatabaseDriverAssignmentRepositoryImpl(DriverAssignmentRepositor
         self, driver_id: int, vehicle_id: int, travel_date: date
     ) -> None:
         logger.debug("Method called: relational_database_driver_assignment_repository_impl.set_driver_assignment_as_inactive()")
-        logger.debug(f"Params passed: {driver_id}, {vehicle_id}, {travel_date}")
-        with Session(db_engine) as session:
-            driver_assignment_entity = session.get(
-                DriverAssignment, (driver_id, vehicle_id, travel_date)
-            )
-            if driver_assignment_entity:
-                driver_assignment_entity.active = False
-                session.commit()
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        driver_assignment_entity = self.session.get(
+            DriverAssignment, (driver_id, vehicle_id, travel_date)
+        )
+        if driver_assignment_entity:
+            driver_assignment_entity.active = False
+            self.session.flush()
 
     def get_all_assignments_for_driver(
-        self, driver_id: int
-    ) -> list[DriverAssignmentModel]:
+        self, driver_id: int, limit: int, cursor: str | None
+    ) -> PageModel:
         logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_all_assignments_for_driver()")
-        logger.debug(f"Params passed: {driver_id}")
-        with Session(db_engine) as session:
-            driver_assignment_entities = session.exec(
-                select(DriverAssignment).where(DriverAssignment.driver_id == driver_id)
-            ).all()
+        logger.debug("Params passed: {}, {} and {}", driver_id, limit, cursor)
+        return self.get_driver_assignments_page(
+            select_driver_assignments(driver_id=driver_id), limit, cursor
+        )
+
+    def get_all_assignments_for_vehicle(
+        self, vehicle_id: int, limit: int, cursor: str | None
+    ) -> PageModel:
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_all_assignments_for_vehicle()")
+        logger.debug("Params passed: {}, {} and {}", vehicle_id, limit, cursor)
+        return self.get_driver_assignments_page(
+            select_driver_assignments(vehicle_id=vehicle_id), limit, cursor
+        )
+
+    def get_number_of_today_assignments(self) -> int:
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_number_of_today_assignments()")
+        number_of_assignments = self.session.exec(count_today_assignments()).one()
+        return number_of_assignments
+
+    def get_occupancy_at_dates(
+        self, travel_dates: list[date]
+    ) -> dict[date, DayOccupancyModel]:
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_occupancy_at_dates()")
+        logger.debug("Params passed: {}", travel_dates)
+        occupancy = {
+            travel_date: DayOccupancyModel(travel_date) for travel_date in travel_dates
+        }
+        for (
+            driver_id,
+            vehicle_id,
+            travel_date,
+            destination_latitude,
+            destination_longitude,
+            active,
+        ) in self.session.exec(
+            select_occupancy_at_dates(travel_dates)
+        ).all():
+            occupancy[travel_date].add(
+                driver_id,
+                vehicle_id,
+                LocationModel(destination_latitude, destination_longitude),
+                active,
+            )
+        return occupancy
+
+    def get_existing_driver_and_vehicle_ids(
+        self, driver_ids: list[int], vehicle_ids: list[int]
+    ) -> tuple[set[int], set[int]]:
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_existing_driver_and_vehicle_ids()")
+        logger.debug("Params passed: {} and {}", driver_ids, vehicle_ids)
+        existing_ids = self.session.exec(
+            select_existing_driver_and_vehicle_ids(driver_ids, vehicle_ids)
+        ).all()
+        return (
+            {id for kind, id in existing_ids if kind == "driver"},
+            {id for kind, id in existing_ids if kind == "vehicle"},
+        )
+
+    def create_driver_assignments(
+        self, driver_assignments: list[DriverAssignmentModel]
+    ) -> list[bool]:
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.create_driver_assignments()")
+        logger.debug("Params passed: {} driver assignments", len(driver_assignments))
+        written = []
+        written_entities = []
+        try:
+            # In a savepoint so a conflicting schedule leaves the rest of the transaction alone
+            with self.session.begin_nested():
+                for driver_assignment in driver_assignments:
+                    driver_assignment_entity = (
+                        map_driver_assignment_model_to_driver_assignment_entity(
+                            driver_assignment
+                        )
+                    )
+                    # Each row goes through the same guarded insert as a single assignment,
+                    # so one taken since the caller's lookup is refused instead of written
+                    result = self.session.exec(
+                        insert_driver_assignment_if_available(
+                            driver_assignment_entity, driver_assignment.destination_location
+                        )
+                    )
+                    written.append(bool(result.rowcount))
+                    if result.rowcount:
+                        written_entities.append(driver_assignment_entity)
+        except IntegrityError:
+            raise ConflictWithExistingResourceException(
+                "Driver assignment for the driver and vehicle already exists at the same day"
+            )
+        track_written_instances(self.session, written_entities)
+        return written
+
+    def is_driver_or_vehicle_taken_at_date(
+        self, driver_id: int, vehicle_id: int, travel_date: date
+    ) -> bool:
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.is_driver_or_vehicle_taken_at_date()")
+        logger.debug("Params passed: {}, {}, {}", driver_id, vehicle_id, travel_date)
+        return bool(
+            self.session.exec(
+                select_is_driver_or_vehicle_taken_at_date(
+                    driver_id, vehicle_id, travel_date
+                )
+            ).one()
+        )
+
+    def is_destination_taken_at_date(
+        self,
+        location: LocationModel,
+        travel_date: date,
+        exclude_assignment: DriverAssignmentIdModel | None = None,
+        radius_km: float = 0,
+    ) -> bool:
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.is_destination_taken_at_date()")
+        logger.debug("Params passed: {}, {}, {}", location.__dict__, travel_date, radius_km)
+        if not radius_km:
+            return bool(
+                self.session.exec(
+                    select_is_destination_taken_at_date(
+                        location, travel_date, exclude_assignment
+                    )
+                ).one()
+            )
+        destinations = self.session.exec(
+            select_active_destinations_in_geohash_cells(
+                get_geohash_cells_around(location, radius_km),
+                travel_date,
+                exclude_assignment,
+            )
+        ).all()
+        return is_any_within_radius(
+            location,
+            [LocationModel(latitude, longitude) for latitude, longitude in destinations],
+            radius_km,
+        )
+
+    def get_driver_assignment_locations_in_geohash_cells(
+        self,
+        cells: list[str] | None,
+        by_origin: bool,
+        travel_date_from: date,
+        travel_date_to: date,
+        only_actives: bool = False,
+    ) -> list[tuple[DriverAssignmentIdModel, LocationModel]]:
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_driver_assignment_locations_in_geohash_cells()")
+        logger.debug("Params passed: {}, {}, {}, {} and {}", cells, by_origin, travel_date_from, travel_date_to, only_actives)
+        locations = self.session.exec(
+            select_driver_assignment_locations_in_geohash_cells(
+                cells, by_origin, travel_date_from, travel_date_to, only_actives
+            )
+        ).all()
         return [
-            map_driver_assignment_entity_to_driver_assignment_model(
-                driver_assignment_entity
+            (
+                DriverAssignmentIdModel(driver_id, vehicle_id, assignment_travel_date),
+                LocationModel(latitude, longitude),
             )
-            for driver_assignment_entity in driver_assignment_entities
+            for driver_id, vehicle_id, assignment_travel_date, latitude, longitude in locations
         ]
 
-    def get_all_assignments_for_vehicle(
-        self, vehicle_id: int
+    def get_driver_assignments_by_ids(
+        self, driver_assignment_ids: list[DriverAssignmentIdModel]
     ) -> list[DriverAssignmentModel]:
-        logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_all_assignments_for_vehicle()")
-        logger.debug(f"Params passed: {vehicle_id}")
-        with Session(db_engine) as session:
-            driver_assignment_entities = session.exec(
-                select(DriverAssignment).where(
-                    DriverAssignment.vehicle_id == vehicle_id
-                )
-            ).all()
+        logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_driver_assignments_by_ids()")
+        logger.debug("Params passed: {} driver assignment ids", len(driver_assignment_ids))
+        if not driver_assignment_ids:
+            return []
+        driver_assignment_entities = self.session.exec(
+            select_driver_assignments_by_ids(driver_assignment_ids)
+        ).all()
         return [
             map_driver_assignment_entity_to_driver_assignment_model(
                 driver_assignment_entity
             )
             for driver_assignment_entity in driver_assignment_entities
         ]
-
-    def get_number_of_today_assignments(self) -> int:
-        logger.debug("Method called: relational_database_driver_assignment_repository_impl.get_number_of_today_assignments()")
-        today = date.today()
-        formatted_date = today.strftime("%Y-%m-%d")
-        with Session(db_engine) as session:
-            number_of_assignments = len(
-                session.exec(
-                    select(DriverAssignment).where(
-                        DriverAssignment.travel_date == formatted_date
-                    )
-                ).all()
-            )
-        return number_of_assignments
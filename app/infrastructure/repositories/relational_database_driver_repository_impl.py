@@ -1,90 +1,148 @@
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from loguru import logger
 
 from app.application.repositories.driver_repository import DriverRepository
 from app.domain.models.driver_model import DriverModel
-from app.infrastructure.configs.sql_database import db_engine
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.models.page_model import PageModel
+from app.infrastructure.cache.cache_invalidation import track_written_instances
 from app.infrastructure.entities.driver_entity import Driver
 from app.infrastructure.mappers.driver_mappers import (
     map_driver_entity_to_driver_model,
     map_driver_model_to_driver_entity,
 )
+from app.infrastructure.queries.driver_queries import (
+    DRIVER_PAGE_ORDER,
+    select_drivers,
+    select_taken_driver_keys,
+)
+from app.infrastructure.queries.keyset_pagination import apply_keyset, build_page
+from app.infrastructure.queries.metrics_queries import count_rows
 
 
 class RelationalDatabaseDriverRepositoryImpl(DriverRepository):
 
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
     def get_driver_by_driver_id(self, driver_id: int) -> DriverModel | None:
         logger.debug("Method called: relational_database_driver_repository_impl.get_driver_by_driver_id()")
-        logger.debug(f"Params passed: {driver_id}")
-        with Session(db_engine) as session:
-            driver_entity = session.exec(
-                select(Driver).where(Driver.id == driver_id)
-            ).first()
+        logger.debug("Params passed: {}", driver_id)
+        driver_entity = self.session.exec(
+            select(Driver).where(Driver.id == driver_id)
+        ).first()
 
-            if driver_entity:
-                return map_driver_entity_to_driver_model(driver_entity)
-            else:
-                return None
+        if driver_entity:
+            return map_driver_entity_to_driver_model(driver_entity)
+        else:
+            return None
 
     def get_driver_by_curp(self, curp: str) -> DriverModel | None:
         logger.debug("Method called: relational_database_driver_repository_impl.get_driver_by_curp()")
-        logger.debug(f"Params passed: {curp}")
-        with Session(db_engine) as session:
-            driver_entity = session.exec(
-                select(Driver).where(Driver.curp == curp)
-            ).first()
+        logger.debug("Params passed: {}", curp)
+        driver_entity = self.session.exec(
+            select(Driver).where(Driver.curp == curp)
+        ).first()
 
-            if driver_entity:
-                return map_driver_entity_to_driver_model(driver_entity)
+        if driver_entity:
+            return map_driver_entity_to_driver_model(driver_entity)
 
-    def get_all_drivers(self) -> list[DriverModel]:
+    def get_all_drivers(
+        self,
+        limit: int,
+        cursor: str | None,
+        name: str | None = None,
+        last_name: str | None = None,
+    ) -> PageModel:
         logger.debug("Method called: relational_database_driver_repository_impl.get_all_drivers()")
-        with Session(db_engine) as session:
-            drivers_entity = session.exec(select(Driver)).all()
-            return [
-                map_driver_entity_to_driver_model(driver) for driver in drivers_entity
-            ]
+        logger.debug("Params passed: {}, {}, {} and {}", limit, cursor, name, last_name)
+        drivers_entity = self.session.exec(
+            apply_keyset(
+                select_drivers(name, last_name), DRIVER_PAGE_ORDER, cursor, limit
+            )
+        ).all()
+        return build_page(
+            drivers_entity, DRIVER_PAGE_ORDER, limit, map_driver_entity_to_driver_model
+        )
 
     def save_driver(self, driver: DriverModel) -> DriverModel:
         logger.debug("Method called: relational_database_driver_repository_impl.save_driver()")
-        logger.debug(f"Params passed: {driver.__dict__}")
-        with Session(db_engine) as session:
-            driver_entity = None
-
-            if driver.id:
-                driver_entity = session.exec(
-                    select(Driver).where(Driver.id == driver.id)
-                ).one()
-
-                driver_entity.first_name = driver.name
-                driver_entity.last_name = driver.last_name
-                driver_entity.birth_date = driver.birth_date
-                driver_entity.curp = driver.curp
-                driver_entity.address = driver.address
-                driver_entity.monthly_salary = driver.monthly_salary
-                driver_entity.license_number = driver.driving_license
-                driver_entity.entry_date = driver.registration_date
-            else:
-                driver_entity = map_driver_model_to_driver_entity(driver)
-
-            session.add(driver_entity)
-            session.commit()
-            session.refresh(driver_entity)
-            return map_driver_entity_to_driver_model(driver_entity)
+        logger.debug("Params passed: {}", driver.__dict__)
+        try:
+            # In a savepoint so a conflict doesn't undo the earlier writes of the request
+            with self.session.begin_nested():
+                if driver.id:
+                    driver_entity = self.session.exec(
+                        select(Driver).where(Driver.id == driver.id)
+                    ).one()
+
+                    driver_entity.first_name = driver.name
+                    driver_entity.last_name = driver.last_name
+                    driver_entity.birth_date = driver.birth_date
+                    driver_entity.curp = driver.curp
+                    driver_entity.address = driver.address
+                    driver_entity.monthly_salary = driver.monthly_salary
+                    driver_entity.license_number = driver.driving_license
+                    driver_entity.entry_date = driver.registration_date
+                else:
+                    driver_entity = map_driver_model_to_driver_entity(driver)
+                self.session.add(driver_entity)
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        self.session.refresh(driver_entity)
+        return map_driver_entity_to_driver_model(driver_entity)
 
     def delete_driver_by_driver_id(self, driver_id: int) -> None:
         logger.debug("Method called: relational_database_driver_repository_impl.delete_driver_by_driver_id()")
-        logger.debug(f"Params passed: {driver_id}")
-        with Session(db_engine) as session:
-            driver_entity = session.exec(
-                select(Driver).where(Driver.id == driver_id)
-            ).one()
+        logger.debug("Params passed: {}", driver_id)
+        driver_entity = self.session.exec(
+            select(Driver).where(Driver.id == driver_id)
+        ).one()
 
-            session.delete(driver_entity)
-            session.commit()
+        self.session.delete(driver_entity)
+        self.session.flush()
 
     def get_number_of_drivers(self) -> int:
         logger.debug("Method called: relational_database_driver_repository_impl.get_number_of_drivers()")
-        with Session(db_engine) as session:
-            number_of_drivers = len(session.exec(select(Driver)).all())
+        number_of_drivers = self.session.exec(count_rows(Driver)).one()
         return number_of_drivers
+
+    def get_taken_driver_keys(
+        self, drivers: list[DriverModel]
+    ) -> dict[str, set[str]]:
+        logger.debug("Method called: relational_database_driver_repository_impl.get_taken_driver_keys()")
+        logger.debug("Params passed: {} drivers", len(drivers))
+        taken_keys = self.session.exec(
+            select_taken_driver_keys(
+                [driver.curp for driver in drivers],
+                [driver.driving_license for driver in drivers],
+            )
+        ).all()
+        return {
+            "curp": {curp for curp, _ in taken_keys},
+            "driving_license": {license_number for _, license_number in taken_keys},
+        }
+
+    def create_drivers(self, drivers: list[DriverModel]) -> None:
+        logger.debug("Method called: relational_database_driver_repository_impl.create_drivers()")
+        logger.debug("Params passed: {} drivers", len(drivers))
+        driver_entities = [
+            map_driver_model_to_driver_entity(driver) for driver in drivers
+        ]
+        try:
+            # In a savepoint so a conflicting batch doesn't undo the ones inserted before it
+            with self.session.begin_nested():
+                self.session.exec(
+                    insert(Driver),
+                    params=[
+                        driver_entity.model_dump(exclude={"id"})
+                        for driver_entity in driver_entities
+                    ],
+                )
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        track_written_instances(self.session, driver_entities)
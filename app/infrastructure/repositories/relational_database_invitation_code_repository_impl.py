@@ -1,98 +1,108 @@
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from loguru import logger
 
 from app.application.repositories.invitation_code_repository import (
     InvitationCodeRepository,
 )
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
 from app.domain.models.invitation_code_model import InvitationCodeModel
-from app.infrastructure.configs.sql_database import db_engine
 from app.infrastructure.entities.invitation_code_entity import InvitationCode
 from app.infrastructure.mappers.invitation_code_mappers import (
     map_invitation_code_entity_to_invitation_code_model,
     map_invitation_code_model_to_invitation_code_entity,
 )
+from app.infrastructure.queries.invitation_code_queries import select_email_in_use
 
 
 class RelationalDatabaseInvitationCodeRepositoryImpl(InvitationCodeRepository):
 
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
     def get_invitation_code_by_code(self, code: str) -> InvitationCodeModel | None:
         logger.debug("Method called: relational_database_invitation_code_repository_impl.get_invitation_code_by_code()")
-        logger.debug(f"Params passed: {code}")
-        with Session(db_engine) as session:
-            invitation_code_entity = session.exec(
-                select(InvitationCode).where(InvitationCode.code == code)
-            ).first()
+        logger.debug("Params passed: {}", code)
+        invitation_code_entity = self.session.exec(
+            select(InvitationCode).where(InvitationCode.code == code)
+        ).first()
 
-            if invitation_code_entity:
-                return map_invitation_code_entity_to_invitation_code_model(
-                    invitation_code_entity
-                )
+        if invitation_code_entity:
+            return map_invitation_code_entity_to_invitation_code_model(
+                invitation_code_entity
+            )
 
     def get_invitation_code_by_email(self, email: str) -> InvitationCodeModel | None:
         logger.debug("Method called: relational_database_invitation_code_repository_impl.get_invitation_code_by_email()")
-        logger.debug(f"Params passed: {email}")
-        with Session(db_engine) as session:
-            invitation_code_entity = session.exec(
-                select(InvitationCode).where(InvitationCode.email == email)
-            ).first()
+        logger.debug("Params passed: {}", email)
+        invitation_code_entity = self.session.exec(
+            select(InvitationCode).where(InvitationCode.email == email)
+        ).first()
+
+        if invitation_code_entity:
+            return map_invitation_code_entity_to_invitation_code_model(
+                invitation_code_entity
+            )
 
-            if invitation_code_entity:
-                return map_invitation_code_entity_to_invitation_code_model(
-                    invitation_code_entity
-                )
+    def is_email_in_use(self, email: str) -> bool:
+        logger.debug("Method called: relational_database_invitation_code_repository_impl.is_email_in_use()")
+        logger.debug("Params passed: {}", email)
+        return bool(self.session.exec(select_email_in_use(email)).one())
 
     def get_invitation_code_by_code_and_email(
         self, code: str, email: str
     ) -> InvitationCodeModel | None:
         logger.debug("Method called: relational_database_invitation_code_repository_impl.get_invitation_code_by_code_and_email()")
-        logger.debug(f"Params passed: {code} and {email}")
-        with Session(db_engine) as session:
-            invitation_code_entity = session.exec(
-                select(InvitationCode).where(
-                    InvitationCode.code == code, InvitationCode.email == email
-                )
-            ).first()
+        logger.debug("Params passed: {} and {}", code, email)
+        invitation_code_entity = self.session.exec(
+            select(InvitationCode).where(
+                InvitationCode.code == code, InvitationCode.email == email
+            )
+        ).first()
 
-            if invitation_code_entity:
-                return map_invitation_code_entity_to_invitation_code_model(
-                    invitation_code_entity
-                )
+        if invitation_code_entity:
+            return map_invitation_code_entity_to_invitation_code_model(
+                invitation_code_entity
+            )
 
     def save_invitation_code(
         self, invitation_code: InvitationCodeModel
     ) -> InvitationCodeModel:
         logger.debug("Method called: relational_database_invitation_code_repository_impl.save_invitation_code()")
-        logger.debug(f"Params passed: {invitation_code.__dict__}")
-        with Session(db_engine) as session:
-            invitation_code_entity = None
+        logger.debug("Params passed: {}", invitation_code.__dict__)
+        try:
+            # In a savepoint so a conflict doesn't undo the earlier writes of the request
+            with self.session.begin_nested():
+                if invitation_code.code:
+                    invitation_code_entity = self.session.exec(
+                        select(InvitationCode).where(
+                            InvitationCode.code == invitation_code.code
+                        )
+                    ).one()
 
-            if invitation_code.code:
-                invitation_code_entity = session.exec(
-                    select(InvitationCode).where(
-                        InvitationCode.code == invitation_code.code
+                    invitation_code_entity.email = invitation_code.email
+                else:
+                    invitation_code_entity = (
+                        map_invitation_code_model_to_invitation_code_entity(
+                            invitation_code
+                        )
                     )
-                ).one()
-
-                invitation_code_entity.email = invitation_code.email
-            else:
-                invitation_code_entity = (
-                    map_invitation_code_model_to_invitation_code_entity(invitation_code)
-                )
-
-            session.add(invitation_code_entity)
-            session.commit()
-            session.refresh(invitation_code_entity)
-            return map_invitation_code_entity_to_invitation_code_model(
-                invitation_code_entity
-            )
+                self.session.add(invitation_code_entity)
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        self.session.refresh(invitation_code_entity)
+        return map_invitation_code_entity_to_invitation_code_model(
+            invitation_code_entity
+        )
 
     def delete_invitation_code_by_code(self, code: str) -> None:
         logger.debug("Method called: relational_database_invitation_code_repository_impl.delete_invitation_code_by_code()")
-        logger.debug(f"Params passed: {code}")
-        with Session(db_engine) as session:
-            invitation_code_entity = session.exec(
-                select(InvitationCode).where(InvitationCode.code == code)
-            ).one()
+        logger.debug("Params passed: {}", code)
+        invitation_code_entity = self.session.exec(
+            select(InvitationCode).where(InvitationCode.code == code)
+        ).one()
 
-            session.delete(invitation_code_entity)
-            session.commit()
+        self.session.delete(invitation_code_entity)
+        self.session.flush()
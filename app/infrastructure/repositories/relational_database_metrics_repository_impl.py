@@ -0,0 +1,17 @@
+from sqlmodel import Session
+from loguru import logger
+
+from app.application.repositories.metrics_repository import MetricsRepository
+from app.domain.models.metrics_model import MetricsModel
+from app.infrastructure.queries.metrics_queries import select_metrics
+
+
+class RelationalDatabaseMetricsRepositoryImpl(MetricsRepository):
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_metrics(self) -> MetricsModel:
+        logger.debug("Method called: relational_database_metrics_repository_impl.get_metrics()")
+        metrics = self.session.exec(select_metrics()).one()
+        return MetricsModel(**metrics._asdict())
@@ -0,0 +1,24 @@
+from datetime import date
+from sqlmodel import Session
+from loguru import logger
+
+from app.application.repositories.mileage_repository import MileageRepository
+from app.domain.models.mileage_model import RouteColumnsModel
+from app.infrastructure.mappers.mileage_mappers import (
+    map_route_rows_to_route_columns_model,
+)
+from app.infrastructure.queries.mileage_queries import select_active_routes_in_date_ranges
+
+
+class RelationalDatabaseMileageRepositoryImpl(MileageRepository):
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get_active_route_columns(
+        self, date_ranges: list[tuple[date, date]]
+    ) -> RouteColumnsModel:
+        logger.debug("Method called: relational_database_mileage_repository_impl.get_active_route_columns()")
+        logger.debug("Params passed: {}", date_ranges)
+        rows = self.session.exec(select_active_routes_in_date_ranges(date_ranges)).all()
+        return map_route_rows_to_route_columns_model(rows)
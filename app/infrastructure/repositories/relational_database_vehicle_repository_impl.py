@@ -1,103 +1,162 @@
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
-from typing import List
 from loguru import logger
 
 from app.application.repositories.vehicle_repository import (
     VehicleRepository,
 )
-from app.infrastructure.configs.sql_database import db_engine
+from app.infrastructure.cache.cache_invalidation import track_written_instances
 from app.infrastructure.entities.vehicle_entity import Vehicle
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.models.page_model import PageModel
 from app.domain.models.vehicle_model import VehicleModel
 from app.infrastructure.mappers.vehicle_mappers import (
     map_vehicle_entity_to_vehicle_model,
     map_vehicle_model_to_vehicle_entity,
 )
+from app.infrastructure.queries.keyset_pagination import apply_keyset, build_page
+from app.infrastructure.queries.metrics_queries import count_rows
+from app.infrastructure.queries.vehicle_queries import (
+    VEHICLE_PAGE_ORDER,
+    select_taken_vehicle_keys,
+    select_vehicles,
+)
 
 
 class RelationalDatabaseVehicleRepositoryImpl(VehicleRepository):
 
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
     def get_vehicle_by_id(self, id: int) -> VehicleModel | None:
         logger.debug("Method called: relational_database_vehicle_repository_impl.get_vehicle_by_id()")
-        logger.debug(f"Params passed: {id}")
-        with Session(db_engine) as session:
-            vehicle_entity = session.exec(
-                select(Vehicle).where(Vehicle.id == id)
-            ).first()
+        logger.debug("Params passed: {}", id)
+        vehicle_entity = self.session.exec(
+            select(Vehicle).where(Vehicle.id == id)
+        ).first()
 
-            if vehicle_entity:
-                return map_vehicle_entity_to_vehicle_model(vehicle_entity)
+        if vehicle_entity:
+            return map_vehicle_entity_to_vehicle_model(vehicle_entity)
 
     def get_vehicle_by_vin(self, vin: str) -> VehicleModel | None:
         logger.debug("Method called: relational_database_vehicle_repository_impl.get_vehicle_by_vin()")
-        logger.debug(f"Params passed: {vin}")
-        with Session(db_engine) as session:
-            vehicle_entity = session.exec(
-                select(Vehicle).where(Vehicle.vin == vin)
-            ).first()
-            if vehicle_entity:
-                return map_vehicle_entity_to_vehicle_model(vehicle_entity)
+        logger.debug("Params passed: {}", vin)
+        vehicle_entity = self.session.exec(
+            select(Vehicle).where(Vehicle.vin == vin)
+        ).first()
+        if vehicle_entity:
+            return map_vehicle_entity_to_vehicle_model(vehicle_entity)
 
     def get_vehicle_by_plate(self, plate: str) -> VehicleModel | None:
         logger.debug("Method called: relational_database_vehicle_repository_impl.get_vehicle_by_plate()")
-        logger.debug(f"Params passed: {plate}")
-        with Session(db_engine) as session:
-            vehicle_entity = session.exec(
-                select(Vehicle).where(Vehicle.plate == plate)
-            ).first()
-            if vehicle_entity:
-                return map_vehicle_entity_to_vehicle_model(vehicle_entity)
-
-    def get_vehicles(self) -> List[VehicleModel] | None:
-        logger.debug("Method called: relational_database_vehicle_repository_impl.get_vehicles()")
-        with Session(db_engine) as session:
-            vehicles = session.exec(select(Vehicle))
+        logger.debug("Params passed: {}", plate)
+        vehicle_entity = self.session.exec(
+            select(Vehicle).where(Vehicle.plate == plate)
+        ).first()
+        if vehicle_entity:
+            return map_vehicle_entity_to_vehicle_model(vehicle_entity)
 
-            if vehicles:
-                return [
-                    map_vehicle_entity_to_vehicle_model(vehicle) for vehicle in vehicles
-                ]
+    def get_vehicles(
+        self,
+        limit: int,
+        cursor: str | None,
+        brand: str | None = None,
+        model: str | None = None,
+    ) -> PageModel:
+        logger.debug("Method called: relational_database_vehicle_repository_impl.get_vehicles()")
+        logger.debug("Params passed: {}, {}, {} and {}", limit, cursor, brand, model)
+        vehicles = self.session.exec(
+            apply_keyset(
+                select_vehicles(brand, model), VEHICLE_PAGE_ORDER, cursor, limit
+            )
+        ).all()
+        return build_page(
+            vehicles, VEHICLE_PAGE_ORDER, limit, map_vehicle_entity_to_vehicle_model
+        )
 
     def remove_vehicle_by_id(self, id: int) -> int | None:
         logger.debug("Method called: relational_database_vehicle_repository_impl.remove_vehicle_by_id()")
-        logger.debug(f"Params passed: {id}")
-        with Session(db_engine) as session:
-            vehicle_entity = session.exec(select(Vehicle).where(Vehicle.id == id)).one()
+        logger.debug("Params passed: {}", id)
+        vehicle_entity = self.session.exec(select(Vehicle).where(Vehicle.id == id)).one()
 
-            session.delete(vehicle_entity)
-            session.commit()
+        self.session.delete(vehicle_entity)
+        self.session.flush()
 
     def update_vehicle(self, vehicle_update: VehicleModel, id: int):
         logger.debug("Method called: relational_database_vehicle_repository_impl.update_vehicle()")
-        logger.debug(f"Params passed: ID: {id} and {vehicle_update.__dict__}")
-        with Session(db_engine) as session:
-            vehicle_entity = session.exec(select(Vehicle).where(Vehicle.id == id)).one()
-
-            vehicle_entity.brand = vehicle_update.brand
-            vehicle_entity.model = vehicle_update.model
-            vehicle_entity.vin = vehicle_update.vin
-            vehicle_entity.plate = vehicle_update.plate
-            vehicle_entity.purchase_date = vehicle_update.purchase_date
-            vehicle_entity.cost = vehicle_update.cost
-            vehicle_entity.picture = vehicle_update.picture
-
-            session.add(vehicle_entity)
-            session.commit()
-            session.refresh(vehicle_entity)
+        logger.debug("Params passed: ID: {} and {}", id, vehicle_update.__dict__)
+        vehicle_entity = self.session.exec(select(Vehicle).where(Vehicle.id == id)).one()
+
+        try:
+            # In a savepoint so a conflict doesn't undo the earlier writes of the request
+            with self.session.begin_nested():
+                vehicle_entity.brand = vehicle_update.brand
+                vehicle_entity.model = vehicle_update.model
+                vehicle_entity.vin = vehicle_update.vin
+                vehicle_entity.plate = vehicle_update.plate
+                vehicle_entity.purchase_date = vehicle_update.purchase_date
+                vehicle_entity.cost = vehicle_update.cost
+                vehicle_entity.picture = vehicle_update.picture
+                self.session.add(vehicle_entity)
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        self.session.refresh(vehicle_entity)
         return map_vehicle_entity_to_vehicle_model(vehicle_entity=vehicle_entity)
 
     def create_vehicle(self, vehicle: VehicleModel) -> VehicleModel:
         logger.debug("Method called: relational_database_vehicle_repository_impl.create_vehicle()")
-        logger.debug(f"Params passed: {vehicle.__dict__}")
-        with Session(db_engine) as session:
-            vehicle_entity = map_vehicle_model_to_vehicle_entity(vehicle)
-
-            session.add(vehicle_entity)
-            session.commit()
-            session.refresh(vehicle_entity)
-            return map_vehicle_entity_to_vehicle_model(vehicle_entity)
+        logger.debug("Params passed: {}", vehicle.__dict__)
+        vehicle_entity = map_vehicle_model_to_vehicle_entity(vehicle)
+
+        try:
+            # In a savepoint so a conflict doesn't undo the earlier writes of the request
+            with self.session.begin_nested():
+                self.session.add(vehicle_entity)
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        self.session.refresh(vehicle_entity)
+        return map_vehicle_entity_to_vehicle_model(vehicle_entity)
 
     def get_number_of_vehicles(self) -> int:
         logger.debug("Method called: relational_database_vehicle_repository_impl.get_number_of_vehicles()")
-        with Session(db_engine) as session:
-            number_of_vehicles = len(session.exec(select(Vehicle)).all())
+        number_of_vehicles = self.session.exec(count_rows(Vehicle)).one()
         return number_of_vehicles
+
+    def get_taken_vehicle_keys(
+        self, vehicles: list[VehicleModel]
+    ) -> dict[str, set[str]]:
+        logger.debug("Method called: relational_database_vehicle_repository_impl.get_taken_vehicle_keys()")
+        logger.debug("Params passed: {} vehicles", len(vehicles))
+        taken_keys = self.session.exec(
+            select_taken_vehicle_keys(
+                [vehicle.vin for vehicle in vehicles],
+                [vehicle.plate for vehicle in vehicles],
+            )
+        ).all()
+        return {
+            "vin": {vin for vin, _ in taken_keys},
+            "plate": {plate for _, plate in taken_keys},
+        }
+
+    def create_vehicles(self, vehicles: list[VehicleModel]) -> None:
+        logger.debug("Method called: relational_database_vehicle_repository_impl.create_vehicles()")
+        logger.debug("Params passed: {} vehicles", len(vehicles))
+        vehicle_entities = [
+            map_vehicle_model_to_vehicle_entity(vehicle) for vehicle in vehicles
+        ]
+        try:
+            # In a savepoint so a conflicting batch doesn't undo the ones inserted before it
+            with self.session.begin_nested():
+                self.session.exec(
+                    insert(Vehicle),
+                    params=[
+                        vehicle_entity.model_dump(exclude={"id"})
+                        for vehicle_entity in vehicle_entities
+                    ],
+                )
+        except IntegrityError:
+            raise ConflictWithExistingResourceException
+        track_written_instances(self.session, vehicle_entities)
@@ -0,0 +1,29 @@
+from time import perf_counter
+from anyio import to_thread
+
+from app.infrastructure.configs.prometheus_metrics import threadpool_wait_seconds
+
+
+class ThreadedRepositoryAdapter:
+    """Exposes a blocking repository through the async repository interfaces.
+
+    Used when DATABASE_MODE is "sync": every call runs the wrapped method on the
+    anyio worker threads so the event loop never waits on the database.
+    """
+
+    def __init__(self, repository) -> None:
+        self.repository = repository
+
+    def __getattr__(self, name: str):
+        method = getattr(self.repository, name)
+
+        async def run_in_thread(*args, **kwargs):
+            submitted_at = perf_counter()
+
+            def run_method():
+                threadpool_wait_seconds.observe(perf_counter() - submitted_at)
+                return method(*args, **kwargs)
+
+            return await to_thread.run_sync(run_method)
+
+        return run_in_thread
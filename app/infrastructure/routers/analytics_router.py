@@ -0,0 +1,51 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from loguru import logger
+
+from app.application.repositories.async_mileage_repository import (
+    AsyncMileageRepository,
+)
+from app.application.services.mileage_service import MileageService
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
+from app.infrastructure.configs.caches import mileage_cache
+from app.infrastructure.configs.mileage import MILEAGE_MAX_RANGE_DAYS
+from app.infrastructure.configs.repository_providers import get_mileage_repository
+from app.infrastructure.dto.mileage_dto import MileageReportDTO
+from app.infrastructure.mappers.mileage_mappers import (
+    map_mileage_report_model_to_mileage_report_dto,
+)
+from app.infrastructure.middlewares.protect_route_middleware import (
+    protect_route_middlware,
+)
+
+analytics_router = APIRouter(dependencies=[Depends(protect_route_middlware)])
+
+
+async def get_mileage_service(
+    mileage_repository: Annotated[
+        AsyncMileageRepository, Depends(get_mileage_repository)
+    ],
+) -> MileageService:
+    return MileageService(
+        mileage_repository=mileage_repository,
+        mileage_cache=mileage_cache,
+        max_range_days=MILEAGE_MAX_RANGE_DAYS,
+    )
+
+
+@analytics_router.get("/mileage")
+async def get_mileage_report(
+    date_from: date,
+    date_to: date,
+    mileage_service: Annotated[MileageService, Depends(get_mileage_service)],
+) -> MileageReportDTO:
+    try:
+        logger.info("API REQUEST - GET /analytics/mileage")
+        mileage_report = await mileage_service.get_mileage_report(date_from, date_to)
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /analytics/mileage - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    else:
+        logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /analytics/mileage")
+        return map_mileage_report_model_to_mileage_report_dto(mileage_report)
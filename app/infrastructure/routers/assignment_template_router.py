@@ -0,0 +1,221 @@
+from typing import Annotated
+from fastapi import APIRouter, HTTPException, Response, status, Depends
+from datetime import date
+from loguru import logger
+
+from app.application.services.assignment_template_service import (
+    AssignmentTemplateService,
+)
+from app.domain.exceptions.conflict_with_existing_resource_exception import (
+    ConflictWithExistingResourceException,
+)
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
+from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from app.application.repositories.async_assignment_template_repository import (
+    AsyncAssignmentTemplateRepository,
+)
+from app.application.repositories.async_driver_assignment_repository import (
+    AsyncDriverAssignmentRepository,
+)
+from app.infrastructure.configs.geospatial import DESTINATION_CONFLICT_RADIUS_KM
+from app.infrastructure.configs.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageLimit,
+    set_next_cursor_header,
+)
+from app.infrastructure.configs.repository_providers import (
+    get_assignment_template_repository,
+    get_driver_assignment_repository,
+)
+from app.infrastructure.dto.assignment_template_dto import (
+    AssignmentTemplateExceptionRequestDTO,
+    AssignmentTemplateRequestDTO,
+    AssignmentTemplateResponseDTO,
+    MaterializationSummaryDTO,
+)
+from app.infrastructure.mappers.assignment_template_mappers import (
+    map_assignment_template_dto_to_assignment_template_model,
+    map_assignment_template_model_to_assignment_template_dto,
+    map_materialization_summary_model_to_materialization_summary_dto,
+)
+from app.infrastructure.middlewares.protect_route_middleware import (
+    protect_route_middlware,
+)
+from app.infrastructure.services.assignment_template_materializer import (
+    materialize_assignment_templates,
+)
+
+assignment_template_router = APIRouter(dependencies=[Depends(protect_route_middlware)])
+
+
+async def get_assignment_template_service(
+    assignment_template_repository: Annotated[
+        AsyncAssignmentTemplateRepository, Depends(get_assignment_template_repository)
+    ],
+    driver_assignment_repository: Annotated[
+        AsyncDriverAssignmentRepository, Depends(get_driver_assignment_repository)
+    ],
+) -> AssignmentTemplateService:
+    return AssignmentTemplateService(
+        assignment_template_repository=assignment_template_repository,
+        driver_assignment_repository=driver_assignment_repository,
+        destination_conflict_radius_km=DESTINATION_CONFLICT_RADIUS_KM,
+    )
+
+
+@assignment_template_router.post("", status_code=status.HTTP_201_CREATED)
+async def create_assignment_template(
+    assignment_template_request: AssignmentTemplateRequestDTO,
+    assignment_template_service: Annotated[
+        AssignmentTemplateService, Depends(get_assignment_template_service)
+    ],
+) -> AssignmentTemplateResponseDTO:
+    try:
+        logger.info("API REQUEST - POST /assignment-template/")
+        logger.opt(lazy=True).debug("Request body: {}", lambda: assignment_template_request.model_dump())
+        assignment_template = await assignment_template_service.create_assignment_template(
+            map_assignment_template_dto_to_assignment_template_model(
+                assignment_template_request
+            )
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - POST /assignment-template/ - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except ResourceNotFoundException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_404_NOT_FOUND} - POST /assignment-template/ - {str(e)}")
+        raise HTTPException(status_code=404, detail=str(e))
+    else:
+        logger.success(f"API RESPONSE {status.HTTP_201_CREATED} - POST /assignment-template/")
+        return map_assignment_template_model_to_assignment_template_dto(
+            assignment_template
+        )
+
+
+@assignment_template_router.post("/materialize", status_code=status.HTTP_200_OK)
+async def materialize_templates() -> MaterializationSummaryDTO:
+    logger.info("API REQUEST - POST /assignment-template/materialize")
+    summary = await materialize_assignment_templates()
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - POST /assignment-template/materialize")
+    return map_materialization_summary_model_to_materialization_summary_dto(summary)
+
+
+@assignment_template_router.get("")
+async def get_assignment_templates(
+    response: Response,
+    assignment_template_service: Annotated[
+        AssignmentTemplateService, Depends(get_assignment_template_service)
+    ],
+    only_actives: bool = False,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> list[AssignmentTemplateResponseDTO]:
+    try:
+        logger.info("API REQUEST - GET /assignment-template/")
+        assignment_templates_page = await assignment_template_service.get_assignment_templates(
+            only_actives, limit, cursor
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /assignment-template/ - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, assignment_templates_page)
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /assignment-template/")
+    return [
+        map_assignment_template_model_to_assignment_template_dto(assignment_template)
+        for assignment_template in assignment_templates_page.items
+    ]
+
+
+@assignment_template_router.get("/{template_id}")
+async def get_assignment_template(
+    template_id: int,
+    assignment_template_service: Annotated[
+        AssignmentTemplateService, Depends(get_assignment_template_service)
+    ],
+) -> AssignmentTemplateResponseDTO:
+    try:
+        logger.info(f"API REQUEST - GET /assignment-template/{template_id}")
+        assignment_template = await assignment_template_service.get_assignment_template(
+            template_id
+        )
+        logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /assignment-template/{template_id}")
+        return map_assignment_template_model_to_assignment_template_dto(
+            assignment_template
+        )
+    except ResourceNotFoundException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_404_NOT_FOUND} - GET /assignment-template/{template_id} - {str(e)}")
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@assignment_template_router.delete("/{template_id}")
+async def delete_assignment_template(
+    template_id: int,
+    assignment_template_service: Annotated[
+        AssignmentTemplateService, Depends(get_assignment_template_service)
+    ],
+):
+    try:
+        logger.info(f"API REQUEST - DELETE /assignment-template/{template_id}")
+        await assignment_template_service.set_assignment_template_as_inactive(
+            template_id
+        )
+    except ResourceNotFoundException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_404_NOT_FOUND} - DELETE /assignment-template/{template_id} - {str(e)}")
+        raise HTTPException(status_code=404, detail=str(e))
+    else:
+        logger.success(f"API RESPONSE {status.HTTP_200_OK} - DELETE /assignment-template/{template_id}")
+        return {"message": "Assignment template marked as inactive"}
+
+
+@assignment_template_router.post(
+    "/{template_id}/exceptions", status_code=status.HTTP_201_CREATED
+)
+async def add_assignment_template_exception(
+    template_id: int,
+    exception_request: AssignmentTemplateExceptionRequestDTO,
+    assignment_template_service: Annotated[
+        AssignmentTemplateService, Depends(get_assignment_template_service)
+    ],
+) -> AssignmentTemplateResponseDTO:
+    try:
+        logger.info(f"API REQUEST - POST /assignment-template/{template_id}/exceptions")
+        logger.opt(lazy=True).debug("Request body: {}", lambda: exception_request.model_dump())
+        assignment_template = await assignment_template_service.add_assignment_template_exception(
+            template_id, exception_request.travel_date, exception_request.reason
+        )
+    except ResourceNotFoundException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_404_NOT_FOUND} - POST /assignment-template/{template_id}/exceptions - {str(e)}")
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - POST /assignment-template/{template_id}/exceptions - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except ConflictWithExistingResourceException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_409_CONFLICT} - POST /assignment-template/{template_id}/exceptions - {str(e)}")
+        raise HTTPException(status_code=409, detail=str(e))
+    else:
+        logger.success(f"API RESPONSE {status.HTTP_201_CREATED} - POST /assignment-template/{template_id}/exceptions")
+        return map_assignment_template_model_to_assignment_template_dto(
+            assignment_template
+        )
+
+
+@assignment_template_router.delete("/{template_id}/exceptions/{travel_date}")
+async def remove_assignment_template_exception(
+    template_id: int,
+    travel_date: date,
+    assignment_template_service: Annotated[
+        AssignmentTemplateService, Depends(get_assignment_template_service)
+    ],
+) -> AssignmentTemplateResponseDTO:
+    try:
+        logger.info(f"API REQUEST - DELETE /assignment-template/{template_id}/exceptions/{travel_date}")
+        assignment_template = await assignment_template_service.remove_assignment_template_exception(
+            template_id, travel_date
+        )
+    except ResourceNotFoundException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_404_NOT_FOUND} - DELETE /assignment-template/{template_id}/exceptions/{travel_date} - {str(e)}")
+        raise HTTPException(status_code=404, detail=str(e))
+    else:
+        logger.success(f"API RESPONSE {status.HTTP_200_OK} - DELETE /assignment-template/{template_id}/exceptions/{travel_date}")
+        return map_assignment_template_model_to_assignment_template_dto(
+            assignment_template
+        )
@@ -10,6 +10,18 @@ from app.domain.exceptions.conflict_with_existing_resource_exception import (
 from app.domain.exceptions.invalid_credentials_exception import (
     InvalidCredentialsException,
 )
+from app.application.repositories.async_invitation_code_repository import (
+    AsyncInvitationCodeRepository,
+)
+from app.application.repositories.async_user_repository import AsyncUserRepository
+from app.domain.exceptions.service_overloaded_exception import (
+    ServiceOverloadedException,
+)
+from app.infrastructure.configs.password_hashing import password_encryptor
+from app.infrastructure.configs.repository_providers import (
+    get_invitation_code_repository,
+    get_user_repository,
+)
 from app.infrastructure.dto.auth_response_dto import AuthResponseDTO
 from app.infrastructure.dto.candidate_dto import CandidateDTO
 from app.infrastructure.dto.authenticated_user_dto import AuthenticatedUserDTO
@@ -17,34 +29,34 @@ from app.infrastructure.mappers.candidate_mappers import (
     map_candidate_dto_to_candidate_model,
 )
 from app.infrastructure.mappers.user_mappers import map_user_model_to_user_logged_dto
-from app.infrastructure.repositories.relational_database_invitation_code_repository_impl import (
-    RelationalDatabaseInvitationCodeRepositoryImpl,
-)
-from app.infrastructure.repositories.relational_database_user_repository_impl import (
-    RelationalDatabaseUserRepositoryImpl,
-)
-from app.infrastructure.security.bcrypt_password_encryptor_impl import (
-    BcryptPasswordEncryptorImpl,
-)
 from app.infrastructure.security.json_web_token_tools import JsonWebTokenTools
 
 
 auth_router = APIRouter()
-auth_service = AuthService(
-    invitation_code_repository=RelationalDatabaseInvitationCodeRepositoryImpl(),
-    password_encryptor=BcryptPasswordEncryptorImpl(),
-    user_repository=RelationalDatabaseUserRepositoryImpl(),
-)
+
+
+async def get_auth_service(
+    invitation_code_repository: Annotated[
+        AsyncInvitationCodeRepository, Depends(get_invitation_code_repository)
+    ],
+    user_repository: Annotated[AsyncUserRepository, Depends(get_user_repository)],
+) -> AuthService:
+    return AuthService(
+        invitation_code_repository=invitation_code_repository,
+        password_encryptor=password_encryptor,
+        user_repository=user_repository,
+    )
 
 
 @auth_router.post("/login", status_code=status.HTTP_200_OK)
-def login_user(
+async def login_user(
     user_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> AuthResponseDTO:
     try:
         logger.info("API REQUEST - POST /auth/login/")
-        logger.debug(f"Request body: {user_data.username}")
-        user = auth_service.login(email=user_data.username, password=user_data.password)
+        logger.debug("Request body: {}", user_data.username)
+        user = await auth_service.login(email=user_data.username, password=user_data.password)
 
         logger.success(f"API RESPONSE {status.HTTP_200_OK} - POST /login/")
         return AuthResponseDTO(
@@ -60,14 +72,25 @@ def login_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=error_detail,
         )
+    except ServiceOverloadedException:
+        error_detail = "Too many login requests, try again in a moment"
+        logger.warning(f"API RESPONSE {status.HTTP_503_SERVICE_UNAVAILABLE} - POST /login/ - {error_detail}")
+        raise HTTPException(
+            headers={"Retry-After": "1"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=error_detail,
+        )
 
 
 @auth_router.post("/signup", status_code=status.HTTP_201_CREATED)
-def signup_user(candidate: CandidateDTO) -> AuthenticatedUserDTO:
+async def signup_user(
+    candidate: CandidateDTO,
+    auth_service: Annotated[AuthService, Depends(get_auth_service)],
+) -> AuthenticatedUserDTO:
     try:
         logger.info("API REQUEST - POST /auth/signup/")
-        logger.debug(f"Request body: {candidate.model_dump()}")
-        user = auth_service.signup(map_candidate_dto_to_candidate_model(candidate))
+        logger.opt(lazy=True).debug("Request body: {}", lambda: candidate.model_dump())
+        user = await auth_service.signup(map_candidate_dto_to_candidate_model(candidate))
         logger.success(f"API RESPONSE {status.HTTP_201_CREATED} - POST /signup/")
         return map_user_model_to_user_logged_dto(user)
     except InvalidCredentialsException:
@@ -84,3 +107,11 @@ def signup_user(candidate: CandidateDTO) -> AuthenticatedUserDTO:
             status_code=status.HTTP_409_CONFLICT,
             detail=error_detail,
         )
+    except ServiceOverloadedException:
+        error_detail = "Too many signup requests, try again in a moment"
+        logger.warning(f"API RESPONSE {status.HTTP_503_SERVICE_UNAVAILABLE} - POST /signup/ - {error_detail}")
+        raise HTTPException(
+            headers={"Retry-After": "1"},
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=error_detail,
+        )
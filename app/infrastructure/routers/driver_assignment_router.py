@@ -1,6 +1,19 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from hashlib import sha256
+from typing import Annotated, Literal
+from fastapi import (
+    APIRouter,
+    Body,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+    Depends,
+)
 from datetime import date
+from decimal import Decimal
 from loguru import logger
+from pydantic import TypeAdapter
 
 from app.application.services.driver_assignment_service import DriverAssignmentService
 from app.domain.exceptions.conflict_with_existing_resource_exception import (
@@ -8,36 +21,126 @@ from app.domain.exceptions.conflict_with_existing_resource_exception import (
 )
 from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from app.application.repositories.async_driver_assignment_repository import (
+    AsyncDriverAssignmentRepository,
+)
+from app.infrastructure.configs.bulk_import import MAX_SCHEDULE_SIZE
+from app.infrastructure.configs.caches import driver_assignments_response_cache
+from app.infrastructure.configs.geospatial import (
+    DESTINATION_CONFLICT_RADIUS_KM,
+    NEARBY_MAX_RADIUS_KM,
+    NEARBY_MAX_RANGE_DAYS,
+)
+from app.infrastructure.configs.pagination import (
+    DEFAULT_PAGE_SIZE,
+    NEXT_CURSOR_HEADER,
+    PageLimit,
+    set_next_cursor_header,
+)
+from app.infrastructure.configs.repository_providers import (
+    get_driver_assignment_repository,
+)
 from app.infrastructure.dto.driver_assignment_dto import (
     DriverAssignmentRequestDTO,
     DriverAssignmentResponseDTO,
+    LocationDTO,
+    NearbyDriverAssignmentResponseDTO,
     RouteFieldsDTO,
 )
+from app.infrastructure.dto.import_result_dto import ImportReportDTO
 from app.infrastructure.mappers.driver_assignment_mappers import (
     map_driver_assignment_dto_to_driver_assignment_model,
     map_driver_assignment_model_to_driver_assignment_dto,
+    map_location_dto_to_location_model,
+    map_nearby_driver_assignment_model_to_nearby_driver_assignment_dto,
+)
+from app.infrastructure.mappers.import_result_mappers import (
+    map_import_results_to_import_report_dto,
 )
 from app.infrastructure.middlewares.protect_route_middleware import (
     protect_route_middlware,
 )
-from app.infrastructure.repositories.relational_database_driver_assignment_repository_impl import (
-    RelationalDatabaseDriverAssignmentRepositoryImpl,
+from app.infrastructure.queries.driver_assignment_queries import (
+    DRIVER_ASSIGNMENT_PAGE_ORDER,
 )
+from app.infrastructure.queries.keyset_pagination import decode_cursor
+from app.infrastructure.services.file_response_service import is_etag_matched
 
 driver_assignment_router = APIRouter(dependencies=[Depends(protect_route_middlware)])
-driver_assignment_service = DriverAssignmentService(
-    driver_assignment_repository=RelationalDatabaseDriverAssignmentRepositoryImpl()
-)
+driver_assignments_adapter = TypeAdapter(list[DriverAssignmentResponseDTO])
+
+
+async def get_driver_assignment_service(
+    driver_assignment_repository: Annotated[
+        AsyncDriverAssignmentRepository, Depends(get_driver_assignment_repository)
+    ],
+) -> DriverAssignmentService:
+    return DriverAssignmentService(
+        driver_assignment_repository=driver_assignment_repository,
+        destination_conflict_radius_km=DESTINATION_CONFLICT_RADIUS_KM,
+        nearby_max_range_days=NEARBY_MAX_RANGE_DAYS,
+    )
+
+
+async def get_cached_driver_assignments_response(
+    request: Request,
+    driver_assignment_service: DriverAssignmentService,
+    only_actives: bool,
+    travel_date: date,
+    limit: int,
+    cursor: str | None,
+) -> Response:
+    """Serves the assignments of a single day from the rendered bytes cached for the day's
+    current version, so dispatch screens polling a day don't query or serialize anything until
+    an assignment of that day, a driver or a vehicle changes."""
+    if cursor:
+        # Checked before it becomes part of the cache key, so a bad one fails like it does
+        # on the uncached path
+        decode_cursor(cursor, DRIVER_ASSIGNMENT_PAGE_ORDER)
+    cache_key = (only_actives, limit, cursor)
+    cached_response = driver_assignments_response_cache.get(travel_date, cache_key)
+    if cached_response is None:
+        version = driver_assignments_response_cache.get_version(travel_date)
+        driver_assignments_page = await driver_assignment_service.get_driver_assignments(
+            limit=limit,
+            cursor=cursor,
+            only_actives=only_actives,
+            travel_date=travel_date,
+        )
+        body = driver_assignments_adapter.dump_json(
+            [
+                map_driver_assignment_model_to_driver_assignment_dto(driver_assignment)
+                for driver_assignment in driver_assignments_page.items
+            ]
+        )
+        next_cursor = driver_assignments_page.next_cursor
+        content_hash = sha256(body)
+        content_hash.update((next_cursor or "").encode())
+        cached_response = (f'"{content_hash.hexdigest()}"', body, next_cursor)
+        driver_assignments_response_cache.set(
+            travel_date, version, cache_key, cached_response
+        )
+    etag, body, next_cursor = cached_response
+    headers = {"etag": etag, "cache-control": "no-cache"}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and is_etag_matched(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @driver_assignment_router.post("", status_code=status.HTTP_201_CREATED)
-def assign_driver(
+async def assign_driver(
     driver_assignment_request: DriverAssignmentRequestDTO,
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
 ) -> DriverAssignmentResponseDTO:
     try:
         logger.info("API REQUEST - POST /driver-assignment/")
-        logger.debug(f"Request body: {driver_assignment_request.model_dump()}")
-        driver_assignment = driver_assignment_service.assign_driver_to_vehicle(
+        logger.opt(lazy=True).debug("Request body: {}", lambda: driver_assignment_request.model_dump())
+        driver_assignment = await driver_assignment_service.assign_driver_to_vehicle(
             map_driver_assignment_dto_to_driver_assignment_model(
                 driver_assignment_request
             )
@@ -52,41 +155,169 @@ def assign_driver(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@driver_assignment_router.post("/bulk", status_code=status.HTTP_200_OK)
+async def assign_schedule(
+    driver_assignment_requests: Annotated[
+        list[DriverAssignmentRequestDTO], Body(max_length=MAX_SCHEDULE_SIZE)
+    ],
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
+) -> ImportReportDTO:
+    logger.info("API REQUEST - POST /driver-assignment/bulk")
+    logger.debug("Request body: {} driver assignments", len(driver_assignment_requests))
+    import_results = await driver_assignment_service.assign_schedule(
+        [
+            map_driver_assignment_dto_to_driver_assignment_model(driver_assignment_request)
+            for driver_assignment_request in driver_assignment_requests
+        ]
+    )
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - POST /driver-assignment/bulk")
+    return map_import_results_to_import_report_dto(import_results)
+
+
 @driver_assignment_router.get("")
-def get_driver_assignments(
+async def get_driver_assignments(
+    request: Request,
+    response: Response,
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
     travel_date: date | None = None,
+    travel_date_from: date | None = None,
+    travel_date_to: date | None = None,
+    driver_id: int | None = None,
+    vehicle_id: int | None = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
 ) -> list[DriverAssignmentResponseDTO]:
     logger.info("API REQUEST - GET /driver-assignment/")
-    driver_assignments = driver_assignment_service.get_driver_assignments(travel_date)
+    try:
+        if travel_date and not (
+            travel_date_from or travel_date_to or driver_id or vehicle_id
+        ):
+            cached_response = await get_cached_driver_assignments_response(
+                request, driver_assignment_service, False, travel_date, limit, cursor
+            )
+            logger.success(f"API RESPONSE {cached_response.status_code} - GET /driver-assignment/")
+            return cached_response
+        driver_assignments_page = await driver_assignment_service.get_driver_assignments(
+            limit=limit,
+            cursor=cursor,
+            travel_date=travel_date,
+            travel_date_from=travel_date_from,
+            travel_date_to=travel_date_to,
+            driver_id=driver_id,
+            vehicle_id=vehicle_id,
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /driver-assignment/ - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, driver_assignments_page)
     logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /driver-assignment/")
     return [
         map_driver_assignment_model_to_driver_assignment_dto(driver_assignment)
-        for driver_assignment in driver_assignments
+        for driver_assignment in driver_assignments_page.items
     ]
 
 
 @driver_assignment_router.get("/active")
-def get_active_driver_assignments(
+async def get_active_driver_assignments(
+    request: Request,
+    response: Response,
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
     travel_date: date | None = None,
+    travel_date_from: date | None = None,
+    travel_date_to: date | None = None,
+    driver_id: int | None = None,
+    vehicle_id: int | None = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
 ) -> list[DriverAssignmentResponseDTO]:
     logger.info("API REQUEST - GET /driver-assignment/active")
-    driver_assignments = driver_assignment_service.get_driver_assignments(
-        only_actives=True, travel_date=travel_date
-    )
+    try:
+        if travel_date and not (
+            travel_date_from or travel_date_to or driver_id or vehicle_id
+        ):
+            cached_response = await get_cached_driver_assignments_response(
+                request, driver_assignment_service, True, travel_date, limit, cursor
+            )
+            logger.success(f"API RESPONSE {cached_response.status_code} - GET /driver-assignment/active")
+            return cached_response
+        driver_assignments_page = await driver_assignment_service.get_driver_assignments(
+            limit=limit,
+            cursor=cursor,
+            only_actives=True,
+            travel_date=travel_date,
+            travel_date_from=travel_date_from,
+            travel_date_to=travel_date_to,
+            driver_id=driver_id,
+            vehicle_id=vehicle_id,
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /driver-assignment/active - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, driver_assignments_page)
     logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /driver-assignment/active")
     return [
         map_driver_assignment_model_to_driver_assignment_dto(driver_assignment)
-        for driver_assignment in driver_assignments
+        for driver_assignment in driver_assignments_page.items
+    ]
+
+
+@driver_assignment_router.get("/nearby")
+async def get_nearby_driver_assignments(
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
+    lat: Annotated[Decimal, Query(ge=-90, le=90)],
+    lon: Annotated[Decimal, Query(ge=-180, le=180)],
+    radius_km: Annotated[float, Query(gt=0, le=NEARBY_MAX_RADIUS_KM)],
+    travel_date: date | None = None,
+    travel_date_from: date | None = None,
+    travel_date_to: date | None = None,
+    by: Literal["destination", "origin"] = "destination",
+    only_actives: bool = False,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+) -> list[NearbyDriverAssignmentResponseDTO]:
+    logger.info("API REQUEST - GET /driver-assignment/nearby")
+    try:
+        nearby_driver_assignments = await driver_assignment_service.get_driver_assignments_nearby(
+            map_location_dto_to_location_model(LocationDTO(latitude=lat, longitude=lon)),
+            radius_km,
+            limit,
+            travel_date=travel_date,
+            travel_date_from=travel_date_from,
+            travel_date_to=travel_date_to,
+            by_origin=by == "origin",
+            only_actives=only_actives,
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /driver-assignment/nearby - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /driver-assignment/nearby")
+    return [
+        map_nearby_driver_assignment_model_to_nearby_driver_assignment_dto(
+            nearby_driver_assignment
+        )
+        for nearby_driver_assignment in nearby_driver_assignments
     ]
 
 
 @driver_assignment_router.get("/{driver_id}/{vehicle_id}/{travel_date}")
-def get_driver_assignment(
-    driver_id: int, vehicle_id: int, travel_date: date
+async def get_driver_assignment(
+    driver_id: int,
+    vehicle_id: int,
+    travel_date: date,
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
 ) -> DriverAssignmentResponseDTO:
     try:
         logger.info(f"API REQUEST - GET /driver-assignment/{driver_id}/{vehicle_id}/{travel_date}")
-        driver_assignment = driver_assignment_service.get_driver_assignment(
+        driver_assignment = await driver_assignment_service.get_driver_assignment(
             driver_id, vehicle_id, travel_date
         )
         logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /driver-assignment/{driver_id}/{vehicle_id}/{travel_date}")
@@ -102,11 +333,14 @@ async def update_driver_assignment(
     vehicle_id: int,
     travel_date: date,
     assignment_updates: RouteFieldsDTO,
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
 ) -> DriverAssignmentResponseDTO:
     try:
         logger.info(f"API REQUEST - PUT /driver-assignment/{driver_id}/{vehicle_id}/{travel_date}")
-        logger.debug(f"Request body: {assignment_updates.model_dump()}")
-        driver_assignment = driver_assignment_service.update_driver_assignment(
+        logger.opt(lazy=True).debug("Request body: {}", lambda: assignment_updates.model_dump())
+        driver_assignment = await driver_assignment_service.update_driver_assignment(
             map_driver_assignment_dto_to_driver_assignment_model(
                 DriverAssignmentRequestDTO(
                     driver_id=driver_id,
@@ -131,10 +365,17 @@ async def update_driver_assignment(
 
 
 @driver_assignment_router.delete("/{driver_id}/{vehicle_id}/{travel_date}")
-def delete_driver_assignment(driver_id: int, vehicle_id: int, travel_date: date):
+async def delete_driver_assignment(
+    driver_id: int,
+    vehicle_id: int,
+    travel_date: date,
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
+):
     try:
         logger.info(f"API REQUEST - DELETE /driver-assignment/{driver_id}/{vehicle_id}/{travel_date}")
-        driver_assignment_service.set_driver_assignment_as_inactive(
+        await driver_assignment_service.set_driver_assignment_as_inactive(
             driver_id, vehicle_id, travel_date
         )
     except ResourceNotFoundException as e:
@@ -146,26 +387,52 @@ def delete_driver_assignment(driver_id: int, vehicle_id: int, travel_date: date)
 
 
 @driver_assignment_router.get("/driver_history/{driver_id}")
-def get_driver_history(driver_id: int):
-    logger.info(f"API REQUEST - GET /driver-assignment/driver_history/{driver_id}")
-    driver_assignments = driver_assignment_service.get_assignments_history_for_driver(
-        driver_id
-    )
+async def get_driver_history(
+    driver_id: int,
+    response: Response,
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> list[DriverAssignmentResponseDTO]:
+    try:
+        logger.info(f"API REQUEST - GET /driver-assignment/driver_history/{driver_id}")
+        driver_assignments_page = await driver_assignment_service.get_assignments_history_for_driver(
+            driver_id, limit, cursor
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /driver-assignment/driver_history/{driver_id} - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, driver_assignments_page)
     logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /driver-assignment/driver_history/{driver_id}")
     return [
         map_driver_assignment_model_to_driver_assignment_dto(driver_assignment)
-        for driver_assignment in driver_assignments
+        for driver_assignment in driver_assignments_page.items
     ]
 
 
 @driver_assignment_router.get("/vehicle_history/{vehicle_id}")
-def get_vehicle_history(vehicle_id: int):
-    logger.info(f"API REQUEST - GET /driver-assignment/vehicle_history/{vehicle_id}")
-    driver_assignments = driver_assignment_service.get_assignments_history_for_vehicle(
-        vehicle_id
-    )
+async def get_vehicle_history(
+    vehicle_id: int,
+    response: Response,
+    driver_assignment_service: Annotated[
+        DriverAssignmentService, Depends(get_driver_assignment_service)
+    ],
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> list[DriverAssignmentResponseDTO]:
+    try:
+        logger.info(f"API REQUEST - GET /driver-assignment/vehicle_history/{vehicle_id}")
+        driver_assignments_page = await driver_assignment_service.get_assignments_history_for_vehicle(
+            vehicle_id, limit, cursor
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /driver-assignment/vehicle_history/{vehicle_id} - {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    set_next_cursor_header(response, driver_assignments_page)
     logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /driver-assignment/vehicle_history/{vehicle_id}")
     return [
         map_driver_assignment_model_to_driver_assignment_dto(driver_assignment)
-        for driver_assignment in driver_assignments
+        for driver_assignment in driver_assignments_page.items
     ]
@@ -1,37 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from loguru import logger
 
 from app.application.services.driver_service import DriverService
 from app.domain.exceptions.conflict_with_existing_resource_exception import (
     ConflictWithExistingResourceException,
 )
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
+from app.domain.exceptions.invalid_file_exception import InvalidFileException
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from app.application.repositories.async_driver_repository import AsyncDriverRepository
+from app.infrastructure.configs.bulk_import import (
+    BULK_IMPORT_BATCH_SIZE,
+    BULK_IMPORT_OPENAPI_EXTRA,
+)
+from app.infrastructure.configs.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageLimit,
+    set_next_cursor_header,
+)
+from app.infrastructure.configs.repository_providers import get_driver_repository
 from app.infrastructure.dto.driver_dto import DriverDTO
 from app.infrastructure.dto.driver_request_dto import DriverRequestDTO
+from app.infrastructure.dto.import_result_dto import ImportReportDTO
 from app.infrastructure.mappers.driver_mappers import (
     map_driver_dto_to_driver_model,
     map_driver_model_to_driver_dto,
     map_driver_request_dto_to_driver_model,
 )
+from app.infrastructure.mappers.import_result_mappers import (
+    map_import_results_to_import_report_dto,
+)
 from app.infrastructure.middlewares.protect_route_middleware import (
     protect_route_middlware,
 )
-from app.infrastructure.repositories.relational_database_driver_repository_impl import (
-    RelationalDatabaseDriverRepositoryImpl,
-)
+from app.infrastructure.services.import_row_stream import ImportRowStream
 
 
 driver_router = APIRouter(dependencies=[Depends(protect_route_middlware)])
-driver_service = DriverService(
-    driver_repository=RelationalDatabaseDriverRepositoryImpl()
-)
+
+
+async def get_driver_service(
+    driver_repository: Annotated[AsyncDriverRepository, Depends(get_driver_repository)],
+) -> DriverService:
+    return DriverService(driver_repository=driver_repository)
 
 
 @driver_router.get("/{driver_id}", status_code=status.HTTP_200_OK)
-def get_driver_by_driver_id(driver_id: int) -> DriverDTO:
+async def get_driver_by_driver_id(
+    driver_id: int,
+    driver_service: Annotated[DriverService, Depends(get_driver_service)],
+) -> DriverDTO:
     try:
         logger.info(f"API REQUEST - GET /driver/{driver_id}")
-        driver = driver_service.get_driver_by_driver_id(driver_id)
+        driver = await driver_service.get_driver_by_driver_id(driver_id)
         logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /driver/{driver_id}")
         return map_driver_model_to_driver_dto(driver)
     except ResourceNotFoundException:
@@ -44,28 +66,45 @@ def get_driver_by_driver_id(driver_id: int) -> DriverDTO:
 
 
 @driver_router.get("", status_code=status.HTTP_200_OK)
-def get_all_drivers() -> list[DriverDTO]:
-    logger.info("API REQUEST - GET /driver")
-    drivers = driver_service.get_all_drivers()
+async def get_all_drivers(
+    response: Response,
+    driver_service: Annotated[DriverService, Depends(get_driver_service)],
+    name: str | None = None,
+    last_name: str | None = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+) -> list[DriverDTO]:
+    try:
+        logger.info("API REQUEST - GET /driver")
+        drivers_page = await driver_service.get_all_drivers(
+            limit, cursor, name, last_name
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /driver - {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_next_cursor_header(response, drivers_page)
     logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /driver")
     return [
         map_driver_model_to_driver_dto(driver)
-        for driver in drivers
+        for driver in drivers_page.items
     ]
 
 
 @driver_router.post("", status_code=status.HTTP_201_CREATED)
-def create_driver(driver_request_dto: DriverRequestDTO) -> DriverDTO:
+async def create_driver(
+    driver_request_dto: DriverRequestDTO,
+    driver_service: Annotated[DriverService, Depends(get_driver_service)],
+) -> DriverDTO:
     try:
         logger.info("API REQUEST - POST /driver/")
-        logger.debug(f"Request body: {driver_request_dto.model_dump()}")
-        driver = driver_service.create_driver(
+        logger.opt(lazy=True).debug("Request body: {}", lambda: driver_request_dto.model_dump())
+        driver = await driver_service.create_driver(
             driver=map_driver_request_dto_to_driver_model(driver_request_dto)
         )
         logger.success(f"API RESPONSE {status.HTTP_201_CREATED} - POST /driver/")
         return map_driver_model_to_driver_dto(driver)
     except ConflictWithExistingResourceException:
-        error_detail = "A driver with the curp entered is already registered"
+        error_detail = "A driver with the curp or driving license entered is already registered"
         logger.warning(f"API RESPONSE {status.HTTP_409_CONFLICT} - POST /driver/ - {error_detail}")
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -73,12 +112,41 @@ def create_driver(driver_request_dto: DriverRequestDTO) -> DriverDTO:
         )
 
 
+@driver_router.post(
+    "/bulk", status_code=status.HTTP_200_OK, openapi_extra=BULK_IMPORT_OPENAPI_EXTRA
+)
+async def import_drivers(
+    request: Request,
+    driver_service: Annotated[DriverService, Depends(get_driver_service)],
+) -> ImportReportDTO:
+    try:
+        logger.info("API REQUEST - POST /driver/bulk")
+        import_results = await driver_service.import_drivers(
+            ImportRowStream(
+                request, DriverRequestDTO, map_driver_request_dto_to_driver_model
+            ),
+            BULK_IMPORT_BATCH_SIZE,
+        )
+        logger.success(f"API RESPONSE {status.HTTP_200_OK} - POST /driver/bulk")
+        return map_import_results_to_import_report_dto(import_results)
+    except InvalidFileException:
+        error_detail = "Unsupported import format. Please send UTF-8 encoded NDJSON (application/x-ndjson) or CSV (text/csv)."
+        logger.warning(f"API RESPONSE {status.HTTP_415_UNSUPPORTED_MEDIA_TYPE} - POST /driver/bulk - {error_detail}")
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=error_detail,
+        )
+
+
 @driver_router.put("", status_code=status.HTTP_200_OK)
-def edit_driver_information(driver_dto: DriverDTO) -> DriverDTO:
+async def edit_driver_information(
+    driver_dto: DriverDTO,
+    driver_service: Annotated[DriverService, Depends(get_driver_service)],
+) -> DriverDTO:
     try:
         logger.info("API REQUEST - PUT /driver")
-        logger.debug(f"Request body: {driver_dto.model_dump()}")
-        driver = driver_service.update_driver(
+        logger.opt(lazy=True).debug("Request body: {}", lambda: driver_dto.model_dump())
+        driver = await driver_service.update_driver(
             driver=map_driver_dto_to_driver_model(driver_dto),
         )
         logger.success(f"API RESPONSE {status.HTTP_200_OK} - PUT /driver")
@@ -90,13 +158,23 @@ def edit_driver_information(driver_dto: DriverDTO) -> DriverDTO:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=error_detail,
         )
+    except ConflictWithExistingResourceException:
+        error_detail = "A driver with the curp or driving license entered is already registered"
+        logger.warning(f"API RESPONSE {status.HTTP_409_CONFLICT} - PUT /driver - {error_detail}")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=error_detail,
+        )
 
 
 @driver_router.delete("/{driver_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_driver(driver_id: int) -> None:
+async def delete_driver(
+    driver_id: int,
+    driver_service: Annotated[DriverService, Depends(get_driver_service)],
+) -> None:
     try:
         logger.info(f"API REQUEST - DELETE /driver/{driver_id}")
-        driver_service.delete_driver_by_driver_id(driver_id)
+        await driver_service.delete_driver_by_driver_id(driver_id)
         logger.success(f"API RESPONSE {status.HTTP_204_NO_CONTENT} - DELETE /driver/{driver_id}")
     except ResourceNotFoundException:
         error_detail = "Driver not found"
@@ -7,6 +7,14 @@ from app.domain.exceptions.conflict_with_existing_resource_exception import (
     ConflictWithExistingResourceException,
 )
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
+from app.application.repositories.async_invitation_code_repository import (
+    AsyncInvitationCodeRepository,
+)
+from app.application.repositories.async_user_repository import AsyncUserRepository
+from app.infrastructure.configs.repository_providers import (
+    get_invitation_code_repository,
+    get_user_repository,
+)
 from app.infrastructure.dto.invitation_code_dto import InvitationCodeDTO
 from app.infrastructure.dto.invitation_code_request_dto import InvitationCodeRequestDTO
 from app.infrastructure.dto.authenticated_user_dto import AuthenticatedUserDTO
@@ -16,28 +24,33 @@ from app.infrastructure.mappers.invitation_code_mappers import (
 from app.infrastructure.middlewares.protect_route_middleware import (
     protect_route_middlware,
 )
-from app.infrastructure.repositories.relational_database_invitation_code_repository_impl import (
-    RelationalDatabaseInvitationCodeRepositoryImpl,
-)
-from app.infrastructure.repositories.relational_database_user_repository_impl import (
-    RelationalDatabaseUserRepositoryImpl,
-)
 
 invitation_code_router = APIRouter()
-invitation_code_service = InvitationCodeService(
-    invitation_code_repository=RelationalDatabaseInvitationCodeRepositoryImpl(),
-    user_repository=RelationalDatabaseUserRepositoryImpl(),
-)
+
+
+async def get_invitation_code_service(
+    invitation_code_repository: Annotated[
+        AsyncInvitationCodeRepository, Depends(get_invitation_code_repository)
+    ],
+    user_repository: Annotated[AsyncUserRepository, Depends(get_user_repository)],
+) -> InvitationCodeService:
+    return InvitationCodeService(
+        invitation_code_repository=invitation_code_repository,
+        user_repository=user_repository,
+    )
 
 
 @invitation_code_router.get("", status_code=status.HTTP_200_OK)
-def get_all_invitation_codes(
+async def get_all_invitation_codes(
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    invitation_code_service: Annotated[
+        InvitationCodeService, Depends(get_invitation_code_service)
+    ],
 ) -> list[InvitationCodeDTO]:
     logger.info("API REQUEST - GET /invitation-code/")
-    invitation_codes = invitation_code_service.get_all_invitation_codes_by_user_id(
+    invitation_codes = await invitation_code_service.get_all_invitation_codes_by_user_id(
         authenticated_user.id
     )
     logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /invitation-code/")
@@ -48,16 +61,19 @@ def get_all_invitation_codes(
 
 
 @invitation_code_router.post("", status_code=status.HTTP_201_CREATED)
-def create_invitation_code(
+async def create_invitation_code(
     invitation_code_request_dto: InvitationCodeRequestDTO,
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    invitation_code_service: Annotated[
+        InvitationCodeService, Depends(get_invitation_code_service)
+    ],
 ) -> InvitationCodeDTO:
     try:
         logger.info("API REQUEST - POST /invitation-code/")
-        logger.debug(f"Request body: {invitation_code_request_dto.model_dump()}")
-        invitation_code = invitation_code_service.create_invitation_code(
+        logger.opt(lazy=True).debug("Request body: {}", lambda: invitation_code_request_dto.model_dump())
+        invitation_code = await invitation_code_service.create_invitation_code(
             recipient_email=invitation_code_request_dto.email,
             authenticated_user_id=authenticated_user.id,
         )
@@ -73,17 +89,20 @@ def create_invitation_code(
 
 
 @invitation_code_router.patch("/{invitation_code}", status_code=status.HTTP_200_OK)
-def change_recipient_email_from_invitation_code(
+async def change_recipient_email_from_invitation_code(
     invitation_code: str,
     invitation_code_request_dto: InvitationCodeRequestDTO,
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    invitation_code_service: Annotated[
+        InvitationCodeService, Depends(get_invitation_code_service)
+    ],
 ) -> InvitationCodeDTO:
     try:
         logger.info(f"API REQUEST - PATCH /invitation-code/{invitation_code}")
-        logger.debug(f"Request body: {invitation_code_request_dto.model_dump()}")
-        updated_invitation_code = invitation_code_service.update_recipient_email_from_invitation_code(
+        logger.opt(lazy=True).debug("Request body: {}", lambda: invitation_code_request_dto.model_dump())
+        updated_invitation_code = await invitation_code_service.update_recipient_email_from_invitation_code(
             code=invitation_code,
             recipient_email=invitation_code_request_dto.email,
             authenticated_user_id=authenticated_user.id,
@@ -109,15 +128,18 @@ def change_recipient_email_from_invitation_code(
 @invitation_code_router.delete(
     "/{invitation_code}", status_code=status.HTTP_204_NO_CONTENT
 )
-def delete_invitation_code(
+async def delete_invitation_code(
     invitation_code: str,
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    invitation_code_service: Annotated[
+        InvitationCodeService, Depends(get_invitation_code_service)
+    ],
 ) -> None:
     try:
         logger.info(f"API REQUEST - DELETE /invitation-code/{invitation_code}")
-        invitation_code_service.delete_invitation_code_by_code(
+        await invitation_code_service.delete_invitation_code_by_code(
             code=invitation_code, authenticated_user_id=authenticated_user.id
         )
         logger.success(f"API RESPONSE {status.HTTP_204_NO_CONTENT} - DELETE /invitation-code/{invitation_code}")
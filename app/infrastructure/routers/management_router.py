@@ -1,25 +1,78 @@
-from fastapi import APIRouter, status
+from typing import Annotated
+from fastapi import APIRouter, Depends, Response, status
 from loguru import logger
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 
+from app.application.repositories.async_metrics_repository import AsyncMetricsRepository
 from app.application.services.metrics_service import MetricsService
 
-from app.infrastructure.repositories.relational_database_driver_assignment_repository_impl import RelationalDatabaseDriverAssignmentRepositoryImpl
-from app.infrastructure.repositories.relational_database_driver_repository_impl import RelationalDatabaseDriverRepositoryImpl
-from app.infrastructure.repositories.relational_database_user_repository_impl import RelationalDatabaseUserRepositoryImpl
-from app.infrastructure.repositories.relational_database_vehicle_repository_impl import RelationalDatabaseVehicleRepositoryImpl
+from app.infrastructure.configs.caches import get_cache_stats, metrics_cache
+from app.infrastructure.configs.password_hashing import password_hashing_pool
+from app.infrastructure.configs.prometheus_collector import RuntimeStatsCollector
+from app.infrastructure.configs.repository_providers import get_metrics_repository
+from app.infrastructure.configs.sql_database import get_pool_status
+from app.infrastructure.middlewares.server_error_middleware import (
+    get_route_error_counts,
+)
 
 
 management_router = APIRouter()
+REGISTRY.register(RuntimeStatsCollector())
 
-@management_router.get("/metrics",status_code=status.HTTP_200_OK)
-def get_metrics_information() :
-    metrics_service = MetricsService(
-        vehicle_repository=RelationalDatabaseVehicleRepositoryImpl(),
-        user_repository=RelationalDatabaseUserRepositoryImpl(),
-        driver_assignment_repository=RelationalDatabaseDriverAssignmentRepositoryImpl(),
-        driver_repository=RelationalDatabaseDriverRepositoryImpl(),
+
+async def get_metrics_service(
+    metrics_repository: Annotated[AsyncMetricsRepository, Depends(get_metrics_repository)],
+) -> MetricsService:
+    return MetricsService(
+        metrics_repository=metrics_repository,
+        metrics_cache=metrics_cache,
     )
+
+@management_router.get("/metrics",status_code=status.HTTP_200_OK)
+async def get_metrics_information(
+    metrics_service: Annotated[MetricsService, Depends(get_metrics_service)],
+) :
     logger.info("API REQUEST - GET /management/metrics")
-    dashboard_metrics = metrics_service.get_metrics()
+    dashboard_metrics = await metrics_service.get_metrics()
     logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /management/metrics")
     return dashboard_metrics
+
+
+@management_router.get("/database-pool", status_code=status.HTTP_200_OK)
+async def get_database_pool_status():
+    logger.info("API REQUEST - GET /management/database-pool")
+    pool_status = get_pool_status()
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /management/database-pool")
+    return pool_status
+
+
+@management_router.get("/caches", status_code=status.HTTP_200_OK)
+async def get_caches_status():
+    logger.info("API REQUEST - GET /management/caches")
+    cache_stats = get_cache_stats()
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /management/caches")
+    return cache_stats
+
+
+@management_router.get("/password-hashing", status_code=status.HTTP_200_OK)
+async def get_password_hashing_status():
+    logger.info("API REQUEST - GET /management/password-hashing")
+    password_hashing_stats = password_hashing_pool.get_stats()
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /management/password-hashing")
+    return password_hashing_stats
+
+
+@management_router.get("/errors", status_code=status.HTTP_200_OK)
+async def get_route_errors():
+    logger.info("API REQUEST - GET /management/errors")
+    route_error_counts = get_route_error_counts()
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /management/errors")
+    return route_error_counts
+
+
+@management_router.get("/prometheus", status_code=status.HTTP_200_OK)
+async def get_prometheus_metrics():
+    logger.info("API REQUEST - GET /management/prometheus")
+    prometheus_metrics = generate_latest(REGISTRY)
+    logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /management/prometheus")
+    return Response(content=prometheus_metrics, media_type=CONTENT_TYPE_LATEST)
@@ -1,21 +1,57 @@
 from typing import Annotated, List
 from loguru import logger
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    status,
+    Response,
+)
 from app.application.services.vehicle_service import VehicleService
 from app.domain.exceptions.conflict_with_existing_resource_exception import (
     ConflictWithExistingResourceException,
 )
 from app.domain.exceptions.file_not_found_exception import FileNotFoundException
+from app.domain.exceptions.file_too_large_exception import FileTooLargeException
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
 from app.domain.exceptions.invalid_file_exception import InvalidFileException
 from app.domain.exceptions.resource_not_found_exception import ResourceNotFoundException
-from app.domain.exceptions.invalid_base64_encode_exception import (
-    Invalid64EncodeException,
+from app.application.repositories.async_user_repository import AsyncUserRepository
+from app.application.repositories.async_vehicle_repository import (
+    AsyncVehicleRepository,
+)
+from app.infrastructure.configs.bulk_import import (
+    BULK_IMPORT_BATCH_SIZE,
+    BULK_IMPORT_OPENAPI_EXTRA,
+)
+from app.infrastructure.configs.pagination import (
+    DEFAULT_PAGE_SIZE,
+    PageLimit,
+    set_next_cursor_header,
+)
+from app.infrastructure.configs.repository_providers import (
+    get_user_repository,
+    get_vehicle_repository,
 )
-from app.infrastructure.services.base64_service import Base64Service
-from app.infrastructure.services.storage_service import StorageService
+from app.infrastructure.configs.storage import (
+    picture_cache_control,
+    picture_max_size,
+    picture_storage_backend,
+    picture_storage_service,
+    picture_variant_service,
+)
+from app.infrastructure.services.file_response_service import FileResponseService
+from app.infrastructure.services.import_row_stream import ImportRowStream
+from app.infrastructure.services.multipart_file_stream import MultipartFileStream
 from app.infrastructure.dto.authenticated_user_dto import AuthenticatedUserDTO
+from app.infrastructure.dto.import_result_dto import ImportReportDTO
 from app.infrastructure.dto.vehicle_dto import VehicleDTO
 from app.infrastructure.dto.vehicle_request_dto import VehicleRequestDTO
+from app.infrastructure.mappers.import_result_mappers import (
+    map_import_results_to_import_report_dto,
+)
 from app.infrastructure.mappers.vehicle_mappers import (
     map_vehicle_dto_to_vehicle_model,
     map_vehicle_model_to_vehicle_dto,
@@ -23,32 +59,39 @@ from app.infrastructure.mappers.vehicle_mappers import (
 from app.infrastructure.middlewares.protect_route_middleware import (
     protect_route_middlware,
 )
-from app.infrastructure.repositories.relational_database_vehicle_repository_impl import (
-    RelationalDatabaseVehicleRepositoryImpl,
-)
-from app.infrastructure.repositories.relational_database_user_repository_impl import (
-    RelationalDatabaseUserRepositoryImpl,
-)
 
 vehicle_router = APIRouter()
-base64_service = Base64Service()
-vehicle_service = VehicleService(
-    vehicle_repository=RelationalDatabaseVehicleRepositoryImpl(),
-    user_repository=RelationalDatabaseUserRepositoryImpl(),
-    storage_service=StorageService(base64_service, "pictures"),
+file_response_service = FileResponseService(
+    picture_storage_backend, picture_cache_control
 )
 
+
+async def get_vehicle_service(
+    vehicle_repository: Annotated[
+        AsyncVehicleRepository, Depends(get_vehicle_repository)
+    ],
+    user_repository: Annotated[AsyncUserRepository, Depends(get_user_repository)],
+) -> VehicleService:
+    return VehicleService(
+        vehicle_repository=vehicle_repository,
+        user_repository=user_repository,
+        storage_service=picture_storage_service,
+        picture_variant_service=picture_variant_service,
+    )
+
+
 @vehicle_router.post("", status_code=status.HTTP_201_CREATED)
-def create_vehicule(
+async def create_vehicule(
     vehicle_request_dto: VehicleRequestDTO,
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    vehicle_service: Annotated[VehicleService, Depends(get_vehicle_service)],
 ) -> VehicleDTO:
     try:
         logger.info("API REQUEST - POST /vehicles/")
-        logger.debug(f"Request body: {vehicle_request_dto.model_dump()}")
-        vehicle = vehicle_service.create_vehicle(
+        logger.opt(lazy=True).debug("Request body: {}", lambda: vehicle_request_dto.model_dump())
+        vehicle = await vehicle_service.create_vehicle(
             vehicle=map_vehicle_dto_to_vehicle_model(vehicle_request_dto)
         )
         logger.success(f"API RESPONSE {status.HTTP_201_CREATED} - POST /vehicles/")
@@ -61,33 +104,56 @@ def create_vehicule(
             detail=error_detail,
         )
     except InvalidFileException:
-        error_detail = "Invalid file format or content. Please upload a valid image."
+        error_detail = "Picture not found. Upload it with PUT /vehicles/{vehicle_id}/picture and send the returned picture reference."
         logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - POST /vehicles/ - {error_detail}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=error_detail,
         )
-    except Invalid64EncodeException:
-        error_detail = "Invalid base64 encoding. Please provide a valid base64 encoded string."
-        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - POST /vehicles/ - {error_detail}")
+
+
+@vehicle_router.post(
+    "/bulk", status_code=status.HTTP_200_OK, openapi_extra=BULK_IMPORT_OPENAPI_EXTRA
+)
+async def import_vehicles(
+    request: Request,
+    authenticated_user: Annotated[
+        AuthenticatedUserDTO, Depends(protect_route_middlware)
+    ],
+    vehicle_service: Annotated[VehicleService, Depends(get_vehicle_service)],
+) -> ImportReportDTO:
+    try:
+        logger.info("API REQUEST - POST /vehicles/bulk")
+        import_results = await vehicle_service.import_vehicles(
+            ImportRowStream(
+                request, VehicleRequestDTO, map_vehicle_dto_to_vehicle_model
+            ),
+            BULK_IMPORT_BATCH_SIZE,
+        )
+        logger.success(f"API RESPONSE {status.HTTP_200_OK} - POST /vehicles/bulk")
+        return map_import_results_to_import_report_dto(import_results)
+    except InvalidFileException:
+        error_detail = "Unsupported import format. Please send UTF-8 encoded NDJSON (application/x-ndjson) or CSV (text/csv)."
+        logger.warning(f"API RESPONSE {status.HTTP_415_UNSUPPORTED_MEDIA_TYPE} - POST /vehicles/bulk - {error_detail}")
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
             detail=error_detail,
         )
 
 
 @vehicle_router.put("/{vehicule_id}", status_code=status.HTTP_201_CREATED)
-def edit_vehicle(
+async def edit_vehicle(
     vehicule_id: int,
     vehicle_request_dto: VehicleRequestDTO,
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    vehicle_service: Annotated[VehicleService, Depends(get_vehicle_service)],
 ) -> VehicleDTO:
     try:
         logger.info(f"API REQUEST - PUT /vehicles/{vehicule_id}")
-        logger.debug(f"Request body: {vehicle_request_dto.model_dump()}")
-        vehicle = vehicle_service.update_vehicle(
+        logger.opt(lazy=True).debug("Request body: {}", lambda: vehicle_request_dto.model_dump())
+        vehicle = await vehicle_service.update_vehicle(
             id=vehicule_id,
             vehicle_update=map_vehicle_dto_to_vehicle_model(vehicle_request_dto),
         )
@@ -107,14 +173,7 @@ def edit_vehicle(
             detail=error_detail,
         )
     except InvalidFileException:
-        error_detail = "Invalid file format or content. Please upload a valid image."
-        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - PUT /vehicles/{vehicule_id} - {error_detail}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error_detail,
-        )
-    except Invalid64EncodeException:
-        error_detail = "Invalid base64 encoding. Please provide a valid base64 encoded string."
+        error_detail = "Picture not found. Upload it with PUT /vehicles/{vehicle_id}/picture and send the returned picture reference."
         logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - PUT /vehicles/{vehicule_id} - {error_detail}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -122,30 +181,44 @@ def edit_vehicle(
         )
 
 @vehicle_router.get("", status_code=status.HTTP_200_OK)
-def get_vehicles(
+async def get_vehicles(
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    vehicle_service: Annotated[VehicleService, Depends(get_vehicle_service)],
+    response: Response,
+    brand: str | None = None,
+    model: str | None = None,
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
 ) -> List[VehicleDTO]:
-    logger.info("API REQUEST - GET /vehicles/")
-    vehicles = vehicle_service.get_all_vehicles()
+    try:
+        logger.info("API REQUEST - GET /vehicles/")
+        vehicles_page = await vehicle_service.get_all_vehicles(
+            limit, cursor, brand, model
+        )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /vehicles/ - {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    set_next_cursor_header(response, vehicles_page)
     logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /vehicles/")
     return [
         map_vehicle_model_to_vehicle_dto(vehicle)
-        for vehicle in vehicles
+        for vehicle in vehicles_page.items
     ]
 
 
 @vehicle_router.get("/{vehicle_id}", status_code=status.HTTP_200_OK)
-def get_vehicle(
+async def get_vehicle(
     vehicle_id: int,
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    vehicle_service: Annotated[VehicleService, Depends(get_vehicle_service)],
 ) -> VehicleDTO:
     try:
         logger.info(f"API REQUEST - GET /vehicles/{vehicle_id}")
-        vehicle = vehicle_service.get_vehicle_by_id(id=vehicle_id)
+        vehicle = await vehicle_service.get_vehicle_by_id(id=vehicle_id)
         logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /vehicles/{vehicle_id}")
         return map_vehicle_model_to_vehicle_dto(vehicle)
     except ResourceNotFoundException:
@@ -157,15 +230,16 @@ def get_vehicle(
 
 
 @vehicle_router.delete("/{vehicle_id}", status_code=status.HTTP_200_OK)
-def remove_vehicle(
+async def remove_vehicle(
     vehicle_id: int,
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    vehicle_service: Annotated[VehicleService, Depends(get_vehicle_service)],
 ):
     try:
         logger.info(f"API REQUEST - DELETE /vehicles/{vehicle_id}")
-        vehicle_service.remove_vehicle_by_id(id=vehicle_id)
+        await vehicle_service.remove_vehicle_by_id(id=vehicle_id)
         logger.success(f"API RESPONSE {status.HTTP_200_OK} - DELETE /vehicles/{vehicle_id}")
     except ResourceNotFoundException:
         error_detail = "Vehicle not found"
@@ -175,18 +249,69 @@ def remove_vehicle(
         )
 
 
+@vehicle_router.put("/{vehicle_id}/picture", status_code=status.HTTP_200_OK)
+async def upload_vehicle_picture(
+    vehicle_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    authenticated_user: Annotated[
+        AuthenticatedUserDTO, Depends(protect_route_middlware)
+    ],
+    vehicle_service: Annotated[VehicleService, Depends(get_vehicle_service)],
+) -> VehicleDTO:
+    try:
+        logger.info(f"API REQUEST - PUT /vehicles/{vehicle_id}/picture")
+        content_type = request.headers.get("content-type", "")
+        if content_type.startswith("multipart/form-data"):
+            picture_chunks = MultipartFileStream(request, "picture")
+        else:
+            if int(request.headers.get("content-length", "0")) > picture_max_size:
+                raise FileTooLargeException
+            picture_chunks = request.stream()
+        vehicle = await vehicle_service.upload_vehicle_picture(
+            id=vehicle_id, picture_chunks=picture_chunks
+        )
+        background_tasks.add_task(picture_variant_service.create_variants, vehicle.picture)
+        logger.success(f"API RESPONSE {status.HTTP_200_OK} - PUT /vehicles/{vehicle_id}/picture")
+        return map_vehicle_model_to_vehicle_dto(vehicle)
+    except ResourceNotFoundException:
+        error_detail = "Vehicle not found"
+        logger.warning(f"API RESPONSE {status.HTTP_404_NOT_FOUND} - PUT /vehicles/{vehicle_id}/picture - {error_detail}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=error_detail
+        )
+    except FileTooLargeException:
+        error_detail = f"Picture exceeds the maximum size of {picture_max_size} bytes."
+        logger.warning(f"API RESPONSE {status.HTTP_413_REQUEST_ENTITY_TOO_LARGE} - PUT /vehicles/{vehicle_id}/picture - {error_detail}")
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=error_detail,
+        )
+    except InvalidFileException:
+        error_detail = "Unsupported picture format. Please upload a JPEG, PNG or WebP image."
+        logger.warning(f"API RESPONSE {status.HTTP_415_UNSUPPORTED_MEDIA_TYPE} - PUT /vehicles/{vehicle_id}/picture - {error_detail}")
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=error_detail,
+        )
+
+
 @vehicle_router.get("/{vehicle_vin}/picture", status_code=status.HTTP_200_OK)
-def download_vehicle_picture(
+async def download_vehicle_picture(
     vehicle_vin: str,
+    request: Request,
     authenticated_user: Annotated[
         AuthenticatedUserDTO, Depends(protect_route_middlware)
     ],
+    vehicle_service: Annotated[VehicleService, Depends(get_vehicle_service)],
+    size: str | None = None,
 ):
     try:
         logger.info(f"API REQUEST - GET /vehicles/{vehicle_vin}/picture")
-        picture_bytes = vehicle_service.download_vehicle_picture(vehicle_vin)
-        logger.success(f"API RESPONSE {status.HTTP_200_OK} - GET /vehicles/{vehicle_vin}/picture")
-        return Response(picture_bytes)
+        picture_file = await vehicle_service.download_vehicle_picture(vehicle_vin, size)
+        response = file_response_service.create_response(request, picture_file)
+        logger.success(f"API RESPONSE {response.status_code} - GET /vehicles/{vehicle_vin}/picture")
+        return response
     except FileNotFoundException:
         error_detail = "Picture not found for the specified vehicle VIN."
         logger.warning(f"API RESPONSE {status.HTTP_404_NOT_FOUND} - GET /vehicles/{vehicle_vin}/picture - {error_detail}")
@@ -194,6 +319,9 @@ def download_vehicle_picture(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=error_detail,
         )
+    except InvalidArgumentException as e:
+        logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /vehicles/{vehicle_vin}/picture - {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except InvalidFileException:
         error_detail = "Invalid picture file. Please ensure the file format is supported."
         logger.warning(f"API RESPONSE {status.HTTP_400_BAD_REQUEST} - GET /vehicles/{vehicle_vin}/picture - {error_detail}")
@@ -0,0 +1,25 @@
+# Runs inside the password hashing worker processes, keep its imports light
+from functools import cache
+from time import time
+from passlib.context import CryptContext
+
+verify_context = CryptContext(schemes=["bcrypt"])
+
+
+@cache
+def get_password_context(rounds: int) -> CryptContext:
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+def hash_password(password: str, rounds: int) -> str:
+    return get_password_context(rounds).hash(password)
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    return verify_context.verify(password, hashed_password)
+
+
+def run_timed(function, submitted_at: float, *args) -> tuple:
+    started_at = time()
+    result = function(*args)
+    return result, started_at - submitted_at, time() - started_at
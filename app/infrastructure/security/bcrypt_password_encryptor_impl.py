@@ -1,17 +1,26 @@
-from passlib.context import CryptContext
-
 from app.application.security.password_encryptor import PasswordEncryptor
+from app.infrastructure.security.bcrypt_hashing import (
+    get_password_context,
+    hash_password,
+    verify_password,
+)
+from app.infrastructure.security.password_hashing_pool import PasswordHashingPool
 
 
 class BcryptPasswordEncryptorImpl(PasswordEncryptor):
-    password_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(self, password_hashing_pool: PasswordHashingPool, rounds: int) -> None:
+        self.password_hashing_pool = password_hashing_pool
+        self.rounds = rounds
 
-    @staticmethod
-    def get_password_hash(password: str) -> str:
-        return BcryptPasswordEncryptorImpl.password_context.hash(password)
+    async def get_password_hash(self, password: str) -> str:
+        return await self.password_hashing_pool.run(
+            "hash", hash_password, password, self.rounds
+        )
 
-    @staticmethod
-    def verify_password_hash(password: str, hashed_password: str) -> bool:
-        return BcryptPasswordEncryptorImpl.password_context.verify(
-            password, hashed_password
+    async def verify_password_hash(self, password: str, hashed_password: str) -> bool:
+        return await self.password_hashing_pool.run(
+            "verify", verify_password, password, hashed_password
         )
+
+    def password_hash_needs_update(self, hashed_password: str) -> bool:
+        return get_password_context(self.rounds).needs_update(hashed_password)
@@ -0,0 +1,76 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from time import time
+from loguru import logger
+
+from app.domain.exceptions.service_overloaded_exception import (
+    ServiceOverloadedException,
+)
+from app.infrastructure.security.bcrypt_hashing import run_timed
+
+
+class PasswordHashingPool:
+    """Runs password hashing on a dedicated process pool so bcrypt never holds the GIL or the
+    shared threadpool, and rejects new work right away once `max_pending` jobs are waiting."""
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor = None
+        self.pending = 0
+        self.rejected = 0
+        self.operations = {}
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=get_context("spawn")
+            )
+        return self.executor
+
+    async def run(self, operation: str, function, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f"Password hashing queue is full, rejecting {operation}")
+            raise ServiceOverloadedException("Password hashing queue is full")
+        self.pending += 1
+        try:
+            result, queue_wait, duration = await asyncio.wrap_future(
+                self.get_executor().submit(run_timed, function, time(), *args)
+            )
+        finally:
+            self.pending -= 1
+        self.record(operation, queue_wait, duration)
+        return result
+
+    def record(self, operation: str, queue_wait: float, duration: float) -> None:
+        stats = self.operations.setdefault(
+            operation,
+            {
+                "count": 0,
+                "queue_wait_seconds_total": 0.0,
+                "queue_wait_seconds_max": 0.0,
+                "duration_seconds_total": 0.0,
+                "duration_seconds_max": 0.0,
+            },
+        )
+        stats["count"] += 1
+        stats["queue_wait_seconds_total"] += queue_wait
+        stats["queue_wait_seconds_max"] = max(stats["queue_wait_seconds_max"], queue_wait)
+        stats["duration_seconds_total"] += duration
+        stats["duration_seconds_max"] = max(stats["duration_seconds_max"], duration)
+
+    def get_stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "operations": self.operations,
+        }
+
+    def shutdown(self) -> None:
+        if self.executor:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
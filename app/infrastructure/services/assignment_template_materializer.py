@@ -0,0 +1,65 @@
+import asyncio
+from datetime import date
+from loguru import logger
+
+from app.application.services.assignment_template_service import (
+    AssignmentTemplateService,
+)
+from app.domain.models.assignment_template_model import MaterializationSummaryModel
+from app.infrastructure.configs.assignment_templates import (
+    TEMPLATE_HORIZON_DAYS,
+    TEMPLATE_MATERIALIZATION_BATCH_SIZE,
+)
+from app.infrastructure.configs.geospatial import DESTINATION_CONFLICT_RADIUS_KM
+from app.infrastructure.configs.repository_providers import (
+    get_assignment_template_repository,
+    get_driver_assignment_repository,
+)
+from app.infrastructure.configs.sql_database import open_db_session
+
+# Concurrent runs could both accept occurrences that conflict with each other, so the runs of
+# a process take turns
+materialization_lock = asyncio.Lock()
+
+
+async def materialize_assignment_templates(
+    today: date | None = None,
+) -> MaterializationSummaryModel:
+    """Materializes every active template batch by batch, committing each batch on its own."""
+    today = today or date.today()
+    summary = MaterializationSummaryModel()
+    after_id = 0
+    async with materialization_lock:
+        while True:
+            async with open_db_session() as session:
+                assignment_template_service = AssignmentTemplateService(
+                    await get_assignment_template_repository(session),
+                    await get_driver_assignment_repository(session),
+                    DESTINATION_CONFLICT_RADIUS_KM,
+                )
+                batch_summary = await assignment_template_service.materialize_assignment_templates(
+                    today,
+                    TEMPLATE_HORIZON_DAYS,
+                    TEMPLATE_MATERIALIZATION_BATCH_SIZE,
+                    after_id,
+                )
+            summary.add(batch_summary)
+            if batch_summary.last_template_id is None:
+                break
+            after_id = batch_summary.last_template_id
+    logger.info(
+        "Materialized {} assignment templates: {} assignments created, {} exceptions recorded",
+        summary.templates,
+        summary.created,
+        summary.exceptions,
+    )
+    return summary
+
+
+async def materialize_assignment_templates_periodically(interval: float) -> None:
+    while True:
+        try:
+            await materialize_assignment_templates()
+        except Exception:
+            logger.exception("Assignment template materialization failed")
+        await asyncio.sleep(interval)
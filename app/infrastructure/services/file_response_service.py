@@ -0,0 +1,101 @@
+from email.utils import formatdate, parsedate_to_datetime
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
+
+from app.domain.models.stored_file_model import StoredFileModel
+from app.infrastructure.storage.storage_backend import StorageBackend
+
+
+def is_etag_matched(if_none_match: str, etag: str) -> bool:
+    etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+    return "*" in etags or etag in etags
+
+
+class FileResponseService:
+    """Builds conditional and ranged responses for stored files. Full responses of local files go
+    through FileResponse, which hands the path to the server when it supports
+    http.response.pathsend; everything else is streamed from the storage backend."""
+
+    def __init__(self, storage_backend: StorageBackend, cache_control: str) -> None:
+        self.storage_backend = storage_backend
+        self.cache_control = cache_control
+
+    def get_validator_headers(self, stored_file: StoredFileModel) -> dict:
+        return {
+            "etag": stored_file.etag,
+            "last-modified": formatdate(stored_file.modified_at, usegmt=True),
+            "cache-control": self.cache_control,
+        }
+
+    def is_not_modified(self, request: Request, stored_file: StoredFileModel) -> bool:
+        if if_none_match := request.headers.get("if-none-match"):
+            return is_etag_matched(if_none_match, stored_file.etag)
+        if if_modified_since := request.headers.get("if-modified-since"):
+            try:
+                modified_since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(stored_file.modified_at) <= modified_since
+        return False
+
+    def get_byte_range(
+        self, request: Request, stored_file: StoredFileModel
+    ) -> tuple[int, int] | None:
+        """Returns the inclusive byte range requested, or None to send the whole file. Multiple
+        ranges and malformed headers fall back to the whole file, which RFC 9110 allows."""
+        range_header = request.headers.get("range")
+        if not range_header or not range_header.startswith("bytes="):
+            return None
+        if_range = request.headers.get("if-range")
+        if if_range and if_range != stored_file.etag:
+            return None
+        byte_range = range_header.removeprefix("bytes=").strip()
+        if "," in byte_range:
+            return None
+        start, separator, end = byte_range.partition("-")
+        if not separator or not (start or end):
+            return None
+        try:
+            if not start:
+                start, end = max(stored_file.size - int(end), 0), stored_file.size - 1
+            else:
+                start = int(start)
+                end = min(int(end), stored_file.size - 1) if end else stored_file.size - 1
+        except ValueError:
+            return None
+        return start, end
+
+    def create_response(
+        self, request: Request, stored_file: StoredFileModel
+    ) -> Response:
+        headers = self.get_validator_headers(stored_file)
+        if self.is_not_modified(request, stored_file):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        headers["accept-ranges"] = "bytes"
+        byte_range = self.get_byte_range(request, stored_file)
+        if byte_range is None:
+            if local_path := self.storage_backend.get_local_path(stored_file.path):
+                return FileResponse(
+                    local_path, headers=headers, media_type=stored_file.media_type
+                )
+            headers["content-length"] = str(stored_file.size)
+            return StreamingResponse(
+                self.storage_backend.iter_bytes(stored_file.path),
+                headers=headers,
+                media_type=stored_file.media_type,
+            )
+        start, end = byte_range
+        if start > end or start >= stored_file.size:
+            headers["content-range"] = f"bytes */{stored_file.size}"
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers=headers,
+            )
+        headers["content-range"] = f"bytes {start}-{end}/{stored_file.size}"
+        headers["content-length"] = str(end - start + 1)
+        return StreamingResponse(
+            self.storage_backend.iter_bytes(stored_file.path, start, end),
+            status_code=status.HTTP_206_PARTIAL_CONTENT,
+            headers=headers,
+            media_type=stored_file.media_type,
+        )
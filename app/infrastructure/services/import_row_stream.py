@@ -0,0 +1,93 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Callable
+from fastapi import Request
+from pydantic import BaseModel, ValidationError
+
+from app.domain.exceptions.invalid_file_exception import InvalidFileException
+from app.domain.models.import_row_model import ImportRowModel
+
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+CSV_MEDIA_TYPES = {"text/csv"}
+
+
+def describe_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(location) for location in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
+
+
+class ImportRowStream:
+    """Yields the rows of an NDJSON or CSV request body as they arrive, validated with
+    `request_dto` and mapped to domain models. Rows are numbered by their line in the body, so
+    a CSV header is line 1; a malformed row is yielded with its error instead of failing the
+    whole import. CSV values can't span several lines."""
+
+    def __init__(
+        self,
+        request: Request,
+        request_dto: type[BaseModel],
+        map_request_dto: Callable,
+    ) -> None:
+        self.request = request
+        self.request_dto = request_dto
+        self.map_request_dto = map_request_dto
+        self.media_type = (
+            request.headers.get("content-type", "").split(";")[0].strip().lower()
+        )
+        if self.media_type not in NDJSON_MEDIA_TYPES | CSV_MEDIA_TYPES:
+            raise InvalidFileException
+        self.header = None
+
+    async def iter_lines(self) -> AsyncIterator[tuple[int, str]]:
+        # utf-8-sig drops the byte order mark spreadsheets put at the start of CSV exports
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        number = 0
+        pending = ""
+        try:
+            async for chunk in self.request.stream():
+                lines = (pending + decoder.decode(chunk)).split("\n")
+                pending = lines.pop()
+                for line in lines:
+                    number += 1
+                    yield number, line.rstrip("\r")
+            pending += decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            raise InvalidFileException
+        if pending.strip():
+            yield number + 1, pending.rstrip("\r")
+
+    def parse_record(self, line: str) -> dict | None:
+        if self.media_type in CSV_MEDIA_TYPES:
+            values = next(csv.reader([line]))
+            if self.header is None:
+                self.header = [name.strip() for name in values]
+                return None
+            if len(values) != len(self.header):
+                raise ValueError(
+                    f"Expected {len(self.header)} columns but found {len(values)}"
+                )
+            return dict(zip(self.header, values))
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("Expected a JSON object")
+        return record
+
+    async def __aiter__(self) -> AsyncIterator[ImportRowModel]:
+        async for number, line in self.iter_lines():
+            if not line.strip():
+                continue
+            try:
+                record = self.parse_record(line)
+                if record is None:
+                    continue
+                item = self.map_request_dto(self.request_dto.model_validate(record))
+            except ValidationError as e:
+                yield ImportRowModel(number, error=describe_validation_error(e))
+                continue
+            except (ValueError, csv.Error) as e:
+                yield ImportRowModel(number, error=str(e))
+                continue
+            yield ImportRowModel(number, item=item)
@@ -0,0 +1,76 @@
+from typing import AsyncIterator
+from fastapi import Request
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+
+from app.domain.exceptions.invalid_file_exception import InvalidFileException
+
+
+class MultipartFileStream:
+    """Yields the bytes of one multipart/form-data field as they arrive, without spooling the
+    request body like Request.form() does."""
+
+    def __init__(self, request: Request, field_name: str) -> None:
+        self.request = request
+        self.field_name = field_name.encode()
+        self.headers = {}
+        self.header_field = b""
+        self.header_value = b""
+        self.in_field = False
+        self.found = False
+        self.chunks = []
+
+    def on_part_begin(self):
+        self.headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self.header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self.header_value += data[start:end]
+
+    def on_header_end(self):
+        self.headers[self.header_field.lower()] = self.header_value
+        self.header_field = b""
+        self.header_value = b""
+
+    def on_headers_finished(self):
+        _, options = parse_options_header(self.headers.get(b"content-disposition", b""))
+        self.in_field = not self.found and options.get(b"name") == self.field_name
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        if self.in_field:
+            self.chunks.append(data[start:end])
+
+    def on_part_end(self):
+        if self.in_field:
+            self.found = True
+            self.in_field = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        _, params = parse_options_header(self.request.headers["content-type"])
+        if b"boundary" not in params:
+            raise InvalidFileException
+        parser = MultipartParser(
+            params[b"boundary"],
+            {
+                "on_part_begin": self.on_part_begin,
+                "on_header_field": self.on_header_field,
+                "on_header_value": self.on_header_value,
+                "on_header_end": self.on_header_end,
+                "on_headers_finished": self.on_headers_finished,
+                "on_part_data": self.on_part_data,
+                "on_part_end": self.on_part_end,
+            },
+        )
+        async for body_chunk in self.request.stream():
+            try:
+                parser.write(body_chunk)
+            except MultipartParseError:
+                raise InvalidFileException
+            chunks, self.chunks = self.chunks, []
+            for chunk in chunks:
+                yield chunk
+        parser.finalize()
+        if not self.found:
+            raise InvalidFileException
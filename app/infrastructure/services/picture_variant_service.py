@@ -0,0 +1,97 @@
+import io
+import posixpath
+from hashlib import sha256
+from anyio import to_thread
+from loguru import logger
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.domain.exceptions.file_not_found_exception import FileNotFoundException
+from app.domain.exceptions.invalid_argument_exception import InvalidArgumentException
+from app.domain.exceptions.invalid_file_exception import InvalidFileException
+from app.infrastructure.services.storage_service import StorageService
+
+PILLOW_FORMATS = {".jpg": "JPEG", ".png": "PNG", ".webp": "WEBP"}
+
+
+def parse_picture_variants(picture_variants: str) -> dict[str, int]:
+    variants = {}
+    for picture_variant in picture_variants.split(","):
+        name, _, max_size = picture_variant.strip().partition(":")
+        variants[name] = int(max_size)
+    return variants
+
+
+class PictureVariantService:
+    """Keeps downscaled copies of stored pictures next to the original, named
+    `<name>.<variant>.<extension>`, so list views don't download full-size photos."""
+
+    def __init__(self, storage_service: StorageService, variants: dict[str, int]) -> None:
+        self.storage_service = storage_service
+        self.variants = variants
+
+    def get_variant_path(self, path: str, variant: str) -> str:
+        root, extension = posixpath.splitext(path)
+        return f"{root}.{variant}{extension}"
+
+    def render_variant(
+        self, picture_bytes: bytes, extension: str, max_size: int, variant_path: str
+    ) -> str:
+        try:
+            with Image.open(io.BytesIO(picture_bytes)) as image:
+                # Lets the JPEG decoder scale down while decoding instead of after
+                image.draft("RGB", (max_size, max_size))
+                image = ImageOps.exif_transpose(image)
+                image.thumbnail((max_size, max_size))
+                if PILLOW_FORMATS[extension] == "JPEG" and image.mode != "RGB":
+                    image = image.convert("RGB")
+                image.save(variant_path, PILLOW_FORMATS[extension], optimize=True)
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError, KeyError):
+            raise InvalidFileException
+        content_hash = sha256()
+        with open(variant_path, "rb") as file:
+            content_hash.update(file.read())
+        return content_hash.hexdigest()
+
+    async def create_variant(self, key: str, variant: str) -> str:
+        logger.debug("Method called: picture_variant_service.create_variant()")
+        logger.debug("Params passed: {} and {}", key, variant)
+        storage_backend = self.storage_service.storage_backend
+        variant_key = self.get_variant_path(key, variant)
+        picture_bytes = await storage_backend.read_bytes(key)
+        temporary_path = self.storage_service.create_temporary_path()
+        try:
+            content_hash = await to_thread.run_sync(
+                self.render_variant,
+                picture_bytes,
+                posixpath.splitext(key)[1],
+                self.variants[variant],
+                temporary_path,
+            )
+            await storage_backend.save_file(temporary_path, variant_key, content_hash)
+        finally:
+            self.storage_service.remove_file(temporary_path)
+        return variant_key
+
+    async def create_variants(self, reference: str) -> None:
+        key = self.storage_service.validate_reference(reference)
+        for variant in self.variants:
+            try:
+                await self.create_variant(key, variant)
+            except InvalidFileException:
+                logger.warning(f"Could not create the {variant} variant of {key}")
+
+    async def get_variant(self, reference: str, variant: str) -> str:
+        if variant not in self.variants:
+            raise InvalidArgumentException(
+                f"Unknown picture size {variant}, expected one of {', '.join(self.variants)}"
+            )
+        storage_backend = self.storage_service.storage_backend
+        key = self.storage_service.validate_reference(reference)
+        variant_key = self.get_variant_path(key, variant)
+        modified_at = await storage_backend.get_modified_at(key)
+        if modified_at is None:
+            raise FileNotFoundException
+        variant_modified_at = await storage_backend.get_modified_at(variant_key)
+        if variant_modified_at is not None and variant_modified_at >= modified_at:
+            return variant_key
+        return await self.create_variant(key, variant)
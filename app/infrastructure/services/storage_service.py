@@ -1,41 +1,133 @@
 import os
+import posixpath
+from hashlib import sha256
+from time import time
+from typing import AsyncIterator
+from uuid import uuid4
+from anyio import open_file, to_thread
 from app.domain.exceptions.file_not_found_exception import FileNotFoundException
+from app.domain.exceptions.file_too_large_exception import FileTooLargeException
 from app.domain.exceptions.invalid_file_exception import InvalidFileException
-from app.infrastructure.services.base64_service import Base64Service
+from app.domain.models.stored_file_model import StoredFileModel
+from app.infrastructure.storage.storage_backend import StorageBackend
+
+SNIFF_SIZE = 12
+
+
+def detect_image_extension(header: bytes) -> str:
+    if header.startswith(b"\xff\xd8\xff"):
+        return "jpg"
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    raise InvalidFileException
 
 
 class StorageService:
+    """Stores pictures on `storage_backend` under keys starting with `prefix`. Uploads are
+    spooled to `upload_directory` first, since the final key depends on the whole content."""
+
     def __init__(
-        self, base64_service: Base64Service, base_directory: str = None
+        self,
+        storage_backend: StorageBackend,
+        prefix: str,
+        upload_directory: str,
+        max_file_size: int,
+        content_addressed: bool,
     ) -> None:
-        self.base64_service = base64_service
-        self.base_directory = base_directory if base_directory else ""
+        self.storage_backend = storage_backend
+        self.prefix = prefix
+        self.upload_directory = upload_directory
+        self.max_file_size = max_file_size
+        self.content_addressed = content_addressed
 
-    def create_directory(self, path: str):
-        directory = os.path.dirname(path)
-        if not os.path.exists(directory):
-            os.makedirs(directory, exist_ok=True)
+    def create_temporary_path(self, suffix: str = ".part") -> str:
+        os.makedirs(self.upload_directory, exist_ok=True)
+        return os.path.join(self.upload_directory, f"{uuid4().hex}{suffix}")
 
-    def save_base64_image(self, base64_image: str, path: str) -> str:
-        save_path = os.path.join(self.base_directory, path)
-        image_data = self.base64_service.decode(base64_image)
-        try:
-            self.create_directory(save_path)
-            with open(save_path, "wb") as file:
-                file.write(image_data)
-            return save_path
-        except FileNotFoundError:
+    def validate_reference(self, reference: str) -> str:
+        key = posixpath.normpath(reference)
+        if not key.startswith(f"{self.prefix}/"):
+            raise FileNotFoundException
+        return key
+
+    async def resolve_reference(self, reference: str) -> str:
+        key = self.validate_reference(reference)
+        if not await self.storage_backend.exists(key):
             raise FileNotFoundException
-        except IOError:
-            raise InvalidFileException
+        return key
+
+    def get_key(self, name: str, content_hash: str, extension: str) -> str:
+        if self.content_addressed:
+            # Two levels of 256 shards keep every directory small even with millions of pictures
+            return posixpath.join(
+                self.prefix,
+                content_hash[:2],
+                content_hash[2:4],
+                f"{content_hash}.{extension}",
+            )
+        return posixpath.join(self.prefix, f"{name}.{extension}")
 
-    def read_file_as_bytes(self, path: str):
-        save_path = os.path.join(self.base_directory, path)
+    async def save_image_stream(self, chunks: AsyncIterator[bytes], name: str) -> str:
+        """Writes the upload chunk by chunk, rejecting it as soon as its first bytes aren't a known
+        image or it grows past max_file_size, and only stores it under its key once complete.
+        In content addressed mode an upload whose blob already exists is discarded."""
+        header = b""
+        extension = None
+        size = 0
+        content_hash = sha256()
+        temporary_path = self.create_temporary_path()
         try:
-            with open(save_path, "rb") as file:
-                file_bytes = file.read()
-            return file_bytes
+            async with await open_file(temporary_path, "wb") as file:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > self.max_file_size:
+                        raise FileTooLargeException
+                    if extension is None:
+                        header += chunk[: SNIFF_SIZE - len(header)]
+                        if len(header) == SNIFF_SIZE:
+                            extension = detect_image_extension(header)
+                    content_hash.update(chunk)
+                    await file.write(chunk)
+                await file.flush()
+                await to_thread.run_sync(os.fsync, file.wrapped.fileno())
+            key = self.get_key(
+                name,
+                content_hash.hexdigest(),
+                extension or detect_image_extension(header),
+            )
+            if not (self.content_addressed and await self.storage_backend.exists(key)):
+                await self.storage_backend.save_file(
+                    temporary_path, key, content_hash.hexdigest()
+                )
+            return key
+        finally:
+            self.remove_file(temporary_path)
+
+    async def get_stored_file(self, reference: str) -> StoredFileModel:
+        return await self.storage_backend.stat(self.validate_reference(reference))
+
+    async def remove_unreferenced_files(
+        self, referenced_keys: set[str], grace_period: float, dry_run: bool
+    ) -> list[str]:
+        """Deletes every stored file that isn't referenced, leaving files younger than
+        grace_period alone so uploads whose row isn't committed yet survive."""
+        referenced_keys = {posixpath.normpath(key) for key in referenced_keys}
+        oldest_modification = time() - grace_period
+        removed_keys = []
+        async for key, modified_at in self.storage_backend.list_files(self.prefix):
+            if key in referenced_keys or modified_at > oldest_modification:
+                continue
+            removed_keys.append(key)
+            if not dry_run:
+                await self.storage_backend.delete(key)
+        if removed_keys and not dry_run:
+            await self.storage_backend.remove_empty_directories(self.prefix)
+        return removed_keys
+
+    def remove_file(self, path: str):
+        try:
+            os.remove(path)
         except FileNotFoundError:
-            raise FileNotFoundException
-        except IOError:
-            raise InvalidFileException
+            pass
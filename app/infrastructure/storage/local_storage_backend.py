@@ -0,0 +1,156 @@
+import os
+import shutil
+from hashlib import sha256
+from typing import AsyncIterator
+from anyio import open_file, to_thread
+
+from app.domain.exceptions.file_not_found_exception import FileNotFoundException
+from app.domain.exceptions.invalid_file_exception import InvalidFileException
+from app.domain.models.stored_file_model import StoredFileModel
+from app.infrastructure.cache.ttl_lru_cache import TtlLruCache
+from app.infrastructure.storage.storage_backend import StorageBackend, get_media_type
+
+CHUNK_SIZE = 64 * 1024
+HASH_BLOCK_SIZE = 1024 * 1024
+MOVE_ATTEMPTS = 3
+
+
+class LocalStorageBackend(StorageBackend):
+    """Stores files under `root_directory`; every blocking call runs on the anyio worker threads."""
+
+    def __init__(self, root_directory: str, content_hash_cache: TtlLruCache) -> None:
+        self.root_directory = os.path.abspath(root_directory)
+        self.content_hash_cache = content_hash_cache
+
+    def get_path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root_directory, key))
+        if os.path.commonpath([self.root_directory, path]) != self.root_directory:
+            raise FileNotFoundException
+        return path
+
+    def get_local_path(self, key: str) -> str | None:
+        return self.get_path(key)
+
+    async def exists(self, key: str) -> bool:
+        return await to_thread.run_sync(os.path.isfile, self.get_path(key))
+
+    def move_file(self, source_path: str, path: str, content_hash: str) -> None:
+        for attempt in range(1, MOVE_ATTEMPTS + 1):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                # Renames when both paths share a filesystem and copies otherwise
+                shutil.move(source_path, path)
+                break
+            except FileNotFoundError:
+                # Orphan collection may remove the directory once it looks empty, right
+                # after it was created for this file
+                if attempt == MOVE_ATTEMPTS or not os.path.exists(source_path):
+                    raise
+        stat_result = os.stat(path)
+        self.content_hash_cache.set(
+            (path, stat_result.st_size, stat_result.st_mtime_ns), content_hash
+        )
+
+    async def save_file(self, source_path: str, key: str, content_hash: str) -> None:
+        await to_thread.run_sync(
+            self.move_file, source_path, self.get_path(key), content_hash
+        )
+
+    def hash_file(self, path: str) -> str:
+        content_hash = sha256()
+        with open(path, "rb") as file:
+            while block := file.read(HASH_BLOCK_SIZE):
+                content_hash.update(block)
+        return content_hash.hexdigest()
+
+    def stat_file(self, key: str) -> StoredFileModel:
+        path = self.get_path(key)
+        try:
+            stat_result = os.stat(path)
+            cache_key = (path, stat_result.st_size, stat_result.st_mtime_ns)
+            content_hash = self.content_hash_cache.get(cache_key)
+            if content_hash is None:
+                content_hash = self.hash_file(path)
+                self.content_hash_cache.set(cache_key, content_hash)
+        except FileNotFoundError:
+            raise FileNotFoundException
+        except IOError:
+            raise InvalidFileException
+        return StoredFileModel(
+            path=key,
+            size=stat_result.st_size,
+            modified_at=stat_result.st_mtime,
+            etag=f'"{content_hash}"',
+            media_type=get_media_type(key),
+        )
+
+    async def stat(self, key: str) -> StoredFileModel:
+        return await to_thread.run_sync(self.stat_file, key)
+
+    async def get_modified_at(self, key: str) -> float | None:
+        try:
+            return (await to_thread.run_sync(os.stat, self.get_path(key))).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def read_file(self, key: str) -> bytes:
+        try:
+            with open(self.get_path(key), "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            raise FileNotFoundException
+
+    async def read_bytes(self, key: str) -> bytes:
+        return await to_thread.run_sync(self.read_file, key)
+
+    async def iter_bytes(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        async with await open_file(self.get_path(key), "rb") as file:
+            await file.seek(start)
+            remaining = end - start + 1 if end is not None else None
+            while remaining is None or remaining > 0:
+                chunk = await file.read(
+                    CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+                )
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def delete_file(self, key: str) -> None:
+        try:
+            os.remove(self.get_path(key))
+        except FileNotFoundError:
+            pass
+
+    async def delete(self, key: str) -> None:
+        await to_thread.run_sync(self.delete_file, key)
+
+    def walk_files(self, prefix: str) -> list[tuple[str, float]]:
+        files = []
+        for directory, _, file_names in os.walk(self.get_path(prefix)):
+            for file_name in file_names:
+                path = os.path.join(directory, file_name)
+                key = os.path.relpath(path, self.root_directory).replace(os.sep, "/")
+                files.append((key, os.stat(path).st_mtime))
+        return files
+
+    async def list_files(self, prefix: str) -> AsyncIterator[tuple[str, float]]:
+        for file in await to_thread.run_sync(self.walk_files, prefix):
+            yield file
+
+    def remove_empty_subdirectories(self, prefix: str) -> None:
+        root_path = self.get_path(prefix)
+        for directory, _, _ in os.walk(root_path, topdown=False):
+            if directory == root_path:
+                continue
+            try:
+                os.rmdir(directory)
+            except OSError:
+                # Not empty, or an upload got there first
+                pass
+
+    async def remove_empty_directories(self, prefix: str) -> None:
+        await to_thread.run_sync(self.remove_empty_subdirectories, prefix)
@@ -0,0 +1,165 @@
+from functools import partial
+from typing import AsyncIterator
+import boto3
+from anyio import to_thread
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from app.domain.exceptions.file_not_found_exception import FileNotFoundException
+from app.domain.models.stored_file_model import StoredFileModel
+from app.infrastructure.storage.storage_backend import StorageBackend, get_media_type
+
+CHUNK_SIZE = 64 * 1024
+NOT_FOUND_ERROR_CODES = {"404", "NoSuchKey", "NoSuchBucket", "NotFound"}
+
+
+def is_not_found(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") in NOT_FOUND_ERROR_CODES
+
+
+class S3StorageBackend(StorageBackend):
+    """Stores files in an S3 compatible bucket (AWS S3, MinIO). The boto3 client is thread safe
+    and keeps a pool of up to `max_connections` connections that every call reuses; calls run on
+    the anyio worker threads. Files over `multipart_threshold` bytes are uploaded in parts."""
+
+    def __init__(
+        self,
+        bucket: str,
+        endpoint_url: str | None,
+        region: str,
+        access_key_id: str | None,
+        secret_access_key: str | None,
+        max_connections: int,
+        multipart_threshold: int,
+        multipart_chunk_size: int,
+    ) -> None:
+        self.bucket = bucket
+        self.region = region
+        self.client = boto3.session.Session().client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            config=Config(
+                max_pool_connections=max_connections,
+                retries={"mode": "standard"},
+            ),
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunk_size,
+            max_concurrency=max(max_connections // 2, 1),
+        )
+
+    def create_bucket_if_missing(self) -> None:
+        try:
+            self.client.head_bucket(Bucket=self.bucket)
+        except ClientError as error:
+            if not is_not_found(error):
+                raise
+            if self.region == "us-east-1":
+                self.client.create_bucket(Bucket=self.bucket)
+            else:
+                self.client.create_bucket(
+                    Bucket=self.bucket,
+                    CreateBucketConfiguration={"LocationConstraint": self.region},
+                )
+
+    async def initialize(self) -> None:
+        await to_thread.run_sync(self.create_bucket_if_missing)
+
+    def head_object(self, key: str) -> dict:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as error:
+            if is_not_found(error):
+                raise FileNotFoundException
+            raise
+
+    async def exists(self, key: str) -> bool:
+        return await self.get_modified_at(key) is not None
+
+    def upload_file(self, source_path: str, key: str, content_hash: str) -> None:
+        self.client.upload_file(
+            source_path,
+            self.bucket,
+            key,
+            ExtraArgs={
+                "ContentType": get_media_type(key),
+                "Metadata": {"sha256": content_hash},
+            },
+            Config=self.transfer_config,
+        )
+
+    async def save_file(self, source_path: str, key: str, content_hash: str) -> None:
+        await to_thread.run_sync(self.upload_file, source_path, key, content_hash)
+
+    async def stat(self, key: str) -> StoredFileModel:
+        object_head = await to_thread.run_sync(self.head_object, key)
+        content_hash = object_head.get("Metadata", {}).get("sha256")
+        return StoredFileModel(
+            path=key,
+            size=object_head["ContentLength"],
+            modified_at=object_head["LastModified"].timestamp(),
+            # Objects written by other tools have no sha256 metadata, their S3 ETag is used instead
+            etag=f'"{content_hash}"' if content_hash else object_head["ETag"],
+            media_type=get_media_type(key),
+        )
+
+    async def get_modified_at(self, key: str) -> float | None:
+        try:
+            object_head = await to_thread.run_sync(self.head_object, key)
+        except FileNotFoundException:
+            return None
+        return object_head["LastModified"].timestamp()
+
+    def get_object_body(self, key: str, byte_range: str | None = None):
+        arguments = {"Bucket": self.bucket, "Key": key}
+        if byte_range:
+            arguments["Range"] = byte_range
+        try:
+            return self.client.get_object(**arguments)["Body"]
+        except ClientError as error:
+            if is_not_found(error):
+                raise FileNotFoundException
+            raise
+
+    async def read_bytes(self, key: str) -> bytes:
+        body = await to_thread.run_sync(self.get_object_body, key)
+        try:
+            return await to_thread.run_sync(body.read)
+        finally:
+            body.close()
+
+    async def iter_bytes(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        byte_range = None
+        if start or end is not None:
+            byte_range = f"bytes={start}-{end if end is not None else ''}"
+        body = await to_thread.run_sync(self.get_object_body, key, byte_range)
+        try:
+            while chunk := await to_thread.run_sync(body.read, CHUNK_SIZE):
+                yield chunk
+        finally:
+            body.close()
+
+    async def delete(self, key: str) -> None:
+        await to_thread.run_sync(
+            partial(self.client.delete_object, Bucket=self.bucket, Key=key)
+        )
+
+    async def list_files(self, prefix: str) -> AsyncIterator[tuple[str, float]]:
+        pages = iter(
+            self.client.get_paginator("list_objects_v2").paginate(
+                Bucket=self.bucket, Prefix=f"{prefix}/"
+            )
+        )
+        while page := await to_thread.run_sync(next, pages, None):
+            for stored_object in page.get("Contents", []):
+                yield stored_object["Key"], stored_object["LastModified"].timestamp()
+
+    async def close(self) -> None:
+        self.client.close()
@@ -0,0 +1,50 @@
+import os
+from typing import AsyncIterator
+
+from app.domain.models.stored_file_model import StoredFileModel
+
+MEDIA_TYPES = {".jpg": "image/jpeg", ".png": "image/png", ".webp": "image/webp"}
+
+
+def get_media_type(key: str) -> str:
+    return MEDIA_TYPES.get(os.path.splitext(key)[1], "application/octet-stream")
+
+
+class StorageBackend:
+    async def initialize(self) -> None:
+        pass
+
+    async def exists(self, key: str) -> bool:
+        raise NotImplementedError("Method exists hasn't been implemented yet.")
+
+    async def save_file(self, source_path: str, key: str, content_hash: str) -> None:
+        raise NotImplementedError("Method save_file hasn't been implemented yet.")
+
+    async def stat(self, key: str) -> StoredFileModel:
+        raise NotImplementedError("Method stat hasn't been implemented yet.")
+
+    async def get_modified_at(self, key: str) -> float | None:
+        raise NotImplementedError("Method get_modified_at hasn't been implemented yet.")
+
+    async def read_bytes(self, key: str) -> bytes:
+        raise NotImplementedError("Method read_bytes hasn't been implemented yet.")
+
+    def iter_bytes(
+        self, key: str, start: int = 0, end: int | None = None
+    ) -> AsyncIterator[bytes]:
+        raise NotImplementedError("Method iter_bytes hasn't been implemented yet.")
+
+    def get_local_path(self, key: str) -> str | None:
+        return None
+
+    async def delete(self, key: str) -> None:
+        raise NotImplementedError("Method delete hasn't been implemented yet.")
+
+    def list_files(self, prefix: str) -> AsyncIterator[tuple[str, float]]:
+        raise NotImplementedError("Method list_files hasn't been implemented yet.")
+
+    async def remove_empty_directories(self, prefix: str) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
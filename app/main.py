@@ -1,14 +1,33 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from loguru import logger
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.infrastructure.configs.assignment_templates import (
+    TEMPLATE_MATERIALIZATION_INTERVAL,
+)
+from app.infrastructure.configs.caches import authenticated_user_cache
 from app.infrastructure.configs.initial_data import add_default_user
-from app.infrastructure.configs.sql_database import create_db_and_tables
+from app.infrastructure.configs.logging import configure_logging
+from app.infrastructure.configs.password_hashing import password_hashing_pool
+from app.infrastructure.configs.pagination import NEXT_CURSOR_HEADER
+from app.infrastructure.configs.sql_database import async_db_engine, create_db_and_tables
+from app.infrastructure.configs.storage import picture_storage_backend
+from app.infrastructure.middlewares.request_metrics_middleware import (
+    RequestMetricsMiddleware,
+)
 from app.infrastructure.middlewares.server_error_middleware import ServerErrorMiddleware
+from app.infrastructure.services.assignment_template_materializer import (
+    materialize_assignment_templates_periodically,
+)
 
 from .infrastructure.docs.openapi_tags import openapi_tags
+from .infrastructure.routers.analytics_router import analytics_router
+from .infrastructure.routers.assignment_template_router import (
+    assignment_template_router,
+)
 from .infrastructure.routers.auth_router import auth_router
 from .infrastructure.routers.driver_router import driver_router
 from .infrastructure.routers.driver_assignment_router import driver_assignment_router
@@ -24,8 +43,26 @@ async def lifespan(app: FastAPI):
     print("Application startup")
     create_db_and_tables()
     add_default_user()
+    await picture_storage_backend.initialize()
+    materialization_task = None
+    if TEMPLATE_MATERIALIZATION_INTERVAL > 0:
+        materialization_task = asyncio.create_task(
+            materialize_assignment_templates_periodically(
+                TEMPLATE_MATERIALIZATION_INTERVAL
+            )
+        )
     yield
+    if materialization_task:
+        materialization_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await materialization_task
+    password_hashing_pool.shutdown()
+    await picture_storage_backend.close()
+    await authenticated_user_cache.close()
+    if async_db_engine:
+        await async_db_engine.dispose()
     print("Application shutdown")
+    await logger.complete()
 
 app = FastAPI(
     title="Vehicle Management API",
@@ -39,6 +76,12 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+app.include_router(analytics_router, prefix="/analytics", tags=["Analytics"])
+app.include_router(
+    assignment_template_router,
+    prefix="/assignment-template",
+    tags=["Assignment template"],
+)
 app.include_router(auth_router, prefix="/auth", tags=["Authorization"])
 app.include_router(driver_router, prefix="/driver", tags=["Driver"])
 app.include_router(
@@ -56,13 +99,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
     allow_credentials=True,
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.add_middleware(ServerErrorMiddleware)
+app.add_middleware(RequestMetricsMiddleware)
 
-logger.remove(0)
-logger.add(
-    "logs/app.log",
-    format="{time} | {level} | {message}",
-    level="DEBUG",
-)
+configure_logging()
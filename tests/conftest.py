@@ -0,0 +1,15 @@
+import os
+from tempfile import mkdtemp
+
+
+def pytest_configure(config):
+    # The configs are read when the app is imported, so they're set before collection
+    test_directory = mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{test_directory}/fleet.sqlite"
+    os.environ["DATABASE_MODE"] = "sync"
+    os.environ["LOCAL_STORAGE_ROOT"] = test_directory
+    os.environ["TEMPLATE_MATERIALIZATION_INTERVAL"] = "0"
+    os.environ["AUTH_CACHE_BACKEND"] = "memory"
+    os.environ["AUTH_CACHE_TTL"] = "60"
+    os.environ.setdefault("JWT_SECRET_KEY", "secret")
+    os.environ.setdefault("JWT_ALGORITHM", "HS256")
@@ -0,0 +1,101 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.infrastructure.configs.sql_database import db_engine
+from app.infrastructure.security.json_web_token_tools import JsonWebTokenTools
+from app.main import app
+
+DRIVERS = 3
+VEHICLES = 3
+TRAVEL_DATES = ("2030-01-01", "2030-01-02")
+
+
+class StatementCounter:
+    def __init__(self) -> None:
+        self.statements = 0
+
+    def count(self, connection, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as client:
+        client.headers["Authorization"] = (
+            "Bearer " + JsonWebTokenTools.create_access_token("root@mail.com")
+        )
+        for number in range(1, VEHICLES + 1):
+            client.post(
+                "/vehicles",
+                json={
+                    "brand": "Brand",
+                    "model": "Model",
+                    "vin": f"VIN{number}",
+                    "plate": f"PLATE{number}",
+                    "purchase_date": "2024-01-01T00:00:00",
+                    "cost": 1000,
+                },
+            ).raise_for_status()
+        for number in range(1, DRIVERS + 1):
+            client.post(
+                "/driver",
+                json={
+                    "name": "Name",
+                    "last_name": "Last name",
+                    "birth_date": "1990-01-01",
+                    "curp": f"CURP{number}",
+                    "address": "Address",
+                    "monthly_salary": 1000,
+                    "driving_license": f"LICENSE{number}",
+                    "registration_date": "2024-01-01",
+                },
+            ).raise_for_status()
+        for day, travel_date in enumerate(TRAVEL_DATES):
+            for number in range(1, DRIVERS + 1):
+                client.post(
+                    "/driver-assignment",
+                    json={
+                        "driver_id": number,
+                        "vehicle_id": (number + day - 1) % VEHICLES + 1,
+                        "travel_date": travel_date,
+                        "route_name": "Route",
+                        "origin_location": {"latitude": "19.1", "longitude": "-99.1"},
+                        "destination_location": {
+                            "latitude": f"19.{day}{number}",
+                            "longitude": "-99.2",
+                        },
+                    },
+                ).raise_for_status()
+        yield client
+
+
+@pytest.fixture
+def statement_counter(client):
+    # Caches the authenticated user, so only the reads of the endpoint are counted
+    client.get("/vehicles", params={"limit": 1}).raise_for_status()
+    statement_counter = StatementCounter()
+    event.listen(db_engine, "before_cursor_execute", statement_counter.count)
+    yield statement_counter
+    event.remove(db_engine, "before_cursor_execute", statement_counter.count)
+
+
+# Each endpoint is expected to read its page, drivers and vehicles included, with a single
+# statement
+@pytest.mark.parametrize(
+    "url, expected_assignments",
+    [
+        ("/driver-assignment", DRIVERS * len(TRAVEL_DATES)),
+        ("/driver-assignment/active", DRIVERS * len(TRAVEL_DATES)),
+        ("/driver-assignment/driver_history/1", len(TRAVEL_DATES)),
+        ("/driver-assignment/vehicle_history/1", len(TRAVEL_DATES)),
+    ],
+)
+def test_driver_assignment_reads_use_a_fixed_number_of_statements(
+    client, statement_counter, url, expected_assignments
+):
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert len(response.json()) == expected_assignments
+    assert statement_counter.statements == 1